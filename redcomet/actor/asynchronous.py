@@ -0,0 +1,88 @@
+import asyncio
+from typing import Callable, Coroutine, Dict, List, Optional, Set, Tuple
+
+from redcomet.actor.executor import ActorExecutor
+from redcomet.actor.passivation import PassivationPolicy
+from redcomet.base.actor import ActorRefAbstract
+from redcomet.base.actor.abstract import ActorAbstract
+from redcomet.base.actor.message import MessageAbstract
+from redcomet.base.cluster.ref import ClusterRefAbstract
+from redcomet.base.messaging.address import Address
+from redcomet.base.node.abstract import NodeAbstract
+from redcomet.tracing import get_tracer
+
+_trace = get_tracer("actor")
+
+
+class AsyncioActorExecutor(ActorExecutor):
+    def __init__(self, node: NodeAbstract = None, passivation: PassivationPolicy = None):
+        super().__init__(node, passivation=passivation)
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._tasks: Set[asyncio.Task] = set()
+        self._actor_tasks: Dict[str, Set[asyncio.Task]] = {}
+        self._held: Dict[str, List[Tuple[MessageAbstract, Address]]] = {}
+
+    def execute(self, message: MessageAbstract, sender: Address, local_actor_id: str):
+        held = self._held.get(local_actor_id)
+        if held is not None:
+            held.append((message, sender))
+            return
+        super().execute(message, sender, local_actor_id)
+
+    def migrate(self, local_id: str, node_id: str, hand_off: Callable[[ActorAbstract], None]):
+        if local_id in self._held:
+            _trace.warning("actor %r is already migrating, ignoring migration to %r", local_id, node_id)
+            return
+        tasks = self._actor_tasks.get(local_id)
+        if not tasks:
+            super().migrate(local_id, node_id, hand_off)
+            return
+        self._held[local_id] = []
+        self._track(asyncio.get_running_loop().create_task(self._migrate_when_idle(local_id, node_id, hand_off,
+                                                                                   list(tasks))))
+
+    async def _migrate_when_idle(self, local_id: str, node_id: str, hand_off: Callable[[ActorAbstract], None],
+                                 tasks: List[asyncio.Task]):
+        await asyncio.wait(tasks)
+        super().migrate(local_id, node_id, hand_off)
+        for message, sender in self._held.pop(local_id):
+            self.execute(message, sender, local_id)
+
+    def unregister(self, local_id: str, forward_to: str = None) -> Optional[ActorAbstract]:
+        self._locks.pop(local_id, None)
+        return super().unregister(local_id, forward_to)
+
+    def _is_busy(self, local_id: str) -> bool:
+        return local_id in self._actor_tasks or local_id in self._held
+
+    def _receive(self, actor: ActorAbstract, message: MessageAbstract, sender: ActorRefAbstract,
+                 me: ActorRefAbstract, cluster: ClusterRefAbstract, local_actor_id: str):
+        result = actor.receive(message, sender, me, cluster)
+        if result is None or not asyncio.iscoroutine(result):
+            return
+
+        lock = self._locks.get(local_actor_id)
+        if lock is None:
+            lock = self._locks[local_actor_id] = asyncio.Lock()
+        task = asyncio.get_running_loop().create_task(self._run_exclusively(lock, local_actor_id, result))
+        self._track(task)
+        self._actor_tasks.setdefault(local_actor_id, set()).add(task)
+        task.add_done_callback(lambda done: self._on_actor_task_done(local_actor_id, done))
+
+    def _track(self, task: asyncio.Task):
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _on_actor_task_done(self, local_actor_id: str, task: asyncio.Task):
+        tasks = self._actor_tasks[local_actor_id]
+        tasks.discard(task)
+        if not tasks:
+            del self._actor_tasks[local_actor_id]
+
+    async def _run_exclusively(self, lock: asyncio.Lock, local_actor_id: str, coroutine: Coroutine):
+        async with lock:
+            try:
+                await coroutine
+            except Exception as e:
+                self._fail(local_actor_id, e)
+
@@ -0,0 +1,12 @@
+from redcomet.base.actor import ActorRefAbstract
+from redcomet.base.actor.abstract import ActorAbstract
+from redcomet.base.cluster.ref import ClusterRefAbstract
+
+
+class ActorContext:
+    __slots__ = ("actor", "me", "cluster")
+
+    def __init__(self, actor: ActorAbstract, me: ActorRefAbstract, cluster: ClusterRefAbstract):
+        self.actor = actor
+        self.me = me
+        self.cluster = cluster
@@ -1,42 +1,236 @@
-import multiprocessing
-from typing import Dict
+import asyncio
+import itertools
+import pickle
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
 
+from redcomet.actor.context import ActorContext
+from redcomet.actor.passivation import PassivationPolicy, PassivationStatistics
+from redcomet.base.actor import ActorRefAbstract
 from redcomet.base.actor.abstract import ActorAbstract
 from redcomet.base.actor.message import MessageAbstract
+from redcomet.base.actor.store import ActorStoreAbstract
+from redcomet.base.cluster.ref import ClusterRefAbstract
 from redcomet.base.messaging.address import Address
+from redcomet.base.messaging.packet import Packet
 from redcomet.base.node.abstract import NodeAbstract
 from redcomet.messenger.handler.executor.actor import ActorExecutorAbstract
+from redcomet.tracing import get_tracer
+
+_trace = get_tracer("actor")
 
 
 class ActorExecutor(ActorExecutorAbstract):
-    def __init__(self, node: NodeAbstract = None):
+    def __init__(self, node: NodeAbstract = None, sender_ref_cache_size: int = 4096,
+                 passivation: PassivationPolicy = None):
         self._node = node
         self._actor_map: Dict[str, ActorAbstract] = {}
+        self._contexts: Dict[str, ActorContext] = {}
+        self._sender_refs: Dict[Tuple[str, Address], ActorRefAbstract] = {}
+        self._sender_ref_cache_size = sender_ref_cache_size
+        self._forwards: Dict[str, str] = {}
+        self._failure: Optional[Tuple[str, Exception]] = None
+
+        self._passivation = passivation
+        self._passivation_statistics = PassivationStatistics()
+        self._store: Optional[ActorStoreAbstract] = None
+        self._last_used: OrderedDict[str, float] = OrderedDict()
+        self._next_sweep = 0.0
 
     def set_node(self, node: NodeAbstract):
         self._node = node
+        self._sender_refs.clear()
+        self._contexts = {local_id: self._create_context(local_id, actor)
+                          for local_id, actor in self._actor_map.items()}
 
     def register(self, local_id: str, actor: ActorAbstract):
         if local_id in self._actor_map:
             raise NotImplementedError()
 
         self._actor_map[local_id] = actor
-        print(multiprocessing.current_process().name, "REAC", self._actor_map)
+        self._forwards.pop(local_id, None)
+        if self._node is not None:
+            self._contexts[local_id] = self._create_context(local_id, actor)
+        if _trace.debug_enabled:
+            _trace.debug("REGISTER %r as %r", actor, local_id)
+        if self._passivation is not None and not self._passivation.is_exempt(local_id):
+            self._last_used[local_id] = time.monotonic()
+            self._passivate_over_limit()
 
-    def execute(self, message: MessageAbstract, sender: Address, local_actor_id: str):
-        sender = self._node.issue_actor_ref(local_actor_id, sender)
-        actor = self._actor_map.get(local_actor_id)
+    def unregister(self, local_id: str, forward_to: str = None) -> Optional[ActorAbstract]:
+        actor = self._actor_map.pop(local_id, None)
+        self._contexts.pop(local_id, None)
+        self._last_used.pop(local_id, None)
+        if actor is None:
+            actor = self._load(local_id)
+        if actor is not None and forward_to is not None:
+            self._forwards[local_id] = forward_to
+        if _trace.debug_enabled:
+            _trace.debug("UNREGISTER %r as %r, forwarding to %r", actor, local_id, forward_to)
+        return actor
+
+    def migrate(self, local_id: str, node_id: str, hand_off: Callable[[ActorAbstract], None]):
+        actor = self._actor_map.get(local_id)
+        if actor is None and self._store is not None and local_id in self._store:
+            actor = self._reactivate(local_id)
         if actor is None:
-            actor = self._on_no_actor(message, sender.address, local_actor_id)
+            return
+        try:
+            hand_off(actor)
+        except Exception as e:
+            _trace.warning("failed to migrate %r to %r, keeping it: %r", local_id, node_id, e)
+            return
+        self.unregister(local_id, forward_to=node_id)
+
+    def execute(self, message: MessageAbstract, sender: Address, local_actor_id: str):
+        if self._failure is not None:
+            self._raise_failure()
+        sender_ref = self._issue_sender_ref(local_actor_id, sender)
+        context = self._contexts.get(local_actor_id)
+        if context is None:
+            actor = self._actor_map.get(local_actor_id)
             if actor is None:
-                return
+                node_id = self._forwards.get(local_actor_id)
+                if node_id is not None:
+                    self._forward(message, sender, Address(node_id, local_actor_id))
+                    return
+                actor = self._on_no_actor(message, sender, local_actor_id)
+                if actor is None:
+                    return
+            context = self._contexts.get(local_actor_id) or self._create_context(local_actor_id, actor)
+        if self._passivation is not None:
+            self._touch(local_actor_id)
 
-        me = self._node.issue_actor_ref(local_actor_id, Address.on_local(local_actor_id))
-        cluster = self._node.issue_cluster_ref(local_actor_id)
         try:
-            actor.receive(message, sender, me, cluster)
-        except Exception:
-            raise NotImplementedError()
+            self._receive(context.actor, message, sender_ref, context.me, context.cluster, local_actor_id)
+        except Exception as e:
+            self._fail(local_actor_id, e)
+            self._raise_failure()
+
+    def _fail(self, local_actor_id: str, error: Exception):
+        if self._failure is None:
+            self._failure = (local_actor_id, error)
+
+    def _raise_failure(self):
+        local_actor_id, error = self._failure
+        self._failure = None
+        raise NotImplementedError(f"actor {local_actor_id!r} failed") from error
+
+    def _forward(self, message: MessageAbstract, sender: Address, receiver: Address):
+        self._node.messenger.forward_packet(Packet(message, sender=sender, receiver=receiver))
+
+    def _create_context(self, local_id: str, actor: ActorAbstract) -> ActorContext:
+        return ActorContext(actor, self._node.issue_actor_ref(local_id, Address.on_local(local_id)),
+                            self._node.issue_cluster_ref(local_id))
+
+    def _issue_sender_ref(self, local_actor_id: str, sender: Address) -> ActorRefAbstract:
+        key = (local_actor_id, sender)
+        ref = self._sender_refs.get(key)
+        if ref is None:
+            if len(self._sender_refs) >= self._sender_ref_cache_size:
+                del self._sender_refs[next(iter(self._sender_refs))]
+            ref = self._sender_refs[key] = self._node.issue_actor_ref(local_actor_id, sender)
+        return ref
+
+    def _receive(self, actor: ActorAbstract, message: MessageAbstract, sender: ActorRefAbstract,
+                 me: ActorRefAbstract, cluster: ClusterRefAbstract, local_actor_id: str):
+        result = actor.receive(message, sender, me, cluster)
+        if result is not None and asyncio.iscoroutine(result):
+            asyncio.run(result)
 
     def _on_no_actor(self, message: MessageAbstract, sender_id: Address, local_actor_id: str) -> ActorAbstract:
-        raise NotImplementedError()
+        if self._store is None:
+            raise NotImplementedError()
+        actor = self._reactivate(local_actor_id)
+        if actor is None:
+            raise NotImplementedError()
+        return actor
+
+    def _reactivate(self, local_id: str) -> Optional[ActorAbstract]:
+        started = time.perf_counter()
+        actor = self._load(local_id)
+        if actor is None:
+            return None
+        self._passivation_statistics.record_reactivation(time.perf_counter() - started)
+        self.register(local_id, actor)
+        if _trace.debug_enabled:
+            _trace.debug("REACTIVATE %r as %r", actor, local_id)
+        return actor
+
+    def _load(self, local_id: str) -> Optional[ActorAbstract]:
+        if self._store is None:
+            return None
+        state = self._store.load(local_id)
+        if state is None:
+            return None
+        return pickle.loads(state)
+
+    def _touch(self, local_id: str):
+        now = time.monotonic()
+        if local_id in self._last_used:
+            self._last_used[local_id] = now
+            self._last_used.move_to_end(local_id)
+        if now >= self._next_sweep:
+            self._next_sweep = now + self._passivation.sweep_interval
+            self.passivate_idle_actors(now)
+
+    def passivate_idle_actors(self, now: float = None):
+        if self._passivation is None or self._passivation.idle_timeout is None:
+            return
+        deadline = (now if now is not None else time.monotonic()) - self._passivation.idle_timeout
+        idle = []
+        for local_id, last_used in self._last_used.items():
+            if last_used > deadline:
+                break
+            idle.append(local_id)
+        for local_id in idle:
+            self._passivate(local_id)
+
+    def _passivate_over_limit(self):
+        limit = self._passivation.max_resident_actors
+        if limit is None or len(self._last_used) <= limit:
+            return
+        for local_id in list(itertools.islice(self._last_used, len(self._last_used) - limit)):
+            self._passivate(local_id)
+
+    def _passivate(self, local_id: str):
+        if self._is_busy(local_id):
+            self._last_used.move_to_end(local_id)
+            return
+        started = time.perf_counter()
+        actor = self._actor_map[local_id]
+        try:
+            state = pickle.dumps(actor, protocol=pickle.HIGHEST_PROTOCOL)
+            if self._store is None:
+                self._store = self._passivation.create_store()
+            self._store.save(local_id, state)
+        except Exception as e:
+            self._last_used.pop(local_id, None)
+            _trace.warning("failed to passivate %r, keeping it resident: %r", local_id, e)
+            return
+        self.unregister(local_id)
+        self._passivation_statistics.record_passivation(time.perf_counter() - started)
+        if _trace.debug_enabled:
+            _trace.debug("PASSIVATE %r as %r", actor, local_id)
+
+    def _is_busy(self, local_id: str) -> bool:
+        return False
+
+    @property
+    def n_resident_actors(self) -> int:
+        return len(self._actor_map)
+
+    @property
+    def n_passivated_actors(self) -> int:
+        return len(self._store) if self._store is not None else 0
+
+    @property
+    def passivation_statistics(self) -> PassivationStatistics:
+        return self._passivation_statistics
+
+    def shutdown(self):
+        if self._store is not None:
+            _trace.info("passivation %r", self._passivation_statistics)
+            self._store.close()
+            self._store = None
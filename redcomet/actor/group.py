@@ -0,0 +1,42 @@
+from typing import Iterable, List
+
+from redcomet.base.actor import ActorRefAbstract
+from redcomet.base.actor.group import ActorGroupAbstract
+from redcomet.base.actor.message import MessageAbstract
+from redcomet.base.messenger.abstract import MessengerAbstract
+from redcomet.base.messenger.backpressure import Backpressure
+
+
+class ActorGroup(ActorGroupAbstract):
+    __slots__ = ("_messenger", "_local_issuer_id", "_refs", "_receiver_ids", "_other_refs", "_backpressure")
+
+    def __init__(self, messenger: MessengerAbstract, local_issuer_id: str, refs: Iterable[ActorRefAbstract],
+                 backpressure: Backpressure = Backpressure.BLOCK):
+        self._messenger = messenger
+        self._local_issuer_id = local_issuer_id
+        self._refs = list(refs)
+        self._receiver_ids = [ref.address.target for ref in self._refs if _is_global(ref)]
+        self._other_refs = [ref for ref in self._refs if not _is_global(ref)]
+        self._backpressure = backpressure
+
+    def tell(self, message: MessageAbstract):
+        if self._receiver_ids:
+            self._messenger.multicast(message, self._local_issuer_id, self._receiver_ids, self._backpressure)
+        for ref in self._other_refs:
+            ref.tell(message)
+
+    @property
+    def refs(self) -> List[ActorRefAbstract]:
+        return self._refs
+
+    @property
+    def backpressure(self) -> Backpressure:
+        return self._backpressure
+
+    def __repr__(self) -> str:
+        return f"ActorGroup(..., local_issuer_id={self._local_issuer_id!r}, refs={self._refs!r}, " \
+               f"backpressure={self._backpressure!r})"
+
+
+def _is_global(ref: ActorRefAbstract) -> bool:
+    return ref.is_addressable() and ref.address.is_global()
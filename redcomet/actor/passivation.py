@@ -0,0 +1,83 @@
+from typing import Callable, Collection
+
+from redcomet.base.actor.store import ActorStoreAbstract
+from redcomet.implementation.actor.store.sqlite import SqliteActorStore
+
+SYSTEM_ACTOR_IDS = ("messenger", "manager", "discovery", "cluster", "main")
+
+
+class PassivationPolicy:
+    def __init__(self, idle_timeout: float = None, max_resident_actors: int = None, sweep_interval: float = 1.0,
+                 store_factory: Callable[[], ActorStoreAbstract] = None,
+                 exempt_actor_ids: Collection[str] = SYSTEM_ACTOR_IDS):
+        if idle_timeout is None and max_resident_actors is None:
+            raise ValueError("passivation needs an idle timeout or a resident actor limit")
+        if max_resident_actors is not None and max_resident_actors < 1:
+            raise ValueError("max_resident_actors must be at least 1")
+
+        self._idle_timeout = idle_timeout
+        self._max_resident_actors = max_resident_actors
+        self._sweep_interval = sweep_interval
+        self._store_factory = store_factory
+        self._exempt_actor_ids = frozenset(exempt_actor_ids)
+
+    @property
+    def idle_timeout(self) -> float:
+        return self._idle_timeout
+
+    @property
+    def max_resident_actors(self) -> int:
+        return self._max_resident_actors
+
+    @property
+    def sweep_interval(self) -> float:
+        return self._sweep_interval
+
+    def create_store(self) -> ActorStoreAbstract:
+        if self._store_factory is not None:
+            return self._store_factory()
+        return SqliteActorStore()
+
+    def is_exempt(self, actor_id: str) -> bool:
+        return actor_id in self._exempt_actor_ids
+
+    def __repr__(self) -> str:
+        return f"PassivationPolicy(idle_timeout={self._idle_timeout!r}, " \
+               f"max_resident_actors={self._max_resident_actors!r}, sweep_interval={self._sweep_interval!r})"
+
+
+class PassivationStatistics:
+    def __init__(self):
+        self._passivations = 0
+        self._reactivations = 0
+        self._passivation_time = 0.0
+        self._reactivation_time = 0.0
+
+    def record_passivation(self, elapsed: float):
+        self._passivations += 1
+        self._passivation_time += elapsed
+
+    def record_reactivation(self, elapsed: float):
+        self._reactivations += 1
+        self._reactivation_time += elapsed
+
+    @property
+    def passivations(self) -> int:
+        return self._passivations
+
+    @property
+    def reactivations(self) -> int:
+        return self._reactivations
+
+    @property
+    def mean_passivation_time(self) -> float:
+        return self._passivation_time / self._passivations if self._passivations else 0.0
+
+    @property
+    def mean_reactivation_time(self) -> float:
+        return self._reactivation_time / self._reactivations if self._reactivations else 0.0
+
+    def __repr__(self) -> str:
+        return f"PassivationStatistics(passivations={self._passivations}, reactivations={self._reactivations}, " \
+               f"mean_passivation_time={self.mean_passivation_time * 1e6:.1f}us, " \
+               f"mean_reactivation_time={self.mean_reactivation_time * 1e6:.1f}us)"
@@ -1,29 +1,57 @@
+import asyncio
+from concurrent.futures import Future
+from typing import Optional
+
 from redcomet.base.actor import ActorRefAbstract
 from redcomet.base.actor.message import MessageAbstract
 from redcomet.base.messaging.address import Address
 from redcomet.base.messaging.packet import Packet
 from redcomet.base.messenger.abstract import MessengerAbstract
+from redcomet.base.messenger.backpressure import Backpressure
 
 
 class ActorRef(ActorRefAbstract):
-    def __init__(self, messenger: MessengerAbstract, local_issuer_id: str, address: Address):
+    __slots__ = ("_messenger", "_local_issuer_id", "_address", "_backpressure")
+
+    def __init__(self, messenger: MessengerAbstract, local_issuer_id: str, address: Address,
+                 backpressure: Backpressure = Backpressure.BLOCK):
         self._messenger = messenger
         self._local_issuer_id = local_issuer_id
         self._address = address
+        self._backpressure = backpressure
 
     def bind(self, ref: 'ActorRef') -> 'ActorRef':
-        return ActorRef(ref._messenger, ref._local_issuer_id, self._address)
+        return ActorRef(ref._messenger, ref._local_issuer_id, self._address, self._backpressure)
+
+    def with_backpressure(self, backpressure: Backpressure) -> 'ActorRef':
+        return ActorRef(self._messenger, self._local_issuer_id, self._address, backpressure)
 
     def tell(self, message: MessageAbstract):
         if self._address.is_global():
-            self._messenger.send(message, self._local_issuer_id, self._address.target)
+            self._messenger.send(message, self._local_issuer_id, self._address.target, self._backpressure)
         else:
             packet = Packet(message, sender=Address.on_local(self._local_issuer_id), receiver=self._address)
             self._messenger.send_packet(packet)
 
+    def ask(self, message: MessageAbstract, timeout: float = None) -> Future:
+        return self._messenger.ask(message, self._address, timeout, self._backpressure)
+
+    def ask_async(self, message: MessageAbstract, timeout: float = None) -> asyncio.Future:
+        return asyncio.wrap_future(self.ask(message, timeout))
+
+    def node_queue_depth(self) -> Optional[int]:
+        if self._address.is_global():
+            return self._messenger.node_queue_depth(self._address.target)
+        return 0
+
     @property
     def address(self) -> Address:
         return self._address
 
+    @property
+    def backpressure(self) -> Backpressure:
+        return self._backpressure
+
     def __repr__(self) -> str:
-        return f"ActorRef(..., local_issuer_id={self._local_issuer_id!r}, address={self._address!r})"
+        return f"ActorRef(..., local_issuer_id={self._local_issuer_id!r}, address={self._address!r}, " \
+               f"backpressure={self._backpressure!r})"
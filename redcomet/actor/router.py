@@ -0,0 +1,62 @@
+import asyncio
+from concurrent.futures import Future
+from typing import Iterable, List
+
+from redcomet.base.actor import ActorRefAbstract
+from redcomet.base.actor.message import MessageAbstract
+from redcomet.base.actor.routing import RoutingStrategyAbstract
+from redcomet.base.messaging.address import Address
+from redcomet.base.messenger.backpressure import Backpressure
+
+
+class RouterRef(ActorRefAbstract):
+    __slots__ = ("_routees", "_strategy")
+
+    def __init__(self, routees: Iterable[ActorRefAbstract], strategy: RoutingStrategyAbstract):
+        self._routees = list(routees)
+        self._strategy = strategy
+        if not self._routees:
+            raise ValueError("router needs at least one routee")
+
+    def tell(self, message: MessageAbstract):
+        self._strategy.select(self._routees, message).tell(message)
+
+    def ask(self, message: MessageAbstract, timeout: float = None) -> Future:
+        return self._strategy.select(self._routees, message).ask(message, timeout)
+
+    def ask_async(self, message: MessageAbstract, timeout: float = None) -> asyncio.Future:
+        return asyncio.wrap_future(self.ask(message, timeout))
+
+    def bind(self, ref: ActorRefAbstract) -> 'RouterRef':
+        return RouterRef([routee.bind(ref) for routee in self._routees], self._strategy)
+
+    def with_backpressure(self, backpressure: Backpressure) -> 'RouterRef':
+        return RouterRef([routee.with_backpressure(backpressure) for routee in self._routees], self._strategy)
+
+    @property
+    def routees(self) -> List[ActorRefAbstract]:
+        return self._routees
+
+    @property
+    def strategy(self) -> RoutingStrategyAbstract:
+        return self._strategy
+
+    @property
+    def backpressure(self) -> Backpressure:
+        return self._routees[0].backpressure
+
+    @property
+    def address(self) -> Address:
+        raise NotImplementedError()
+
+    def is_addressable(self) -> bool:
+        return False
+
+    def expand(self) -> List[ActorRefAbstract]:
+        return [ref for routee in self._routees for ref in routee.expand()]
+
+    def __len__(self) -> int:
+        return len(self._routees)
+
+    def __repr__(self) -> str:
+        return f"RouterRef({self._routees!r}, strategy={self._strategy!r})"
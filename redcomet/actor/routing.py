@@ -0,0 +1,76 @@
+import itertools
+import math
+import random
+import time
+from typing import Callable, Dict, List, Tuple
+
+from redcomet.base.actor import ActorRefAbstract
+from redcomet.base.actor.message import MessageAbstract
+from redcomet.base.actor.routing import RoutingStrategyAbstract
+from redcomet.discovery.ring import ConsistentHashRing
+
+
+class RoundRobinRouting(RoutingStrategyAbstract):
+    def __init__(self):
+        self._counter = itertools.count()
+
+    def select(self, routees: List[ActorRefAbstract], message: MessageAbstract) -> ActorRefAbstract:
+        return routees[next(self._counter) % len(routees)]
+
+
+class RandomRouting(RoutingStrategyAbstract):
+    def __init__(self, seed: int = None):
+        self._random = random.Random(seed)
+
+    def select(self, routees: List[ActorRefAbstract], message: MessageAbstract) -> ActorRefAbstract:
+        return routees[self._random.randrange(len(routees))]
+
+
+class SmallestNodeQueueRouting(RoutingStrategyAbstract):
+    def __init__(self, refresh_interval: float = 0.1):
+        self._refresh_interval = refresh_interval
+        self._refreshed_at = -math.inf
+        self._depths: Dict[str, int] = {}
+        self._routed: Dict[str, int] = {}
+
+    def select(self, routees: List[ActorRefAbstract], message: MessageAbstract) -> ActorRefAbstract:
+        now = time.monotonic()
+        if now - self._refreshed_at >= self._refresh_interval:
+            self._refresh(routees)
+            self._refreshed_at = now
+        routee = min(routees, key=lambda ref: self._depths.get(ref.address.target, 0) +
+                     self._routed.get(ref.address.target, 0))
+        self._routed[routee.address.target] = self._routed.get(routee.address.target, 0) + 1
+        return routee
+
+    def _refresh(self, routees: List[ActorRefAbstract]):
+        depths = {ref.address.target: ref.node_queue_depth() for ref in routees}
+        if None in depths.values():
+            return
+        self._depths = depths
+        self._routed.clear()
+
+
+class ConsistentHashRouting(RoutingStrategyAbstract):
+    def __init__(self, key: Callable[[MessageAbstract], str] = None, replicas: int = 64):
+        self._key = key
+        self._replicas = replicas
+        self._ring = ConsistentHashRing(replicas)
+        self._routees: Dict[str, ActorRefAbstract] = {}
+        self._members: Tuple[str, ...] = ()
+
+    def select(self, routees: List[ActorRefAbstract], message: MessageAbstract) -> ActorRefAbstract:
+        members = tuple(ref.address.target for ref in routees)
+        if members != self._members:
+            self._rebuild(routees, members)
+        key = self._key(message) if self._key is not None else message.routing_key
+        if key is None:
+            raise ValueError(f"{message!r} has no routing key")
+        return self._routees[self._ring.get(str(key))]
+
+    def _rebuild(self, routees: List[ActorRefAbstract], members: Tuple[str, ...]):
+        self._ring = ConsistentHashRing(self._replicas)
+        for member in members:
+            self._ring.add(member)
+        self._routees = dict(zip(members, routees))
+        self._members = members
@@ -0,0 +1,126 @@
+import os
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Collection, Dict, List, Optional
+
+from redcomet.actor.executor import ActorExecutor
+from redcomet.actor.passivation import PassivationPolicy
+from redcomet.base.actor import ActorRefAbstract
+from redcomet.base.actor.abstract import ActorAbstract
+from redcomet.base.actor.message import MessageAbstract
+from redcomet.base.cluster.ref import ClusterRefAbstract
+from redcomet.base.node.abstract import NodeAbstract
+from redcomet.messenger.buffer import BufferPin, pin_buffer
+
+
+class Mailbox:
+    __slots__ = ("actor", "messages", "lock", "idle", "scheduled")
+
+    def __init__(self, actor: ActorAbstract):
+        self.actor = actor
+        self.messages = deque()
+        self.lock = threading.Lock()
+        self.idle = threading.Condition(self.lock)
+        self.scheduled = False
+
+    def wait_idle(self):
+        with self.lock:
+            self.idle.wait_for(lambda: not self.scheduled)
+
+
+class ThreadPoolActorExecutor(ActorExecutor):
+    def __init__(self, node: NodeAbstract = None, max_workers: int = None, throughput: int = 16,
+                 inline_actor_ids: Collection[str] = ("messenger", "manager"), passivation: PassivationPolicy = None):
+        if throughput < 1:
+            raise ValueError("throughput must be at least 1")
+
+        super().__init__(node, passivation=passivation)
+        self._max_workers = max_workers
+        self._throughput = throughput
+        self._inline_actor_ids = frozenset(inline_actor_ids)
+        self._mailboxes: Dict[str, Mailbox] = {}
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._pool_pid: Optional[int] = None
+
+    def register(self, local_id: str, actor: ActorAbstract):
+        super().register(local_id, actor)
+        if local_id not in self._inline_actor_ids:
+            self._mailboxes[local_id] = Mailbox(actor)
+
+    def unregister(self, local_id: str, forward_to: str = None) -> Optional[ActorAbstract]:
+        mailbox = self._mailboxes.pop(local_id, None)
+        if mailbox is not None:
+            mailbox.wait_idle()
+        return super().unregister(local_id, forward_to)
+
+    def migrate(self, local_id: str, node_id: str, hand_off: Callable[[ActorAbstract], None]):
+        mailbox = self._mailboxes.get(local_id)
+        if mailbox is not None:
+            mailbox.wait_idle()
+        super().migrate(local_id, node_id, hand_off)
+
+    def _is_busy(self, local_id: str) -> bool:
+        mailbox = self._mailboxes.get(local_id)
+        return mailbox is not None and mailbox.scheduled
+
+    def _receive(self, actor: ActorAbstract, message: MessageAbstract, sender: ActorRefAbstract,
+                 me: ActorRefAbstract, cluster: ClusterRefAbstract, local_actor_id: str):
+        mailbox = self._mailboxes.get(local_actor_id)
+        if mailbox is None:
+            super()._receive(actor, message, sender, me, cluster, local_actor_id)
+            return
+
+        pins = _pin_buffers(message)
+        with mailbox.lock:
+            mailbox.messages.append((message, sender, me, cluster, pins))
+            if mailbox.scheduled:
+                return
+            mailbox.scheduled = True
+        self._get_pool().submit(self._drain, local_actor_id, mailbox)
+
+    def _drain(self, local_actor_id: str, mailbox: Mailbox):
+        for _ in range(self._throughput):
+            with mailbox.lock:
+                if not mailbox.messages:
+                    mailbox.scheduled = False
+                    mailbox.idle.notify_all()
+                    return
+                message, sender, me, cluster, pins = mailbox.messages.popleft()
+            try:
+                super()._receive(mailbox.actor, message, sender, me, cluster, local_actor_id)
+            except Exception as e:
+                self._fail(local_actor_id, e)
+            finally:
+                for pin in pins:
+                    pin.release()
+        self._get_pool().submit(self._drain, local_actor_id, mailbox)
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        pid = os.getpid()
+        if self._pool is None or self._pool_pid != pid:
+            self._pool = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="actor")
+            self._pool_pid = pid
+        return self._pool
+
+    def shutdown(self):
+        if self._pool is not None and self._pool_pid == os.getpid():
+            for mailbox in list(self._mailboxes.values()):
+                mailbox.wait_idle()
+            self._pool.shutdown(wait=True)
+        self._pool = None
+        super().shutdown()
+
+
+def _pin_buffers(message: MessageAbstract) -> List[BufferPin]:
+    if not isinstance(message, MessageAbstract) or not message.buffer_fields:
+        return []
+    pins = []
+    for field in message.buffer_fields:
+        value = getattr(message, field, None)
+        if isinstance(value, memoryview):
+            try:
+                pins.append(pin_buffer(value))
+            except ValueError:
+                pass
+    return pins
@@ -0,0 +1,17 @@
+from abc import abstractmethod
+from typing import TYPE_CHECKING
+
+from redcomet.base.actor.abstract import ActorAbstract
+from redcomet.base.actor.message import MessageAbstract
+from redcomet.base.actor.ref import ActorRefAbstract
+
+if TYPE_CHECKING:
+    from redcomet.base.cluster.ref import ClusterRefAbstract
+
+
+class AsyncActorAbstract(ActorAbstract):
+
+    @abstractmethod
+    async def receive(self, message: MessageAbstract, sender: ActorRefAbstract, me: ActorRefAbstract,
+                      cluster: 'ClusterRefAbstract'):
+        pass
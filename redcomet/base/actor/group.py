@@ -0,0 +1,21 @@
+from abc import ABC, abstractmethod
+from typing import List
+
+from redcomet.base.actor.message import MessageAbstract
+from redcomet.base.actor.ref import ActorRefAbstract
+
+
+class ActorGroupAbstract(ABC):
+    __slots__ = ()
+
+    @abstractmethod
+    def tell(self, message: MessageAbstract):
+        pass
+
+    @property
+    @abstractmethod
+    def refs(self) -> List[ActorRefAbstract]:
+        pass
+
+    def __len__(self) -> int:
+        return len(self.refs)
@@ -1,10 +1,16 @@
-from typing import Optional
+from typing import Optional, Tuple
 
 from redcomet.base.messaging.content import PacketContentAbstract
 
 
 class MessageAbstract(PacketContentAbstract):
+    __slots__ = ()
+    buffer_fields: Tuple[str, ...] = ()
 
     @property
     def ref_id(self) -> Optional[str]:
         return None
+
+    @property
+    def routing_key(self) -> Optional[str]:
+        return None
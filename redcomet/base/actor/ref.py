@@ -1,10 +1,15 @@
+import asyncio
 from abc import ABC, abstractmethod
+from concurrent.futures import Future
+from typing import List, Optional
 
 from redcomet.base.actor.message import MessageAbstract
 from redcomet.base.messaging.address import Address
+from redcomet.base.messenger.backpressure import Backpressure
 
 
 class ActorRefAbstract(ABC):
+    __slots__ = ()
 
     @abstractmethod
     def tell(self, message: MessageAbstract):
@@ -14,6 +19,28 @@ class ActorRefAbstract(ABC):
     def bind(self, ref: 'ActorRefAbstract') -> 'ActorRefAbstract':
         pass
 
+    def ask(self, message: MessageAbstract, timeout: float = None) -> Future:
+        raise NotImplementedError()
+
+    def ask_async(self, message: MessageAbstract, timeout: float = None) -> asyncio.Future:
+        raise NotImplementedError()
+
+    def with_backpressure(self, backpressure: Backpressure) -> 'ActorRefAbstract':
+        raise NotImplementedError()
+
+    def node_queue_depth(self) -> Optional[int]:
+        return None
+
+    def is_addressable(self) -> bool:
+        return True
+
+    def expand(self) -> List['ActorRefAbstract']:
+        return [self]
+
+    @property
+    def backpressure(self) -> Backpressure:
+        return Backpressure.BLOCK
+
     @property
     @abstractmethod
     def address(self) -> Address:
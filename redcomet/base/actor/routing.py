@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+from typing import List
+
+from redcomet.base.actor.message import MessageAbstract
+from redcomet.base.actor.ref import ActorRefAbstract
+
+
+class RoutingStrategyAbstract(ABC):
+
+    @abstractmethod
+    def select(self, routees: List[ActorRefAbstract], message: MessageAbstract) -> ActorRefAbstract:
+        pass
@@ -0,0 +1,24 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class ActorStoreAbstract(ABC):
+
+    @abstractmethod
+    def save(self, actor_id: str, state: bytes):
+        pass
+
+    @abstractmethod
+    def load(self, actor_id: str) -> Optional[bytes]:
+        pass
+
+    @abstractmethod
+    def __contains__(self, actor_id: str) -> bool:
+        pass
+
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
+
+    def close(self):
+        pass
@@ -0,0 +1,11 @@
+from abc import ABC, abstractmethod
+from typing import List, Mapping
+
+from redcomet.cluster.load import NodeLoad
+
+
+class PlacementStrategyAbstract(ABC):
+
+    @abstractmethod
+    def select(self, node_ids: List[str], loads: Mapping[str, NodeLoad]) -> str:
+        pass
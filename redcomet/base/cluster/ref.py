@@ -1,16 +1,45 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Iterable, List
 
 from redcomet.base.actor import ActorRefAbstract
 from redcomet.base.actor.abstract import ActorAbstract
+from redcomet.base.actor.group import ActorGroupAbstract
+from redcomet.base.actor.routing import RoutingStrategyAbstract
+from redcomet.base.messenger.backpressure import Backpressure
+from redcomet.cluster.message.heartbeat.request import HeartbeatRequest
+from redcomet.cluster.message.load_report.report import NodeLoadReport
 from redcomet.node.ref import NodeRef
 
 
 class ClusterRefAbstract(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def spawn(self, actor: ActorAbstract) -> ActorRefAbstract:
         pass
 
+    def spawn_many(self, actors: Iterable[ActorAbstract]) -> List[ActorRefAbstract]:
+        return [self.spawn(actor) for actor in actors]
+
+    def spawn_router(self, actors: Iterable[ActorAbstract],
+                     strategy: RoutingStrategyAbstract = None) -> ActorRefAbstract:
+        raise NotImplementedError()
+
+    def migrate(self, actor: ActorRefAbstract, node_id: str):
+        raise NotImplementedError()
+
+    def group(self, refs: Iterable[ActorRefAbstract],
+              backpressure: Backpressure = Backpressure.BLOCK) -> ActorGroupAbstract:
+        raise NotImplementedError()
+
     @abstractmethod
     def get_active_nodes(self, timeout: float) -> List[NodeRef]:
         pass
+
+    @abstractmethod
+    def report_load(self, report: NodeLoadReport):
+        pass
+
+    @abstractmethod
+    def heartbeat(self, request: HeartbeatRequest):
+        pass
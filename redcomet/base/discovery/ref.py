@@ -6,9 +6,14 @@ from redcomet.base.messaging.address import Address
 
 
 class ActorDiscoveryRefAbstract(ABC):
+    __slots__ = ()
 
     @abstractmethod
-    def register_address(self, target: str, node_id: str):
+    def register_address(self, target: str, node_id: str, replace: bool = False):
+        pass
+
+    @abstractmethod
+    def deregister_address(self, target: str):
         pass
 
     @abstractmethod
@@ -18,3 +23,7 @@ class ActorDiscoveryRefAbstract(ABC):
     @abstractmethod
     def call_on_query_address_response(self, message: MessageAbstract, func: Callable[[str, Address], Any]) -> bool:
         pass
+
+    @abstractmethod
+    def call_on_address_invalidated(self, message: MessageAbstract, func: Callable[[str], Any]) -> bool:
+        pass
@@ -1,18 +1,24 @@
+import sys
 from typing import Optional
 
+_LOCAL = sys.intern("__LOCAL")
+_ANYWHERE = sys.intern("__ANYWHERE")
+
 
 class Address:
+    __slots__ = ("_node_id", "_target")
+
     def __init__(self, node_id: Optional[str], target: str):
-        self._node_id = node_id
-        self._target = target
+        self._node_id = sys.intern(node_id) if node_id.__class__ is str else node_id
+        self._target = sys.intern(target) if target.__class__ is str else target
 
     @classmethod
     def on_local(cls, target: str) -> 'Address':
-        return cls("__LOCAL", target)
+        return cls(_LOCAL, target)
 
     @classmethod
     def anywhere(cls, target: str) -> 'Address':
-        return cls("__ANYWHERE", target)
+        return cls(_ANYWHERE, target)
 
     @property
     def node_id(self) -> str:
@@ -22,14 +28,14 @@ class Address:
     def target(self) -> str:
         return self._target
 
-    def set_node_id(self, node_id: str):
-        self._node_id = node_id
+    def with_node_id(self, node_id: str) -> 'Address':
+        return Address(node_id, self._target)
 
     def is_local(self) -> bool:
-        return self._node_id == "__LOCAL"
+        return self._node_id == _LOCAL
 
     def is_global(self) -> bool:
-        return self._node_id == "__ANYWHERE"
+        return self._node_id == _ANYWHERE
 
     def __repr__(self):
         if self.is_local():
@@ -43,3 +49,9 @@ class Address:
             return False
         assert isinstance(other, Address)
         return self._node_id == other._node_id and self._target == other.target
+
+    def __hash__(self):
+        return hash((self._node_id, self._target))
+
+    def __reduce__(self):
+        return Address, (self._node_id, self._target)
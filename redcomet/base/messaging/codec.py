@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+
+from redcomet.base.messaging.packet import Packet
+
+
+class PacketCodecAbstract(ABC):
+
+    @abstractmethod
+    def encode(self, packet: Packet) -> bytes:
+        pass
+
+    @abstractmethod
+    def decode(self, data: bytes) -> Packet:
+        pass
+
+    def intern(self, value: str):
+        pass
+
+    def register_type(self, cls: type):
+        pass
@@ -2,4 +2,4 @@ from abc import ABC
 
 
 class PacketContentAbstract(ABC):
-    pass
+    __slots__ = ()
@@ -0,0 +1,27 @@
+import socket
+from abc import ABC, abstractmethod
+from typing import Optional, Tuple
+
+
+class EndpointAbstract(ABC):
+
+    @abstractmethod
+    def listen(self, backlog: int) -> Tuple[socket.socket, 'EndpointAbstract']:
+        pass
+
+    @abstractmethod
+    def connect(self) -> socket.socket:
+        pass
+
+    def configure(self, sock: socket.socket):
+        pass
+
+    def release(self):
+        pass
+
+    @property
+    def authkey(self) -> Optional[bytes]:
+        return None
+
+    def with_authkey(self, authkey: bytes) -> 'EndpointAbstract':
+        return self
@@ -3,13 +3,15 @@ from redcomet.base.messaging.content import PacketContentAbstract
 
 
 class Packet:
+    __slots__ = ("_content", "_sender", "_receiver")
+
     def __init__(self, content: PacketContentAbstract, sender: Address, receiver: Address):
         self._content = content
         self._sender = sender
         self._receiver = receiver
 
     def set_sender_node_id(self, node_id: str):
-        self._sender.set_node_id(node_id)
+        self._sender = self._sender.with_node_id(node_id)
 
     @property
     def content(self) -> PacketContentAbstract:
@@ -32,8 +34,11 @@ class Packet:
         assert isinstance(other, Packet)
         return other.content == self.content and other.receiver == self.receiver and other.sender == self.sender
 
+    def __reduce__(self):
+        return Packet, (self._content, self._sender, self._receiver)
+
     def set_receiver_node_id(self, node_id: str):
-        self.receiver.set_node_id(node_id)
+        self._receiver = self._receiver.with_node_id(node_id)
 
     def is_local_receiver(self) -> bool:
         return self._receiver.is_local()
@@ -1,21 +1,43 @@
 from abc import ABC, abstractmethod
+from concurrent.futures import Future
+from contextlib import nullcontext
+from typing import ContextManager, Iterable, List, Optional, Tuple
 
 from redcomet.base.actor.message import MessageAbstract
 from redcomet.base.discovery.ref import ActorDiscoveryRefAbstract
+from redcomet.base.messaging.address import Address
+from redcomet.base.messaging.endpoint import EndpointAbstract
 from redcomet.base.messaging.packet import Packet
+from redcomet.base.messenger.backpressure import Backpressure
 from redcomet.base.messenger.direct_message.ref import DirectMessageBoxRefAbstract
 
 
 class MessengerAbstract(ABC):
 
     @abstractmethod
-    def send(self, message: MessageAbstract, sender_id: str, receiver_id: str):
+    def send(self, message: MessageAbstract, sender_id: str, receiver_id: str,
+             backpressure: Backpressure = Backpressure.BLOCK):
         pass
 
     @abstractmethod
     def send_packet(self, packet: Packet):
         pass
 
+    def forward_packet(self, packet: Packet):
+        raise NotImplementedError()
+
+    def send_many(self, messages: Iterable[Tuple[MessageAbstract, str, str, Backpressure]]):
+        for message, sender_id, receiver_id, backpressure in messages:
+            self.send(message, sender_id, receiver_id, backpressure)
+
+    def multicast(self, message: MessageAbstract, sender_id: str, receiver_ids: Iterable[str],
+                  backpressure: Backpressure = Backpressure.BLOCK):
+        for receiver_id in receiver_ids:
+            self.send(message, sender_id, receiver_id, backpressure)
+
+    def batch(self) -> ContextManager:
+        return nullcontext()
+
     @abstractmethod
     def assign_node_id(self, node_id: str):
         pass
@@ -37,6 +59,35 @@ class MessengerAbstract(ABC):
     def node_id(self) -> str:
         pass
 
+    def ask(self, message: MessageAbstract, receiver: Address, timeout: float = None,
+            backpressure: Backpressure = Backpressure.BLOCK) -> Future:
+        raise NotImplementedError()
+
+    def claim_reply(self, reply: MessageAbstract) -> bool:
+        return False
+
+    def announce_address(self, address: Address):
+        raise NotImplementedError()
+
+    def connected_node_ids(self) -> List[str]:
+        return []
+
+    def inbox_depth(self) -> int:
+        return 0
+
+    def node_queue_depth(self, receiver_id: str) -> Optional[int]:
+        return None
+
+    def blocked_send_time(self) -> float:
+        return 0.0
+
+    @property
+    def endpoint(self) -> Optional[EndpointAbstract]:
+        return None
+
+    def connect_remote(self, node_id: str, endpoint: EndpointAbstract):
+        raise NotImplementedError()
+
     def start_receive_loop(self):
         pass
 
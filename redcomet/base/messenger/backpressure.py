@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class Backpressure(Enum):
+    BLOCK = "block"
+    DROP = "drop"
+    SPILL = "spill"
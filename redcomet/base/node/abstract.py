@@ -1,13 +1,18 @@
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Callable, Optional
 
 from redcomet.base.actor import ActorRefAbstract
 from redcomet.base.actor.abstract import ActorAbstract
 from redcomet.base.cluster.ref import ClusterRefAbstract
 from redcomet.base.messaging.address import Address
+from redcomet.base.messaging.endpoint import EndpointAbstract
 from redcomet.base.messenger.abstract import MessengerAbstract
 from redcomet.node.manager.abstract import NodeManagerAbstract
 from redcomet.node.ref import NodeRef
 
+if TYPE_CHECKING:
+    from redcomet.discovery.ring import ConsistentHashRing
+
 
 class NodeAbstract(ABC):
 
@@ -20,10 +25,16 @@ class NodeAbstract(ABC):
     def close(self):
         pass
 
+    def is_alive(self) -> bool:
+        return True
+
     @abstractmethod
     def bind_discovery(self, address: Address):
         pass
 
+    def bind_sharded_discovery(self, ring: 'ConsistentHashRing', actor_id: str):
+        raise NotImplementedError()
+
     @abstractmethod
     def issue_actor_ref(self, local_issuer_id: str, address: Address) -> ActorRefAbstract:
         pass
@@ -40,6 +51,15 @@ class NodeAbstract(ABC):
     def register_executable_actor(self, actor: ActorAbstract, actor_id: str):
         pass
 
+    def unregister_executable_actor(self, actor_id: str, forward_to: str = None) -> Optional[ActorAbstract]:
+        raise NotImplementedError()
+
+    def migrate_executable_actor(self, actor_id: str, node_id: str, hand_off: Callable[[ActorAbstract], None]):
+        raise NotImplementedError()
+
+    def passivate_idle_actors(self):
+        pass
+
     @abstractmethod
     def assign_node_id(self, node_id: str):
         pass
@@ -62,6 +82,9 @@ class NodeAbstract(ABC):
     def make_connection_to(self, node: 'NodeAbstract'):
         pass
 
+    def connect_remote(self, node_id: str, endpoint: EndpointAbstract):
+        raise NotImplementedError()
+
     @abstractmethod
     def assign_manager(self, manager: NodeManagerAbstract):
         pass
@@ -4,10 +4,18 @@ from redcomet.base.actor.abstract import ActorAbstract
 
 
 class NodeRefAbstract(ABC):
+    __slots__ = ()
+
     @abstractmethod
-    def register_address(self, actor_id: str, actor: ActorAbstract):
+    def register_address(self, actor_id: str, actor: ActorAbstract, replace: bool = False):
         pass
 
+    def hand_over_actor(self, actor_id: str, state: bytes):
+        raise NotImplementedError()
+
+    def migrate_actor(self, actor_id: str, node_id: str):
+        raise NotImplementedError()
+
     @property
     @abstractmethod
     def node_id(self) -> str:
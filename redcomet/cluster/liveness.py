@@ -0,0 +1,26 @@
+import time
+from typing import Optional
+
+
+class NodeLiveness:
+    __slots__ = ("last_seen", "rtt", "heartbeats")
+
+    def __init__(self, last_seen: float = None, rtt: float = None):
+        self.last_seen = time.monotonic() if last_seen is None else last_seen
+        self.rtt = rtt
+        self.heartbeats = 0
+
+    def record(self, rtt: Optional[float]):
+        self.last_seen = time.monotonic()
+        if rtt is not None:
+            self.rtt = rtt
+        self.heartbeats += 1
+
+    def seconds_since_seen(self) -> float:
+        return time.monotonic() - self.last_seen
+
+    def is_alive(self, timeout: Optional[float]) -> bool:
+        return timeout is None or self.seconds_since_seen() <= timeout
+
+    def __repr__(self) -> str:
+        return f"NodeLiveness(rtt={self.rtt!r}, heartbeats={self.heartbeats!r})"
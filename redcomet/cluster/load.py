@@ -0,0 +1,22 @@
+import time
+
+
+class NodeLoad:
+    __slots__ = ("inbox_depth", "n_actors", "blocked_send_time", "reported_at")
+
+    def __init__(self, inbox_depth: int = 0, n_actors: int = 0, blocked_send_time: float = 0.0,
+                 reported_at: float = None):
+        self.inbox_depth = inbox_depth
+        self.n_actors = n_actors
+        self.blocked_send_time = blocked_send_time
+        self.reported_at = reported_at
+
+    def update(self, inbox_depth: int, n_actors: int, blocked_send_time: float = 0.0):
+        self.inbox_depth = inbox_depth
+        self.n_actors = n_actors
+        self.blocked_send_time = blocked_send_time
+        self.reported_at = time.monotonic()
+
+    def __repr__(self) -> str:
+        return f"NodeLoad(inbox_depth={self.inbox_depth!r}, n_actors={self.n_actors!r}, " \
+               f"blocked_send_time={self.blocked_send_time!r})"
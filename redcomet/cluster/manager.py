@@ -1,38 +1,79 @@
-from typing import List, Dict
+from typing import List, Dict, Union
 
 from redcomet.base.actor.abstract import ActorAbstract, ActorRefAbstract
 from redcomet.base.actor.message import MessageAbstract
+from redcomet.base.cluster.placement import PlacementStrategyAbstract
 from redcomet.base.cluster.ref import ClusterRefAbstract
+from redcomet.base.messaging.codec import PacketCodecAbstract
 from redcomet.base.messaging.address import Address
+from redcomet.base.messaging.endpoint import EndpointAbstract
 from redcomet.base.node.abstract import NodeAbstract
 from redcomet.base.node.ref import NodeRefAbstract
+from redcomet.cluster.liveness import NodeLiveness
+from redcomet.cluster.load import NodeLoad
+from redcomet.cluster.message.heartbeat.request import HeartbeatRequest
+from redcomet.cluster.message.heartbeat.response import HeartbeatResponse
 from redcomet.cluster.message.list_active_node.request import ListActiveNodeRequest
 from redcomet.cluster.message.list_active_node.response import ListActiveNodeResponse
+from redcomet.cluster.message.load_report.report import NodeLoadReport
+from redcomet.cluster.message.migrate_actor.request import MigrateActorRequest
+from redcomet.cluster.message.node_status.request import NodeStatusRequest
+from redcomet.cluster.message.node_status.response import NodeStatusResponse
+from redcomet.cluster.message.spawn_actor.batch import SpawnActorBatchRequest
 from redcomet.cluster.message.spawn_actor.request import SpawnActorRequest
+from redcomet.cluster.placement import RoundRobinPlacement
+from redcomet.cluster.status import NodeStatus
 from redcomet.discovery.actor import ActorDiscovery
+from redcomet.discovery.ring import ConsistentHashRing
+from redcomet.node.remote import RemoteNode
 
 
 class ClusterManager(ActorAbstract):
     def __init__(self, node: NodeAbstract, actor_id: str, discovery: Address,
-                 node_refs: Dict[str, NodeRefAbstract] = None, nodes: List[NodeAbstract] = None):
+                 node_refs: Dict[str, NodeRefAbstract] = None, nodes: List[NodeAbstract] = None,
+                 discovery_ring: ConsistentHashRing = None, discovery_shards: Dict[str, ActorDiscovery] = None,
+                 announce_addresses: bool = False, placement: PlacementStrategyAbstract = None,
+                 heartbeat_timeout: float = None, codec: PacketCodecAbstract = None):
         self._node = node
+        self._codec = codec
         self._actor_id = actor_id
         self._discovery = discovery
+        self._discovery_ring = discovery_ring
+        self._discovery_shards = discovery_shards or {}
+        self._announce_addresses = announce_addresses
+        self._started = False
 
         self._nodes: List[NodeAbstract] = nodes or []
 
         self._node_refs = node_refs or {}
-        self._node_ref_list: List[NodeRefAbstract] = [ref for ref in self._node_refs.values()]
-        self._node_spawn_index = 0
+        self._node_ids: List[str] = [node_id for node_id in self._node_refs.keys()]
+
+        self._placement = placement or RoundRobinPlacement()
+        self._loads: Dict[str, NodeLoad] = {node_id: NodeLoad() for node_id in self._node_ids}
+        self._placements: Dict[str, str] = {}
+
+        self._heartbeat_timeout = heartbeat_timeout
+        self._liveness: Dict[str, NodeLiveness] = {node_id: NodeLiveness() for node_id in self._node_ids}
 
     @classmethod
-    def create(cls, node: NodeAbstract, node_id: str, actor_id: str) -> 'ClusterManager':
-        discovery = ActorDiscovery.create("discovery", node_id)
-        cluster = cls(node, actor_id, discovery.address)
+    def create(cls, node: NodeAbstract, node_id: str, actor_id: str,
+               sharded_discovery: bool = False, announce_addresses: bool = False,
+               placement: PlacementStrategyAbstract = None, heartbeat_timeout: float = None,
+               codec: PacketCodecAbstract = None) -> 'ClusterManager':
+        discovery = ActorDiscovery.create("discovery", node_id, broadcast_invalidations=announce_addresses)
+        if sharded_discovery:
+            ring = ConsistentHashRing()
+            ring.add(node_id)
+            cluster = cls(node, actor_id, discovery.address, discovery_ring=ring,
+                          discovery_shards={node_id: discovery}, announce_addresses=announce_addresses,
+                          placement=placement, heartbeat_timeout=heartbeat_timeout, codec=codec)
+        else:
+            cluster = cls(node, actor_id, discovery.address, announce_addresses=announce_addresses,
+                          placement=placement, heartbeat_timeout=heartbeat_timeout, codec=codec)
         discovery.register_address(actor_id, node_id)
 
         node.assign_node_id(node_id)
-        node.bind_discovery(discovery.address)
+        cluster._bind_discovery(node)
         discovery.set_node(node)
 
         node.register_executable_actor(cluster, actor_id)
@@ -41,25 +82,58 @@ class ClusterManager(ActorAbstract):
         return cluster
 
     def start(self):
+        self._started = True
         self._node.start()
         for node in self._nodes:
             node.start()
 
-    def add_node(self, node: NodeAbstract, node_id: str):
+    def add_node(self, node: Union[NodeAbstract, EndpointAbstract], node_id: str):
+        if isinstance(node, EndpointAbstract):
+            node = RemoteNode(node, codec=self._codec)
         if node in self._nodes or node is self._node:
             raise NotImplementedError()
+        if self._discovery_ring is not None and isinstance(node, RemoteNode):
+            raise ValueError("sharded discovery does not support remote nodes")
 
         node.assign_node_id(node_id)
+        if self._discovery_ring is not None:
+            self._add_discovery_shard(node, node_id)
         self._make_node_connection(node)
         self._save_node_ref(node_id)
 
+    def _add_discovery_shard(self, node: NodeAbstract, node_id: str):
+        if self._started:
+            raise NotImplementedError()
+
+        shard = ActorDiscovery(Address(node_id, self._discovery.target),
+                               broadcast_invalidations=self._announce_addresses)
+        shard.set_node(node)
+        node.register_executable_actor(shard, self._discovery.target)
+        self._discovery_ring.add(node_id)
+        self._discovery_shards[node_id] = shard
+        self._rebalance_discovery()
+
+    def _rebalance_discovery(self):
+        for node_id, shard in self._discovery_shards.items():
+            moved = shard.pop_addresses(lambda target: self._discovery_ring.get(target) != node_id)
+            for target, owner_node_id in moved.items():
+                self._discovery_shards[self._discovery_ring.get(target)].register_address(target, owner_node_id)
+
+    def _bind_discovery(self, node: NodeAbstract):
+        if self._discovery_ring is None:
+            node.bind_discovery(self._discovery)
+        else:
+            node.bind_sharded_discovery(self._discovery_ring, self._discovery.target)
+
     def _save_node_ref(self, node_id):
         ref = self._node.issue_node_ref(self._actor_id, node_id)
         self._node_refs[node_id] = ref
-        self._node_ref_list.append(ref)
+        self._node_ids.append(node_id)
+        self._loads[node_id] = NodeLoad()
+        self._liveness[node_id] = NodeLiveness()
 
     def _make_node_connection(self, node: NodeAbstract):
-        node.bind_discovery(self._discovery)
+        self._bind_discovery(node)
         node.make_connection_with(self._node)
         for existing_node in self._nodes:
             existing_node.make_connection_with(node)
@@ -69,25 +143,79 @@ class ClusterManager(ActorAbstract):
                 cluster: ClusterRefAbstract):
         if isinstance(message, SpawnActorRequest):
             self._process_spawn_request(message)
+        elif isinstance(message, SpawnActorBatchRequest):
+            with self._node.messenger.batch():
+                for request in message.requests:
+                    self._process_spawn_request(request)
+        elif isinstance(message, MigrateActorRequest):
+            self._process_migrate_request(message)
         elif isinstance(message, ListActiveNodeRequest):
             self._process_list_active_node_request(message, sender)
+        elif isinstance(message, NodeLoadReport):
+            self._process_load_report(message)
+        elif isinstance(message, HeartbeatRequest):
+            self._process_heartbeat(message, sender)
+        elif isinstance(message, NodeStatusRequest):
+            self._process_node_status_request(message, sender)
         else:
             raise NotImplementedError()
 
     def _process_list_active_node_request(self, message: ListActiveNodeRequest, sender: ActorRefAbstract):
-        node_ids = [node_id for node_id in self._node_refs.keys()]
-        sender.tell(ListActiveNodeResponse(node_ids, ref_id=message.reply_ref_id))
+        node_ids = self._active_node_ids()
+        statuses = [self._node_status(node_id) for node_id in node_ids]
+        sender.tell(ListActiveNodeResponse(node_ids, ref_id=message.reply_ref_id, statuses=statuses))
+
+    def _process_heartbeat(self, message: HeartbeatRequest, sender: ActorRefAbstract):
+        liveness = self._liveness.get(message.node_id)
+        if liveness is not None:
+            liveness.record(message.rtt)
+        sender.tell(HeartbeatResponse(message.sent_at))
+
+    def _process_node_status_request(self, message: NodeStatusRequest, sender: ActorRefAbstract):
+        sender.tell(NodeStatusResponse(self._node_status(message.node_id), ref_id=message.reply_ref_id))
+
+    def _node_status(self, node_id: str) -> NodeStatus:
+        liveness = self._liveness.get(node_id)
+        if liveness is None:
+            return NodeStatus(node_id, active=False)
+        return NodeStatus(node_id, active=liveness.is_alive(self._heartbeat_timeout), rtt=liveness.rtt,
+                          last_seen=liveness.seconds_since_seen() if liveness.heartbeats else None)
+
+    def _active_node_ids(self) -> List[str]:
+        return [node_id for node_id in self._node_ids if self._liveness[node_id].is_alive(self._heartbeat_timeout)]
+
+    def _process_load_report(self, message: NodeLoadReport):
+        load = self._loads.get(message.node_id)
+        if load is None:
+            return
+        load.update(message.inbox_depth, message.n_actors, message.blocked_send_time)
 
     def _process_spawn_request(self, message: SpawnActorRequest):
-        node_id = self._get_node_id()
+        node_id = self._placement.select(self._active_node_ids() or self._node_ids, self._loads)
         self._request_register_address(node_id, message.actor_id, message.actor)
-
-    def _get_node_id(self) -> str:
-        if self._node_spawn_index >= len(self._node_ref_list):
-            self._node_spawn_index = 0
-        node_id = self._node_ref_list[self._node_spawn_index].node_id
-        self._node_spawn_index += 1
-        return node_id
+        self._loads[node_id].n_actors += 1
+        self._placements[message.actor_id] = node_id
+
+    def _process_migrate_request(self, message: MigrateActorRequest):
+        source = self._placements.get(message.actor_id)
+        if source is None or source == message.node_id or message.node_id not in self._node_refs:
+            return
+        self._node_refs[source].migrate_actor(message.actor_id, message.node_id)
+        self._placements[message.actor_id] = message.node_id
+        self._loads[source].n_actors -= 1
+        self._loads[message.node_id].n_actors += 1
+
+    @property
+    def loads(self) -> Dict[str, NodeLoad]:
+        return self._loads
+
+    @property
+    def placements(self) -> Dict[str, str]:
+        return self._placements
+
+    @property
+    def liveness(self) -> Dict[str, NodeLiveness]:
+        return self._liveness
 
     def _request_register_address(self, node_id: str, actor_id: str, actor: ActorAbstract):
         ref = self._node_refs.get(node_id)
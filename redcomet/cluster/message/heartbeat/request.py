@@ -0,0 +1,27 @@
+from typing import Optional
+
+from redcomet.base.actor.message import MessageAbstract
+
+
+class HeartbeatRequest(MessageAbstract):
+    __slots__ = ("_node_id", "_sent_at", "_rtt")
+
+    def __init__(self, node_id: str, sent_at: float, rtt: Optional[float] = None):
+        self._node_id = node_id
+        self._sent_at = sent_at
+        self._rtt = rtt
+
+    @property
+    def node_id(self) -> str:
+        return self._node_id
+
+    @property
+    def sent_at(self) -> float:
+        return self._sent_at
+
+    @property
+    def rtt(self) -> Optional[float]:
+        return self._rtt
+
+    def __repr__(self) -> str:
+        return f"HeartbeatRequest({self._node_id!r}, sent_at={self._sent_at!r}, rtt={self._rtt!r})"
@@ -0,0 +1,15 @@
+from redcomet.base.actor.message import MessageAbstract
+
+
+class HeartbeatResponse(MessageAbstract):
+    __slots__ = ("_sent_at",)
+
+    def __init__(self, sent_at: float):
+        self._sent_at = sent_at
+
+    @property
+    def sent_at(self) -> float:
+        return self._sent_at
+
+    def __repr__(self) -> str:
+        return f"HeartbeatResponse(sent_at={self._sent_at!r})"
@@ -2,6 +2,8 @@ from redcomet.base.actor.message import MessageAbstract
 
 
 class ListActiveNodeRequest(MessageAbstract):
+    __slots__ = ("_reply_ref_id",)
+
     def __init__(self, reply_ref_id: str):
         self._reply_ref_id = reply_ref_id
 
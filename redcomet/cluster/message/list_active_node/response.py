@@ -1,12 +1,16 @@
-from typing import List
+from typing import List, Optional
 
 from redcomet.base.actor.message import MessageAbstract
+from redcomet.cluster.status import NodeStatus
 
 
 class ListActiveNodeResponse(MessageAbstract):
-    def __init__(self, node_ids: List[str], ref_id: str):
+    __slots__ = ("_node_ids", "_ref_id", "_statuses")
+
+    def __init__(self, node_ids: List[str], ref_id: str, statuses: Optional[List[NodeStatus]] = None):
         self._node_ids = node_ids
         self._ref_id = ref_id
+        self._statuses = statuses or []
 
     @property
     def node_ids(self) -> List[str]:
@@ -16,5 +20,9 @@ class ListActiveNodeResponse(MessageAbstract):
     def ref_id(self) -> str:
         return self._ref_id
 
+    @property
+    def statuses(self) -> List[NodeStatus]:
+        return self._statuses
+
     def __repr__(self) -> str:
         return f"ListActiveNodeResponse(node_ids={self._node_ids!r}, ref_id={self._ref_id!r})"
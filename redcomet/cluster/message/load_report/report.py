@@ -0,0 +1,31 @@
+from redcomet.base.actor.message import MessageAbstract
+
+
+class NodeLoadReport(MessageAbstract):
+    __slots__ = ("_node_id", "_inbox_depth", "_n_actors", "_blocked_send_time")
+
+    def __init__(self, node_id: str, inbox_depth: int, n_actors: int, blocked_send_time: float = 0.0):
+        self._node_id = node_id
+        self._inbox_depth = inbox_depth
+        self._n_actors = n_actors
+        self._blocked_send_time = blocked_send_time
+
+    @property
+    def node_id(self) -> str:
+        return self._node_id
+
+    @property
+    def inbox_depth(self) -> int:
+        return self._inbox_depth
+
+    @property
+    def n_actors(self) -> int:
+        return self._n_actors
+
+    @property
+    def blocked_send_time(self) -> float:
+        return self._blocked_send_time
+
+    def __repr__(self) -> str:
+        return f"NodeLoadReport({self._node_id!r}, inbox_depth={self._inbox_depth!r}, n_actors={self._n_actors!r}, " \
+               f"blocked_send_time={self._blocked_send_time!r})"
@@ -0,0 +1,20 @@
+from redcomet.base.actor.message import MessageAbstract
+
+
+class MigrateActorRequest(MessageAbstract):
+    __slots__ = ("_actor_id", "_node_id")
+
+    def __init__(self, actor_id: str, node_id: str):
+        self._actor_id = actor_id
+        self._node_id = node_id
+
+    @property
+    def actor_id(self) -> str:
+        return self._actor_id
+
+    @property
+    def node_id(self) -> str:
+        return self._node_id
+
+    def __repr__(self) -> str:
+        return f"MigrateActorRequest({self._actor_id!r}, {self._node_id!r})"
@@ -0,0 +1,20 @@
+from redcomet.base.actor.message import MessageAbstract
+
+
+class NodeStatusRequest(MessageAbstract):
+    __slots__ = ("_node_id", "_reply_ref_id")
+
+    def __init__(self, node_id: str, reply_ref_id: str):
+        self._node_id = node_id
+        self._reply_ref_id = reply_ref_id
+
+    @property
+    def node_id(self) -> str:
+        return self._node_id
+
+    @property
+    def reply_ref_id(self) -> str:
+        return self._reply_ref_id
+
+    def __repr__(self) -> str:
+        return f"NodeStatusRequest({self._node_id!r}, reply_ref_id={self._reply_ref_id!r})"
@@ -0,0 +1,21 @@
+from redcomet.base.actor.message import MessageAbstract
+from redcomet.cluster.status import NodeStatus
+
+
+class NodeStatusResponse(MessageAbstract):
+    __slots__ = ("_status", "_ref_id")
+
+    def __init__(self, status: NodeStatus, ref_id: str):
+        self._status = status
+        self._ref_id = ref_id
+
+    @property
+    def status(self) -> NodeStatus:
+        return self._status
+
+    @property
+    def ref_id(self) -> str:
+        return self._ref_id
+
+    def __repr__(self) -> str:
+        return f"NodeStatusResponse({self._status!r}, ref_id={self._ref_id!r})"
@@ -0,0 +1,18 @@
+from typing import List
+
+from redcomet.base.actor.message import MessageAbstract
+from redcomet.cluster.message.spawn_actor.request import SpawnActorRequest
+
+
+class SpawnActorBatchRequest(MessageAbstract):
+    __slots__ = ("_requests",)
+
+    def __init__(self, requests: List[SpawnActorRequest]):
+        self._requests = requests
+
+    @property
+    def requests(self) -> List[SpawnActorRequest]:
+        return self._requests
+
+    def __repr__(self) -> str:
+        return f"SpawnActorBatchRequest({self._requests!r})"
@@ -3,6 +3,8 @@ from redcomet.base.actor.message import MessageAbstract
 
 
 class SpawnActorRequest(MessageAbstract):
+    __slots__ = ("_actor", "_actor_id")
+
     def __init__(self, actor: ActorAbstract, actor_id: str):
         self._actor = actor
         self._actor_id = actor_id
@@ -0,0 +1,38 @@
+import random
+from typing import List, Mapping
+
+from redcomet.base.cluster.placement import PlacementStrategyAbstract
+from redcomet.cluster.load import NodeLoad
+
+
+class RoundRobinPlacement(PlacementStrategyAbstract):
+    def __init__(self):
+        self._index = 0
+
+    def select(self, node_ids: List[str], loads: Mapping[str, NodeLoad]) -> str:
+        if self._index >= len(node_ids):
+            self._index = 0
+        node_id = node_ids[self._index]
+        self._index += 1
+        return node_id
+
+
+class LeastInboxDepthPlacement(PlacementStrategyAbstract):
+    def select(self, node_ids: List[str], loads: Mapping[str, NodeLoad]) -> str:
+        return min(node_ids, key=lambda node_id: (loads[node_id].inbox_depth, loads[node_id].n_actors))
+
+
+class LeastActorsPlacement(PlacementStrategyAbstract):
+    def select(self, node_ids: List[str], loads: Mapping[str, NodeLoad]) -> str:
+        return min(node_ids, key=lambda node_id: (loads[node_id].n_actors, loads[node_id].inbox_depth))
+
+
+class PowerOfTwoChoicesPlacement(PlacementStrategyAbstract):
+    def __init__(self, seed: int = None):
+        self._random = random.Random(seed)
+
+    def select(self, node_ids: List[str], loads: Mapping[str, NodeLoad]) -> str:
+        if len(node_ids) == 1:
+            return node_ids[0]
+        first, second = self._random.sample(node_ids, 2)
+        return min(first, second, key=lambda node_id: (loads[node_id].inbox_depth, loads[node_id].n_actors))
@@ -1,21 +1,32 @@
 import os
 import uuid
-from typing import List
+from typing import Iterable, List
 
+from redcomet.actor.group import ActorGroup
 from redcomet.actor.ref import ActorRef
+from redcomet.actor.router import RouterRef
+from redcomet.actor.routing import RoundRobinRouting
 from redcomet.base.actor import ActorRefAbstract
 from redcomet.base.actor.abstract import ActorAbstract
+from redcomet.base.actor.routing import RoutingStrategyAbstract
 from redcomet.base.cluster.ref import ClusterRefAbstract
 from redcomet.base.messaging.address import Address
 from redcomet.base.messaging.packet import Packet
 from redcomet.base.messenger.abstract import MessengerAbstract
+from redcomet.base.messenger.backpressure import Backpressure
+from redcomet.cluster.message.heartbeat.request import HeartbeatRequest
 from redcomet.cluster.message.list_active_node.request import ListActiveNodeRequest
 from redcomet.cluster.message.list_active_node.response import ListActiveNodeResponse
+from redcomet.cluster.message.load_report.report import NodeLoadReport
+from redcomet.cluster.message.migrate_actor.request import MigrateActorRequest
+from redcomet.cluster.message.spawn_actor.batch import SpawnActorBatchRequest
 from redcomet.cluster.message.spawn_actor.request import SpawnActorRequest
 from redcomet.node.ref import NodeRef
 
 
 class ClusterRef(ClusterRefAbstract):
+    __slots__ = ("_messenger", "_issuer_id", "_address")
+
     def __init__(self, messenger: MessengerAbstract, issuer_id: str, ref_node_id: str, ref_id: str):
         self._messenger = messenger
         self._issuer_id = issuer_id
@@ -29,6 +40,28 @@ class ClusterRef(ClusterRefAbstract):
         self._messenger.send_packet(packet)
         return ActorRef(self._messenger, self._issuer_id, Address.anywhere(ref_id))
 
+    def spawn_many(self, actors: Iterable[ActorAbstract]) -> List[ActorRefAbstract]:
+        requests = [SpawnActorRequest(actor, _generate_actor_id()) for actor in actors]
+        packet = Packet(SpawnActorBatchRequest(requests),
+                        sender=Address.on_local(self._issuer_id),
+                        receiver=self._address)
+        self._messenger.send_packet(packet)
+        return [ActorRef(self._messenger, self._issuer_id, Address.anywhere(request.actor_id))
+                for request in requests]
+
+    def spawn_router(self, actors: Iterable[ActorAbstract], strategy: RoutingStrategyAbstract = None) -> RouterRef:
+        return RouterRef(self.spawn_many(actors), strategy if strategy is not None else RoundRobinRouting())
+
+    def migrate(self, actor: ActorRefAbstract, node_id: str):
+        for ref in actor.expand():
+            packet = Packet(MigrateActorRequest(ref.address.target, node_id),
+                            sender=Address.on_local(self._issuer_id),
+                            receiver=self._address)
+            self._messenger.send_packet(packet)
+
+    def group(self, refs: Iterable[ActorRefAbstract], backpressure: Backpressure = Backpressure.BLOCK) -> ActorGroup:
+        return ActorGroup(self._messenger, self._issuer_id, refs, backpressure)
+
     def get_active_nodes(self, timeout: float) -> List[NodeRef]:
         with self._messenger.create_direct_message_box() as box:
             packet = Packet(ListActiveNodeRequest(box.ref_id),
@@ -36,7 +69,17 @@ class ClusterRef(ClusterRefAbstract):
                             receiver=self._address)
             self._messenger.send_packet(packet)
             response: ListActiveNodeResponse = box.get(timeout=timeout)
-        return [NodeRef(self._messenger, self._issuer_id, node_id) for node_id in response.node_ids]
+        statuses = {status.node_id: status for status in response.statuses}
+        return [NodeRef(self._messenger, self._issuer_id, node_id, status=statuses.get(node_id))
+                for node_id in response.node_ids]
+
+    def heartbeat(self, request: HeartbeatRequest):
+        packet = Packet(request, sender=Address.on_local(self._issuer_id), receiver=self._address)
+        self._messenger.send_packet(packet)
+
+    def report_load(self, report: NodeLoadReport):
+        packet = Packet(report, sender=Address.on_local(self._issuer_id), receiver=self._address)
+        self._messenger.send_packet(packet)
 
 
 def _generate_actor_id() -> str:
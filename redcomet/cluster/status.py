@@ -0,0 +1,34 @@
+from typing import Optional
+
+
+class NodeStatus:
+    __slots__ = ("_node_id", "_active", "_rtt", "_last_seen")
+
+    def __init__(self, node_id: str, active: bool, rtt: Optional[float] = None, last_seen: Optional[float] = None):
+        self._node_id = node_id
+        self._active = active
+        self._rtt = rtt
+        self._last_seen = last_seen
+
+    @property
+    def node_id(self) -> str:
+        return self._node_id
+
+    @property
+    def active(self) -> bool:
+        return self._active
+
+    @property
+    def rtt(self) -> Optional[float]:
+        return self._rtt
+
+    @property
+    def last_seen(self) -> Optional[float]:
+        return self._last_seen
+
+    def __reduce__(self):
+        return NodeStatus, (self._node_id, self._active, self._rtt, self._last_seen)
+
+    def __repr__(self) -> str:
+        return f"NodeStatus({self._node_id!r}, active={self._active!r}, rtt={self._rtt!r}, " \
+               f"last_seen={self._last_seen!r})"
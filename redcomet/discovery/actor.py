@@ -1,4 +1,4 @@
-from typing import Dict
+from typing import Callable, Dict, Set
 
 from redcomet.base.actor import ActorRefAbstract
 from redcomet.base.actor.abstract import ActorAbstract
@@ -8,21 +8,28 @@ from redcomet.base.messaging.address import Address
 from redcomet.base.messaging.packet import Packet
 from redcomet.base.messenger.abstract import MessengerAbstract
 from redcomet.base.node.abstract import NodeAbstract
+from redcomet.discovery.message.deregister.request import DeregisterAddressRequest
+from redcomet.discovery.message.invalidate.notification import AddressInvalidated
 from redcomet.discovery.message.query.request import QueryAddressRequest
 from redcomet.discovery.message.query.response import QueryAddressResponse
 from redcomet.discovery.message.register.request import RegisterAddressRequest
+from redcomet.tracing import get_tracer
+
+_trace = get_tracer("discovery")
 
 
 class ActorDiscovery(ActorAbstract):
-    def __init__(self, address: Address, messenger: MessengerAbstract = None):
+    def __init__(self, address: Address, messenger: MessengerAbstract = None, broadcast_invalidations: bool = False):
         self._address = address
         self._messenger = messenger
+        self._broadcast_invalidations = broadcast_invalidations
 
         self._mapper: Dict[str, str] = {}
+        self._subscribers: Dict[str, Set[Address]] = {}
 
     @classmethod
-    def create(cls, actor_id: str, node_id: str) -> 'ActorDiscovery':
-        discovery = cls(Address(node_id, actor_id))
+    def create(cls, actor_id: str, node_id: str, broadcast_invalidations: bool = False) -> 'ActorDiscovery':
+        discovery = cls(Address(node_id, actor_id), broadcast_invalidations=broadcast_invalidations)
         discovery.register_address(node_id, node_id)
         discovery.register_address(actor_id, node_id)
         return discovery
@@ -36,28 +43,53 @@ class ActorDiscovery(ActorAbstract):
             self._process_register_request(message)
         elif isinstance(message, QueryAddressRequest):
             self._process_query_address_request(message)
+        elif isinstance(message, DeregisterAddressRequest):
+            self.deregister_address(message.target)
         else:
             raise NotImplementedError()
 
     def _process_register_request(self, message: RegisterAddressRequest):
-        self.register_address(message.target, message.node_id)
+        self.register_address(message.target, message.node_id, replace=message.replace)
 
     def _process_query_address_request(self, message: QueryAddressRequest):
         node_id = self._query_node_id(message.target)
         address = Address(node_id, message.target)
-        packet = Packet(QueryAddressResponse(message.target, address),
-                        sender=self._address,
-                        receiver=Address(message.requester_node_id, message.requester_target))
+        requester = Address(message.requester_node_id, message.requester_target)
+        self._subscribers.setdefault(message.target, set()).add(requester)
+        packet = Packet(QueryAddressResponse(message.target, address), sender=self._address, receiver=requester)
         self._messenger.send_packet(packet)
 
-    def register_address(self, target: str, node_id: str):
-        if target in self._mapper:
-            raise NotImplementedError()
+    def register_address(self, target: str, node_id: str, replace: bool = False):
+        current = self._mapper.get(target)
+        if current is not None:
+            if not replace:
+                raise NotImplementedError()
+            if current != node_id:
+                self._invalidate(target)
         self._mapper[target] = node_id
 
+    def deregister_address(self, target: str):
+        if self._mapper.pop(target, None) is not None:
+            self._invalidate(target)
+
+    def pop_addresses(self, should_pop: Callable[[str], bool]) -> Dict[str, str]:
+        popped = {target: node_id for target, node_id in self._mapper.items() if should_pop(target)}
+        for target in popped:
+            del self._mapper[target]
+            self._subscribers.pop(target, None)
+        return popped
+
+    def _invalidate(self, target: str):
+        subscribers = self._subscribers.pop(target, set())
+        if self._broadcast_invalidations:
+            subscribers.update(Address(node_id, "messenger") for node_id in self._messenger.connected_node_ids())
+        for subscriber in subscribers:
+            self._messenger.send_packet(Packet(AddressInvalidated(target), sender=self._address, receiver=subscriber))
+
     def _query_node_id(self, target: str) -> str:
-        print("discovery on", self._address, self._mapper)
         node_id = self._mapper.get(target)
+        if _trace.debug_enabled:
+            _trace.debug("QUERY %r on %r found %r", target, self._address, node_id)
         if node_id is None:
             raise NotImplementedError()
         return node_id
@@ -0,0 +1,15 @@
+from redcomet.base.actor.message import MessageAbstract
+
+
+class DeregisterAddressRequest(MessageAbstract):
+    __slots__ = ("_target",)
+
+    def __init__(self, target: str):
+        self._target = target
+
+    @property
+    def target(self) -> str:
+        return self._target
+
+    def __repr__(self) -> str:
+        return f"DeregisterAddressRequest({self._target!r})"
@@ -2,6 +2,8 @@ from redcomet.base.actor.message import MessageAbstract
 
 
 class QueryAddressRequest(MessageAbstract):
+    __slots__ = ("_target", "_requester_node_id", "_requester_target")
+
     def __init__(self, target: str, requester_node_id: str, requester_target: str):
         self._target = target
         self._requester_node_id = requester_node_id
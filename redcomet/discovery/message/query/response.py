@@ -3,6 +3,8 @@ from redcomet.base.messaging.address import Address
 
 
 class QueryAddressResponse(MessageAbstract):
+    __slots__ = ("_target", "_address")
+
     def __init__(self, target: str, address: Address):
         self._target = target
         self._address = address
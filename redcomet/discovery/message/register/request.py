@@ -2,9 +2,12 @@ from redcomet.base.actor.message import MessageAbstract
 
 
 class RegisterAddressRequest(MessageAbstract):
-    def __init__(self, target: str, node_id: str):
+    __slots__ = ("_target", "_node_id", "_replace")
+
+    def __init__(self, target: str, node_id: str, replace: bool = False):
         self._target = target
         self._node_id = node_id
+        self._replace = replace
 
     @property
     def target(self) -> str:
@@ -14,5 +17,9 @@ class RegisterAddressRequest(MessageAbstract):
     def node_id(self) -> str:
         return self._node_id
 
+    @property
+    def replace(self) -> bool:
+        return self._replace
+
     def __repr__(self) -> str:
-        return f"RegisterAddressRequest({self._target!r}, {self._node_id!r})"
+        return f"RegisterAddressRequest({self._target!r}, {self._node_id!r}, replace={self._replace!r})"
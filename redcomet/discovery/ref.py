@@ -5,35 +5,55 @@ from redcomet.base.discovery.ref import ActorDiscoveryRefAbstract
 from redcomet.base.messaging.address import Address
 from redcomet.base.messaging.packet import Packet
 from redcomet.base.messenger.abstract import MessengerAbstract
+from redcomet.discovery.message.deregister.request import DeregisterAddressRequest
+from redcomet.discovery.message.invalidate.notification import AddressInvalidated
 from redcomet.discovery.message.query.request import QueryAddressRequest
 from redcomet.discovery.message.query.response import QueryAddressResponse
 from redcomet.discovery.message.register.request import RegisterAddressRequest
+from redcomet.discovery.ring import ConsistentHashRing
 
 
 class ActorDiscoveryRef(ActorDiscoveryRefAbstract):
+    __slots__ = ("_messenger", "_address", "_issuer_id")
+
     def __init__(self, messenger: MessengerAbstract, address: Address, issuer_id: str):
         self._messenger = messenger
         self._address = address
         self._issuer_id = issuer_id
 
-    def register_address(self, target: str, node_id: str):
-        packet = Packet(RegisterAddressRequest(target, node_id),
+    def register_address(self, target: str, node_id: str, replace: bool = False):
+        packet = Packet(RegisterAddressRequest(target, node_id, replace),
+                        sender=Address.on_local(self._issuer_id),
+                        receiver=self._shard_address(target))
+        self._messenger.send_packet(packet)
+
+    def deregister_address(self, target: str):
+        packet = Packet(DeregisterAddressRequest(target),
                         sender=Address.on_local(self._issuer_id),
-                        receiver=self._address)
+                        receiver=self._shard_address(target))
         self._messenger.send_packet(packet)
 
     def query_address(self, target: str, requester_node_id: str, requester_target: str):
         packet = Packet(QueryAddressRequest(target, requester_node_id, requester_target),
                         sender=Address.on_local(requester_target),
-                        receiver=self._address)
+                        receiver=self._shard_address(target))
         self._messenger.send_packet(packet)
 
+    def _shard_address(self, target: str) -> Address:
+        return self._address
+
     def call_on_query_address_response(self, message: MessageAbstract, func: Callable[[str, Address], Any]) -> bool:
         if isinstance(message, QueryAddressResponse):
             func(message.target, message.address)
             return True
         return False
 
+    def call_on_address_invalidated(self, message: MessageAbstract, func: Callable[[str], Any]) -> bool:
+        if isinstance(message, AddressInvalidated):
+            func(message.target)
+            return True
+        return False
+
     def __eq__(self, other) -> bool:
         if other.__class__ != self.__class__:
             return False
@@ -41,3 +61,17 @@ class ActorDiscoveryRef(ActorDiscoveryRefAbstract):
         return (self._messenger is other._messenger
                 and self._address == other._address
                 and self._issuer_id == other._issuer_id)
+
+
+class ShardedActorDiscoveryRef(ActorDiscoveryRef):
+    __slots__ = ("_ring",)
+
+    def __init__(self, messenger: MessengerAbstract, ring: ConsistentHashRing, actor_id: str, issuer_id: str):
+        super().__init__(messenger, Address.anywhere(actor_id), issuer_id)
+        self._ring = ring
+
+    def _shard_address(self, target: str) -> Address:
+        return Address(self._ring.get(target), self._address.target)
+
+    def __eq__(self, other) -> bool:
+        return super().__eq__(other) and self._ring is other._ring
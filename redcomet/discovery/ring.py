@@ -0,0 +1,59 @@
+import bisect
+import hashlib
+from typing import Dict, List
+
+
+class ConsistentHashRing:
+    def __init__(self, replicas: int = 64):
+        if replicas < 1:
+            raise ValueError("replicas must be at least 1")
+
+        self._replicas = replicas
+        self._hashes: List[int] = []
+        self._owners: List[str] = []
+        self._members: Dict[str, List[int]] = {}
+
+    def add(self, member: str):
+        if member in self._members:
+            raise ValueError(f"{member!r} is already on the ring")
+
+        points = [_hash(f"{member}#{i}") for i in range(self._replicas)]
+        self._members[member] = points
+        for point in points:
+            index = bisect.bisect_left(self._hashes, point)
+            self._hashes.insert(index, point)
+            self._owners.insert(index, member)
+
+    def remove(self, member: str):
+        points = self._members.pop(member)
+        for point in points:
+            index = bisect.bisect_left(self._hashes, point)
+            while self._owners[index] != member:
+                index += 1
+            del self._hashes[index]
+            del self._owners[index]
+
+    def get(self, key: str) -> str:
+        if not self._hashes:
+            raise LookupError("ring has no members")
+        index = bisect.bisect_right(self._hashes, _hash(key))
+        if index == len(self._hashes):
+            index = 0
+        return self._owners[index]
+
+    @property
+    def members(self) -> List[str]:
+        return list(self._members)
+
+    def __contains__(self, member: str) -> bool:
+        return member in self._members
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def __repr__(self) -> str:
+        return f"ConsistentHashRing({list(self._members)!r}, replicas={self._replicas})"
+
+
+def _hash(key: str) -> int:
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "big")
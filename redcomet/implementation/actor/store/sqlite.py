@@ -0,0 +1,50 @@
+import os
+import sqlite3
+import tempfile
+from typing import Optional
+
+from redcomet.base.actor.store import ActorStoreAbstract
+
+
+class SqliteActorStore(ActorStoreAbstract):
+    def __init__(self, path: str = None, directory: str = None):
+        if path is None:
+            fd, path = tempfile.mkstemp(prefix="redcomet-actors-", suffix=".sqlite", dir=directory)
+            os.close(fd)
+            self._temporary = True
+        else:
+            self._temporary = False
+
+        self._path = path
+        self._connection = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=MEMORY")
+        self._connection.execute("PRAGMA synchronous=OFF")
+        self._connection.execute("CREATE TABLE IF NOT EXISTS actors (actor_id TEXT PRIMARY KEY, state BLOB NOT NULL)")
+        if self._temporary:
+            os.unlink(path)
+
+    def save(self, actor_id: str, state: bytes):
+        self._connection.execute("INSERT OR REPLACE INTO actors VALUES (?, ?)", (actor_id, state))
+
+    def load(self, actor_id: str) -> Optional[bytes]:
+        row = self._connection.execute("SELECT state FROM actors WHERE actor_id = ?", (actor_id,)).fetchone()
+        if row is None:
+            return None
+        self._connection.execute("DELETE FROM actors WHERE actor_id = ?", (actor_id,))
+        return row[0]
+
+    def __contains__(self, actor_id: str) -> bool:
+        return self._connection.execute("SELECT 1 FROM actors WHERE actor_id = ?", (actor_id,)).fetchone() is not None
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM actors").fetchone()[0]
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def close(self):
+        self._connection.close()
+
+    def __repr__(self) -> str:
+        return f"SqliteActorStore({self._path!r})"
@@ -0,0 +1,34 @@
+from multiprocessing import Queue
+from typing import Any, List
+
+from redcomet.messenger.inbox.queue import QueueManagerAbstract, QueueAbstract, drain_batch
+
+
+class PipeQueueManager(QueueManagerAbstract):
+    def __init__(self):
+        self._queue = None
+
+    def start(self) -> QueueAbstract:
+        self._queue = Queue()
+        return PipeQueue(self._queue)
+
+    def shutdown(self):
+        self._queue.close()
+        self._queue.join_thread()
+
+
+class PipeQueue(QueueAbstract):
+    def __init__(self, queue: Queue):
+        self._queue = queue
+
+    def put(self, obj: Any, block: bool = True, timeout: float = None):
+        self._queue.put(obj, block=block, timeout=timeout)
+
+    def get(self, block: bool = True, timeout: float = None) -> Any:
+        return self._queue.get(block=block, timeout=timeout)
+
+    def get_batch(self, max_size: int, wait: float = 0.0, block: bool = True, timeout: float = None) -> List[Any]:
+        return drain_batch(self.get, max_size, wait=wait, block=block, timeout=timeout)
+
+    def qsize(self) -> int:
+        return self._queue.qsize()
@@ -1,7 +1,20 @@
-from multiprocessing import Manager, Queue
-from typing import Any
+from multiprocessing.managers import SyncManager
+from queue import Queue
+from typing import Any, List
 
-from redcomet.messenger.inbox.queue import QueueManagerAbstract, QueueAbstract
+from redcomet.messenger.inbox.queue import QueueManagerAbstract, QueueAbstract, drain_batch
+
+
+class _BatchQueue(Queue):
+    def get_batch(self, max_size: int, wait: float = 0.0, block: bool = True, timeout: float = None) -> List[Any]:
+        return drain_batch(self.get, max_size, wait=wait, block=block, timeout=timeout)
+
+
+class _BatchQueueManager(SyncManager):
+    pass
+
+
+_BatchQueueManager.register("BatchQueue", _BatchQueue, exposed=("put", "get", "get_batch", "qsize", "empty"))
 
 
 class ProcessSafeQueueManager(QueueManagerAbstract):
@@ -10,8 +23,9 @@ class ProcessSafeQueueManager(QueueManagerAbstract):
         self._queue = None
 
     def start(self) -> QueueAbstract:
-        self._manager = Manager()
-        self._queue = self._manager.Queue()
+        self._manager = _BatchQueueManager()
+        self._manager.start()
+        self._queue = self._manager.BatchQueue()
         return ProcessSafeQueue(self._queue)
 
     def shutdown(self):
@@ -19,7 +33,7 @@ class ProcessSafeQueueManager(QueueManagerAbstract):
 
 
 class ProcessSafeQueue(QueueAbstract):
-    def __init__(self, queue: Queue):
+    def __init__(self, queue: _BatchQueue):
         self._queue = queue
 
     def put(self, obj: Any, block: bool = True, timeout: float = None):
@@ -27,3 +41,9 @@ class ProcessSafeQueue(QueueAbstract):
 
     def get(self, block: bool = True, timeout: float = None) -> Any:
         return self._queue.get(block=block, timeout=timeout)
+
+    def get_batch(self, max_size: int, wait: float = 0.0, block: bool = True, timeout: float = None) -> List[Any]:
+        return self._queue.get_batch(max_size, wait=wait, block=block, timeout=timeout)
+
+    def qsize(self) -> int:
+        return self._queue.qsize()
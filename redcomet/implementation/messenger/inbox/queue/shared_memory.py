@@ -0,0 +1,103 @@
+import pickle
+import struct
+import time
+from multiprocessing import Lock, Semaphore
+from multiprocessing.shared_memory import SharedMemory
+from queue import Empty, Full
+from typing import Any
+
+from redcomet.messenger.inbox.queue import QueueManagerAbstract, QueueAbstract
+
+_COUNTER = struct.Struct("Q")
+_LENGTH = struct.Struct("I")
+_HEAD_OFFSET = 0
+_TAIL_OFFSET = 8
+_HEADER_SIZE = 64
+
+_MAX_BACKOFF = 0.001
+
+
+class SharedMemoryQueueManager(QueueManagerAbstract):
+    def __init__(self, capacity: int = 4 * 1024 * 1024):
+        self._capacity = capacity
+        self._memory = None
+
+    def start(self) -> QueueAbstract:
+        self._memory = SharedMemory(create=True, size=_HEADER_SIZE + self._capacity)
+        self._memory.buf[:_HEADER_SIZE] = bytes(_HEADER_SIZE)
+        return SharedMemoryQueue(self._memory, self._capacity, Lock(), Semaphore(0))
+
+    def shutdown(self):
+        self._memory.close()
+        self._memory.unlink()
+
+
+class SharedMemoryQueue(QueueAbstract):
+    def __init__(self, memory: SharedMemory, capacity: int, write_lock: Lock, items: Semaphore):
+        self._memory = memory
+        self._capacity = capacity
+        self._write_lock = write_lock
+        self._items = items
+
+    def put(self, obj: Any, block: bool = True, timeout: float = None):
+        data = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+        size = _LENGTH.size + len(data)
+        if size > self._capacity:
+            raise ValueError(f"object of {len(data)} bytes does not fit into the queue")
+
+        if not self._write_lock.acquire(block, timeout):
+            raise Full()
+        try:
+            head = self._wait_for_space(size, block, timeout)
+            self._write(head, _LENGTH.pack(len(data)))
+            self._write(head + _LENGTH.size, data)
+            _COUNTER.pack_into(self._memory.buf, _HEAD_OFFSET, head + size)
+        finally:
+            self._write_lock.release()
+        self._items.release()
+
+    def get(self, block: bool = True, timeout: float = None) -> Any:
+        if not self._items.acquire(block, timeout):
+            raise Empty()
+        tail = _COUNTER.unpack_from(self._memory.buf, _TAIL_OFFSET)[0]
+        length = _LENGTH.unpack(self._read(tail, _LENGTH.size))[0]
+        data = self._read(tail + _LENGTH.size, length)
+        _COUNTER.pack_into(self._memory.buf, _TAIL_OFFSET, tail + _LENGTH.size + length)
+        return pickle.loads(data)
+
+    def qsize(self) -> int:
+        return self._items.get_value()
+
+    def _wait_for_space(self, size: int, block: bool, timeout: float = None) -> int:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        backoff = 0.00001
+        while True:
+            head, tail = self._positions()
+            if self._capacity - (head - tail) >= size:
+                return head
+            if not block or (deadline is not None and time.monotonic() >= deadline):
+                raise Full()
+            time.sleep(backoff)
+            backoff = min(backoff * 2, _MAX_BACKOFF)
+
+    def _positions(self):
+        buf = self._memory.buf
+        return _COUNTER.unpack_from(buf, _HEAD_OFFSET)[0], _COUNTER.unpack_from(buf, _TAIL_OFFSET)[0]
+
+    def _write(self, position: int, data: bytes):
+        buf = self._memory.buf
+        data = memoryview(data)
+        start = _HEADER_SIZE + position % self._capacity
+        first = min(len(data), _HEADER_SIZE + self._capacity - start)
+        buf[start:start + first] = data[:first]
+        if first < len(data):
+            buf[_HEADER_SIZE:_HEADER_SIZE + len(data) - first] = data[first:]
+
+    def _read(self, position: int, length: int) -> bytes:
+        buf = self._memory.buf
+        start = _HEADER_SIZE + position % self._capacity
+        first = min(length, _HEADER_SIZE + self._capacity - start)
+        data = bytes(buf[start:start + first])
+        if first < length:
+            data += bytes(buf[_HEADER_SIZE:_HEADER_SIZE + length - first])
+        return data
@@ -1,14 +1,91 @@
-from typing import Dict, Optional
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
 
 from redcomet.base.messaging.address import Address
 
 
 class AddressCache:
-    def __init__(self):
-        self._cache: Dict[str, Address] = {}
+    def __init__(self, capacity: int = 65536, ttl: float = None):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+
+        self._capacity = capacity
+        self._ttl = ttl
+        self._cache: OrderedDict[str, Tuple[Address, Optional[float], bool]] = OrderedDict()
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+        self._queries_avoided = 0
 
     def get_address(self, target: str) -> Optional[Address]:
-        return self._cache.get(target)
+        entry = self._cache.get(target)
+        if entry is None:
+            self._misses += 1
+            return None
+
+        address, expires_at, announced = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._cache[target]
+            self._evictions += 1
+            self._misses += 1
+            return None
+
+        if announced:
+            self._cache[target] = (address, expires_at, False)
+            self._queries_avoided += 1
+        self._cache.move_to_end(target)
+        self._hits += 1
+        return address
+
+    def update_cache(self, address: Address, announced: bool = False):
+        expires_at = None if self._ttl is None else time.monotonic() + self._ttl
+        announced = announced and address.target not in self._cache
+        self._cache[address.target] = (address, expires_at, announced)
+        self._cache.move_to_end(address.target)
+        while len(self._cache) > self._capacity:
+            self._cache.popitem(last=False)
+            self._evictions += 1
+
+    def invalidate(self, target: str):
+        if self._cache.pop(target, None) is not None:
+            self._invalidations += 1
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        return self._evictions
+
+    @property
+    def invalidations(self) -> int:
+        return self._invalidations
+
+    @property
+    def queries_avoided(self) -> int:
+        return self._queries_avoided
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self._hits + self._misses
+        return self._hits / lookups if lookups else 0.0
 
-    def update_cache(self, address: Address):
-        self._cache[address.target] = address
+    def __repr__(self) -> str:
+        return f"AddressCache(size={len(self._cache)}, capacity={self._capacity}, hits={self._hits}, " \
+               f"misses={self._misses}, evictions={self._evictions}, invalidations={self._invalidations}, " \
+               f"queries_avoided={self._queries_avoided})"
@@ -0,0 +1,22 @@
+from redcomet.base.actor.message import MessageAbstract
+from redcomet.base.messaging.address import Address
+
+
+class AddressAnnouncement(MessageAbstract):
+    __slots__ = ("_address",)
+
+    def __init__(self, address: Address):
+        self._address = address
+
+    @property
+    def address(self) -> Address:
+        return self._address
+
+    def __repr__(self) -> str:
+        return f"AddressAnnouncement({self._address!r})"
+
+    def __eq__(self, other):
+        if self.__class__ != other.__class__:
+            return False
+        assert isinstance(other, AddressAnnouncement)
+        return self._address == other._address
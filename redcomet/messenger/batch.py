@@ -0,0 +1,37 @@
+from typing import List
+
+from redcomet.base.messaging.content import PacketContentAbstract
+from redcomet.base.messaging.packet import Packet
+from redcomet.messenger.multicast import Multicast
+
+
+class PacketBatch(PacketContentAbstract):
+    __slots__ = ("_packets",)
+
+    def __init__(self, packets: List[Packet]):
+        self._packets = packets
+
+    @property
+    def packets(self) -> List[Packet]:
+        return self._packets
+
+    def __len__(self) -> int:
+        return len(self._packets)
+
+    def __repr__(self) -> str:
+        return f"PacketBatch({self._packets!r})"
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return False
+        assert isinstance(other, PacketBatch)
+        return self._packets == other._packets
+
+
+def message_count(packet: Packet) -> int:
+    content = packet.content
+    if content.__class__ is PacketBatch:
+        return sum(message_count(inner) for inner in content.packets)
+    if content.__class__ is Multicast:
+        return len(content)
+    return 1
@@ -0,0 +1,2 @@
+from .lease import pin_buffer, BufferPin
+from .transfer import SharedBufferTransfer
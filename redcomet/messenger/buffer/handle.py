@@ -0,0 +1,21 @@
+class SharedBufferHandle:
+    def __init__(self, name: str, size: int):
+        self._name = name
+        self._size = size
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def __repr__(self) -> str:
+        return f"SharedBufferHandle({self._name!r}, {self._size!r})"
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return False
+        assert isinstance(other, SharedBufferHandle)
+        return self._name == other._name and self._size == other._size
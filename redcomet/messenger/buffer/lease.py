@@ -0,0 +1,90 @@
+import threading
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Dict, Optional
+
+from redcomet.messenger.buffer.handle import SharedBufferHandle
+
+_active_leases: Dict[int, 'SharedBufferLease'] = {}
+
+
+class SharedBufferLease:
+    def __init__(self, memory: SharedMemory, handle: SharedBufferHandle):
+        self._memory = memory
+        self._handle = handle
+        self._view = memory.buf[:handle.size].toreadonly()
+        self._references = 1
+        self._lock = threading.Lock()
+        self._transferred = False
+        _active_leases[id(self._view)] = self
+
+    @classmethod
+    def attach(cls, handle: SharedBufferHandle) -> 'SharedBufferLease':
+        return cls(SharedMemory(name=handle.name), handle)
+
+    @property
+    def view(self) -> memoryview:
+        return self._view
+
+    def retain(self):
+        with self._lock:
+            self._references += 1
+
+    def release(self):
+        with self._lock:
+            self._references -= 1
+            free = self._references == 0
+        if free:
+            self._free()
+
+    def transfer(self) -> Optional[SharedBufferHandle]:
+        with self._lock:
+            if self._transferred:
+                return None
+            self._transferred = True
+        return self._handle
+
+    def _free(self):
+        del _active_leases[id(self._view)]
+        self._view.release()
+        self._memory.close()
+        if self._transferred:
+            untrack(self._memory)
+        else:
+            self._memory.unlink()
+
+
+class BufferPin:
+    def __init__(self, lease: SharedBufferLease):
+        self._lease = lease
+
+    @property
+    def view(self) -> memoryview:
+        return self._lease.view
+
+    def release(self):
+        if self._lease is not None:
+            self._lease.release()
+            self._lease = None
+
+    def __enter__(self) -> 'BufferPin':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.release()
+
+
+def find_lease(view: memoryview) -> Optional[SharedBufferLease]:
+    return _active_leases.get(id(view))
+
+
+def pin_buffer(view: memoryview) -> BufferPin:
+    lease = find_lease(view)
+    if lease is None:
+        raise ValueError("buffer is not a shared buffer of the message being received")
+    lease.retain()
+    return BufferPin(lease)
+
+
+def untrack(memory: SharedMemory):
+    resource_tracker.unregister(memory._name, "shared_memory")
@@ -0,0 +1,102 @@
+import copy
+from multiprocessing.shared_memory import SharedMemory
+from typing import List, Optional
+
+from redcomet.base.actor.message import MessageAbstract
+from redcomet.base.messaging.content import PacketContentAbstract
+from redcomet.base.messaging.packet import Packet
+from redcomet.messenger.batch import PacketBatch
+from redcomet.messenger.buffer.handle import SharedBufferHandle
+from redcomet.messenger.buffer.lease import SharedBufferLease, find_lease, untrack
+from redcomet.messenger.request import MessageForwardRequest, MessageForwardBatch
+
+
+class SharedBufferTransfer:
+    def __init__(self, min_size: int = 64 * 1024):
+        self._min_size = min_size
+
+    def export(self, packet: Packet) -> Packet:
+        content = packet.content
+        if content.__class__ is PacketBatch:
+            packets = [self.export(inner) for inner in content.packets]
+            if all(exported is inner for exported, inner in zip(packets, content.packets)):
+                return packet
+            return Packet(PacketBatch(packets), sender=packet.sender, receiver=packet.receiver)
+        if content.__class__ is MessageForwardBatch:
+            requests = [self._export_content(request) for request in content.requests]
+            if all(exported is request for exported, request in zip(requests, content.requests)):
+                return packet
+            return Packet(MessageForwardBatch(requests), sender=packet.sender, receiver=packet.receiver)
+
+        exported = self._export_content(content)
+        if exported is content:
+            return packet
+        return Packet(exported, sender=packet.sender, receiver=packet.receiver)
+
+    def _export_content(self, content: PacketContentAbstract) -> PacketContentAbstract:
+        message = _buffered_message(content)
+        if message is None:
+            return content
+
+        exported = None
+        for field in message.buffer_fields:
+            handle = self._export_value(getattr(message, field, None))
+            if handle is not None:
+                exported = exported or copy.copy(message)
+                setattr(exported, field, handle)
+        if exported is None:
+            return content
+
+        if isinstance(content, MessageForwardRequest):
+            return MessageForwardRequest(exported, content.sender_id, content.receiver_id, content.backpressure)
+        return exported
+
+    def _export_value(self, value) -> Optional[SharedBufferHandle]:
+        if isinstance(value, memoryview):
+            lease = find_lease(value)
+            if lease is not None:
+                handle = lease.transfer()
+                if handle is not None:
+                    return handle
+                return self._copy(value)
+        try:
+            view = memoryview(value)
+        except TypeError:
+            return None
+        if view.nbytes < self._min_size:
+            return None
+        return self._copy(view)
+
+    @staticmethod
+    def _copy(view: memoryview) -> SharedBufferHandle:
+        memory = SharedMemory(create=True, size=view.nbytes)
+        if view.c_contiguous:
+            memory.buf[:view.nbytes] = view.cast("B")
+        else:
+            memory.buf[:view.nbytes] = view.tobytes()
+        handle = SharedBufferHandle(memory.name, view.nbytes)
+        memory.close()
+        untrack(memory)
+        return handle
+
+    def attach(self, packet: Packet) -> List[SharedBufferLease]:
+        message = packet.content
+        if not isinstance(message, MessageAbstract) or not message.buffer_fields:
+            return []
+
+        leases = []
+        for field in message.buffer_fields:
+            handle = getattr(message, field, None)
+            if isinstance(handle, SharedBufferHandle):
+                lease = SharedBufferLease.attach(handle)
+                setattr(message, field, lease.view)
+                leases.append(lease)
+        return leases
+
+
+def _buffered_message(content: PacketContentAbstract) -> Optional[MessageAbstract]:
+    if isinstance(content, MessageForwardRequest):
+        content = content.message
+    if isinstance(content, MessageAbstract) and content.buffer_fields:
+        return content
+    return None
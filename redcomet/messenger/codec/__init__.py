@@ -0,0 +1,2 @@
+from .compact import CompactCodec
+from .default import PickleCodec
@@ -0,0 +1,191 @@
+import pickle
+import struct
+from typing import Dict, List, Any, Tuple, Optional
+
+from redcomet.base.messaging.address import Address
+from redcomet.base.messaging.codec import PacketCodecAbstract
+from redcomet.base.messaging.content import PacketContentAbstract
+from redcomet.base.messaging.packet import Packet
+
+_U8 = struct.Struct("!B")
+_U16 = struct.Struct("!H")
+
+_FORMAT_PICKLE = 0
+_FORMAT_COMPACT = 1
+
+_NODE_NONE = 0
+_NODE_LOCAL = 1
+_NODE_ANYWHERE = 2
+_NODE_INTERNED = 3
+_NODE_STRING = 4
+
+_TARGET_INTERNED = 0
+_TARGET_UUID = 1
+_TARGET_STRING = 2
+
+_DEFAULT_IDS = ("messenger", "manager", "main", "cluster", "discovery")
+_MAX_ENTRIES = 0xFFFF
+
+
+class CompactCodec(PacketCodecAbstract):
+    def __init__(self):
+        self._ids: List[str] = []
+        self._id_indices: Dict[str, int] = {}
+        self._types: List[type] = [type(None)]
+        self._type_ids: Dict[type, int] = {}
+        self._type_fields: List[Tuple[str, ...]] = [()]
+
+        for value in _DEFAULT_IDS:
+            self.intern(value)
+
+    def intern(self, value: str):
+        if value in self._id_indices:
+            return
+        if len(self._ids) >= _MAX_ENTRIES:
+            raise OverflowError("too many interned ids")
+        self._id_indices[value] = len(self._ids)
+        self._ids.append(value)
+
+    def register_type(self, cls: type):
+        if cls in self._type_ids:
+            return
+        if len(self._types) >= _MAX_ENTRIES:
+            raise OverflowError("too many registered types")
+        self._type_ids[cls] = len(self._types)
+        self._types.append(cls)
+        self._type_fields.append(_slot_fields(cls))
+
+    def encode(self, packet: Packet) -> bytes:
+        sender, receiver = packet.sender, packet.receiver
+        if not isinstance(sender, Address) or not isinstance(receiver, Address):
+            return _encode_pickle(packet)
+
+        data = bytearray(_U8.pack(_FORMAT_COMPACT))
+        try:
+            self._encode_address(data, sender)
+            self._encode_address(data, receiver)
+        except struct.error:
+            return _encode_pickle(packet)
+
+        content = packet.content
+        type_id = self._type_ids.get(content.__class__, 0)
+        data += _U16.pack(type_id)
+        if type_id == 0:
+            data += pickle.dumps(content, protocol=5)
+        else:
+            data += pickle.dumps(_get_state(content, self._type_fields[type_id]), protocol=5)
+        return bytes(data)
+
+    def decode(self, data: bytes) -> Packet:
+        view = memoryview(data)
+        if view[0] == _FORMAT_PICKLE:
+            return pickle.loads(view[1:])
+
+        sender, offset = self._decode_address(view, 1)
+        receiver, offset = self._decode_address(view, offset)
+        type_id = _U16.unpack_from(view, offset)[0]
+        payload = pickle.loads(view[offset + _U16.size:])
+        if type_id == 0:
+            content = payload
+        else:
+            content = _restore(self._types[type_id], self._type_fields[type_id], payload)
+        return Packet(content, sender=sender, receiver=receiver)
+
+    def _encode_address(self, data: bytearray, address: Address):
+        if address.is_local():
+            node_kind, node_data = _NODE_LOCAL, b""
+        elif address.is_global():
+            node_kind, node_data = _NODE_ANYWHERE, b""
+        elif address.node_id is None:
+            node_kind, node_data = _NODE_NONE, b""
+        elif address.node_id in self._id_indices:
+            node_kind, node_data = _NODE_INTERNED, _U16.pack(self._id_indices[address.node_id])
+        else:
+            encoded = address.node_id.encode()
+            node_kind, node_data = _NODE_STRING, _U16.pack(len(encoded)) + encoded
+
+        target = address.target
+        if target in self._id_indices:
+            target_kind, target_data = _TARGET_INTERNED, _U16.pack(self._id_indices[target])
+        else:
+            raw = _uuid_bytes(target)
+            if raw is not None:
+                target_kind, target_data = _TARGET_UUID, raw
+            else:
+                encoded = target.encode()
+                target_kind, target_data = _TARGET_STRING, _U16.pack(len(encoded)) + encoded
+
+        data += _U8.pack(node_kind << 4 | target_kind)
+        data += node_data
+        data += target_data
+
+    def _decode_address(self, view: memoryview, offset: int) -> Tuple[Address, int]:
+        flags = view[offset]
+        offset += 1
+        node_kind, target_kind = flags >> 4, flags & 0x0F
+
+        node_id = None
+        if node_kind == _NODE_INTERNED:
+            node_id = self._ids[_U16.unpack_from(view, offset)[0]]
+            offset += _U16.size
+        elif node_kind == _NODE_STRING:
+            length = _U16.unpack_from(view, offset)[0]
+            node_id = str(view[offset + _U16.size:offset + _U16.size + length], "utf-8")
+            offset += _U16.size + length
+
+        if target_kind == _TARGET_INTERNED:
+            target = self._ids[_U16.unpack_from(view, offset)[0]]
+            offset += _U16.size
+        elif target_kind == _TARGET_UUID:
+            target = view[offset:offset + 16].hex()
+            offset += 16
+        else:
+            length = _U16.unpack_from(view, offset)[0]
+            target = str(view[offset + _U16.size:offset + _U16.size + length], "utf-8")
+            offset += _U16.size + length
+
+        if node_kind == _NODE_LOCAL:
+            return Address.on_local(target), offset
+        if node_kind == _NODE_ANYWHERE:
+            return Address.anywhere(target), offset
+        return Address(node_id, target), offset
+
+
+def _encode_pickle(packet: Packet) -> bytes:
+    return _U8.pack(_FORMAT_PICKLE) + pickle.dumps(packet, protocol=5)
+
+
+def _uuid_bytes(target: str):
+    if len(target) != 32:
+        return None
+    try:
+        raw = bytes.fromhex(target)
+    except ValueError:
+        return None
+    if len(raw) != 16 or raw.hex() != target:
+        return None
+    return raw
+
+
+def _slot_fields(cls: type) -> Tuple[str, ...]:
+    fields = []
+    for klass in reversed(cls.__mro__):
+        slots = klass.__dict__.get("__slots__", ())
+        for name in (slots,) if isinstance(slots, str) else slots:
+            if name not in ("__dict__", "__weakref__"):
+                fields.append(name)
+    return tuple(fields)
+
+
+def _get_state(content: PacketContentAbstract, fields: Tuple[str, ...]) -> Tuple[Tuple[Any, ...], Optional[dict]]:
+    return tuple(getattr(content, name) for name in fields), getattr(content, "__dict__", None)
+
+
+def _restore(cls: type, fields: Tuple[str, ...], state: Tuple[Tuple[Any, ...], Optional[dict]]) -> PacketContentAbstract:
+    values, attributes = state
+    content = cls.__new__(cls)
+    for name, value in zip(fields, values):
+        object.__setattr__(content, name, value)
+    if attributes:
+        content.__dict__.update(attributes)
+    return content
@@ -0,0 +1,12 @@
+import pickle
+
+from redcomet.base.messaging.codec import PacketCodecAbstract
+from redcomet.base.messaging.packet import Packet
+
+
+class PickleCodec(PacketCodecAbstract):
+    def encode(self, packet: Packet) -> bytes:
+        return pickle.dumps(packet, protocol=5)
+
+    def decode(self, data: bytes) -> Packet:
+        return pickle.loads(data)
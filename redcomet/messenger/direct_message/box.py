@@ -1,17 +1,40 @@
-from queue import Queue, Empty
+import time
+from queue import SimpleQueue, Empty
 
 from redcomet.base.actor.message import MessageAbstract
 
 
 class DirectMessageBox:
-    def __init__(self):
-        self._queue = Queue()
+    __slots__ = ("_queue", "_ref_id")
+
+    def __init__(self, ref_id: str = None):
+        self._queue = SimpleQueue()
+        self._ref_id = ref_id
 
     def get(self, timeout: float) -> MessageAbstract:
-        try:
-            return self._queue.get(timeout=timeout)
-        except Empty:
-            raise TimeoutError()
+        deadline = None
+        while True:
+            try:
+                item = self._queue.get(timeout=timeout)
+            except Empty:
+                raise TimeoutError()
+            if item.ref_id == self._ref_id:
+                return item
+            if timeout is not None:
+                deadline = deadline or time.monotonic() + timeout
+                timeout = max(deadline - time.monotonic(), 0.0)
 
     def put(self, item: MessageAbstract):
         self._queue.put(item)
+
+    def reset(self, ref_id: str):
+        self._ref_id = ref_id
+        while not self._queue.empty():
+            try:
+                self._queue.get_nowait()
+            except Empty:
+                break
+
+    @property
+    def ref_id(self) -> str:
+        return self._ref_id
@@ -1,15 +1,17 @@
-import uuid
-from threading import Lock
-from typing import Dict, Optional
+import itertools
+import os
+from typing import Dict, List, Optional
 
 from redcomet.base.messenger.direct_message.ref import DirectMessageBoxRefAbstract
 from redcomet.messenger.direct_message.box import DirectMessageBox
 
 
 class DirectMessageManager:
-    def __init__(self):
+    def __init__(self, max_free_boxes: int = 1024):
         self._boxes: Dict[str, DirectMessageBox] = {}
-        self._lock = Lock()
+        self._free_boxes: List[DirectMessageBox] = []
+        self._max_free_boxes = max_free_boxes
+        self._counter = itertools.count()
 
     def create_message_box(self) -> DirectMessageBoxRefAbstract:
         ref_id = self._generate_ref_id()
@@ -18,25 +20,30 @@ class DirectMessageManager:
         from redcomet.messenger.direct_message.ref import DirectMessageBoxRef
         return DirectMessageBoxRef(ref_id, box, self)
 
-    def get_message_box(self, ref_id: str) -> DirectMessageBox:
-        with self._lock:
-            box = self._boxes.get(ref_id, None)
-        return box
+    def get_message_box(self, ref_id: str) -> Optional[DirectMessageBox]:
+        return self._boxes.get(ref_id)
 
     def destroy_message_box(self, ref_id: str):
-        with self._lock:
-            if ref_id in self._boxes:
-                del self._boxes[ref_id]
+        box = self._boxes.pop(ref_id, None)
+        if box is not None and len(self._free_boxes) < self._max_free_boxes:
+            self._free_boxes.append(box)
 
     def _generate_ref_id(self) -> str:
-        while True:
-            ref_id = uuid.uuid4().hex
-            with self._lock:
-                if ref_id not in self._boxes:
-                    return ref_id
-
-    def _create_box(self, ref_id: str) -> Optional[DirectMessageBox]:
-        with self._lock:
-            box = DirectMessageBox()
-            self._boxes[ref_id] = box
+        return f"{os.getpid()}.{next(self._counter)}"
+
+    def _create_box(self, ref_id: str) -> DirectMessageBox:
+        try:
+            box = self._free_boxes.pop()
+        except IndexError:
+            box = DirectMessageBox(ref_id)
+        else:
+            box.reset(ref_id)
+        self._boxes[ref_id] = box
         return box
+
+    def __len__(self) -> int:
+        return len(self._boxes)
+
+    @property
+    def n_free_boxes(self) -> int:
+        return len(self._free_boxes)
@@ -1,28 +1,59 @@
+from redcomet.base.messaging.codec import PacketCodecAbstract
+from redcomet.base.messaging.endpoint import EndpointAbstract
 from redcomet.implementation.messenger.inbox.queue.process_safe import ProcessSafeQueueManager
 from redcomet.messenger import Messenger
 from redcomet.messenger.address_cache import AddressCache
+from redcomet.messenger.buffer import SharedBufferTransfer
 from redcomet.messenger.direct_message.manager import DirectMessageManager
 from redcomet.messenger.handler import PacketHandler
 from redcomet.messenger.handler.executor.actor import ActorExecutorAbstract
 from redcomet.messenger.handler.executor.messenger_command import MessengerCommandExecutor
+from redcomet.messenger.inbox.asynchronous import AsyncioInbox
 from redcomet.messenger.inbox.process_safe import ProcessSafeInbox
 from redcomet.messenger.inbox.queue import QueueAbstract, QueueManagerAbstract
+from redcomet.messenger.inbox.stream import StreamInbox
 from redcomet.messenger.inbox.synchronous import SynchronousInbox
 from redcomet.messenger.outbox import Outbox
+from redcomet.messenger.pending import PendingMessages, PendingOverflow
+from redcomet.messenger.reply.registry import ReplyRegistry
+from redcomet.messenger.transport.endpoint import TcpEndpoint, UnixEndpoint
+from redcomet.messenger.transport.kind import Transport
 
 
 def create_messenger(handler: ActorExecutorAbstract, address_cache: AddressCache = None, *,
                      actor_id: str = "messenger", inbox_queue_manager: QueueManagerAbstract = None,
-                     inbox_queue: QueueAbstract = None, parallel: bool = False) -> Messenger:
+                     inbox_queue: QueueAbstract = None, parallel: bool = False, asynchronous: bool = False,
+                     batch_size: int = 1, batch_wait_us: int = 0, codec: PacketCodecAbstract = None,
+                     shared_buffer_min_size: int = 64 * 1024, address_cache_capacity: int = 65536,
+                     address_cache_ttl: float = None, pending_capacity: int = 100_000,
+                     pending_timeout: float = None,
+                     pending_overflow: PendingOverflow = PendingOverflow.DROP_NEWEST,
+                     transport: Transport = Transport.QUEUE, listen: EndpointAbstract = None,
+                     inbox_capacity: int = None, spill_directory: str = None,
+                     unclaimed_replies: QueueAbstract = None, authkey: bytes = None) -> Messenger:
     direct_message_manager = DirectMessageManager()
-    handler = PacketHandler(handler, MessengerCommandExecutor(direct_message_manager))
+    reply_registry = ReplyRegistry()
+    handler = PacketHandler(handler, MessengerCommandExecutor(direct_message_manager, reply_registry,
+                                                              unclaimed_replies=unclaimed_replies))
 
-    if not parallel:
+    if transport is not Transport.QUEUE:
+        if asynchronous:
+            raise ValueError("socket transports do not support asynchronous nodes")
+        if listen is None:
+            listen = TcpEndpoint("127.0.0.1", 0) if transport is Transport.TCP else UnixEndpoint()
+        inbox = StreamInbox(listen, handler, codec=codec, authkey=authkey)
+    elif not parallel and not asynchronous:
         inbox = SynchronousInbox(handler)
     else:
         inbox_queue_manager = inbox_queue_manager or ProcessSafeQueueManager()
         inbox_queue = inbox_queue or inbox_queue_manager.start()
-        inbox = ProcessSafeInbox(inbox_queue_manager, inbox_queue, handler)
+        inbox_type = AsyncioInbox if asynchronous else ProcessSafeInbox
+        inbox = inbox_type(inbox_queue_manager, inbox_queue, handler,
+                           batch_size=batch_size, batch_wait_us=batch_wait_us, codec=codec,
+                           buffer_transfer=SharedBufferTransfer(shared_buffer_min_size), capacity=inbox_capacity)
 
-    return Messenger(actor_id, inbox, Outbox(), address_cache=address_cache,
-                     direct_message_manager=direct_message_manager)
+    if address_cache is None:
+        address_cache = AddressCache(address_cache_capacity, address_cache_ttl)
+    return Messenger(actor_id, inbox, Outbox(spill_directory=spill_directory), address_cache=address_cache,
+                     direct_message_manager=direct_message_manager, reply_registry=reply_registry,
+                     pending_messages=PendingMessages(pending_capacity, pending_timeout, pending_overflow))
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Callable, Optional
 
 from redcomet.base.actor.abstract import ActorAbstract
 from redcomet.base.messaging.address import Address
@@ -11,6 +12,18 @@ class ActorExecutorAbstract(ABC):
     def register(self, local_id: str, actor: ActorAbstract):
         pass
 
+    def unregister(self, local_id: str, forward_to: str = None) -> Optional[ActorAbstract]:
+        raise NotImplementedError()
+
+    def migrate(self, local_id: str, node_id: str, hand_off: Callable[[ActorAbstract], None]):
+        raise NotImplementedError()
+
     @abstractmethod
     def execute(self, message: PacketContentAbstract, sender: Address, local_actor_id: str):
         pass
+
+    def passivate_idle_actors(self, now: float = None):
+        pass
+
+    def shutdown(self):
+        pass
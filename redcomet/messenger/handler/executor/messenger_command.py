@@ -3,11 +3,17 @@ from redcomet.base.messaging.packet import Packet
 from redcomet.messenger.direct_message.manager import DirectMessageManager
 from redcomet.messenger.inbox.exception import StopReceiveLoopException
 from redcomet.messenger.inbox.message import StopReceiveLoop
+from redcomet.messenger.inbox.queue import QueueAbstract
+from redcomet.messenger.reply.registry import ReplyRegistry, is_reply_target
+from redcomet.messenger.reply.unclaimed import UnclaimedReply
 
 
 class MessengerCommandExecutor:
-    def __init__(self, direct_message_manager: DirectMessageManager):
+    def __init__(self, direct_message_manager: DirectMessageManager, reply_registry: ReplyRegistry = None,
+                 unclaimed_replies: QueueAbstract = None):
         self._direct_message_manager = direct_message_manager
+        self._reply_registry = reply_registry if reply_registry is not None else ReplyRegistry()
+        self._unclaimed_replies = unclaimed_replies
 
     def filter_packet(self, packet: Packet) -> bool:
         content = packet.content
@@ -15,7 +21,14 @@ class MessengerCommandExecutor:
             box = self._direct_message_manager.get_message_box(content.ref_id)
             if box is not None:
                 box.put(content)
+            elif self._unclaimed_replies is not None:
+                self._unclaimed_replies.put(UnclaimedReply(content))
             return True
         elif isinstance(packet.content, StopReceiveLoop):
             raise StopReceiveLoopException()
+        elif is_reply_target(packet.receiver.target):
+            if not self._reply_registry.resolve(packet.receiver.target, content) \
+                    and self._unclaimed_replies is not None:
+                self._unclaimed_replies.put(UnclaimedReply(content, packet.receiver.target))
+            return True
         return False
@@ -1,8 +1,11 @@
 from redcomet.base.messaging.content import PacketContentAbstract
 from redcomet.base.messaging.handler import PacketHandlerAbstract
 from redcomet.base.messaging.packet import Packet
+from redcomet.messenger.batch import PacketBatch
 from redcomet.messenger.handler.executor.actor import ActorExecutorAbstract
 from redcomet.messenger.handler.executor.messenger_command import MessengerCommandExecutor
+from redcomet.messenger.multicast import Multicast
+from redcomet.messenger.outbox import batched
 
 
 class PacketHandler(PacketHandlerAbstract):
@@ -11,7 +14,15 @@ class PacketHandler(PacketHandlerAbstract):
         self._messenger_command_executor = messenger_command_executor
 
     def handle(self, packet: Packet):
-        if self._messenger_command_executor.filter_packet(packet):
+        if packet.content.__class__ is PacketBatch:
+            with batched():
+                for inner in packet.content.packets:
+                    self.handle(inner)
+        elif packet.content.__class__ is Multicast:
+            with batched():
+                for receiver_id in packet.content.receiver_ids:
+                    self._actor_executor.execute(packet.content.message, packet.sender, receiver_id)
+        elif self._messenger_command_executor.filter_packet(packet):
             pass
         else:
             content = packet.content
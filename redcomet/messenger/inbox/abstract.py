@@ -14,6 +14,13 @@ class InboxAbstract(ABC):
     def receive(self, packet: Packet):
         pass
 
+    def offer(self, packet: Packet, block: bool = True, timeout: float = None) -> bool:
+        self.receive(packet)
+        return True
+
+    def depth(self) -> int:
+        return 0
+
     def receive_loop(self):
         pass
 
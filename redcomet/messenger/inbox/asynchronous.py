@@ -0,0 +1,68 @@
+import asyncio
+from typing import List
+
+from redcomet.base.messaging.packet import Packet
+from redcomet.messenger.buffer.lease import SharedBufferLease
+from redcomet.messenger.inbox.exception import StopReceiveLoopException
+from redcomet.messenger.inbox.process_safe import ProcessSafeInbox
+from redcomet.tracing import get_tracer
+
+_inbox_trace = get_tracer("inbox")
+
+
+class AsyncioInbox(ProcessSafeInbox):
+
+    def receive_loop(self):
+        asyncio.run(self._receive_loop())
+
+    async def _receive_loop(self):
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                self._handle_batch(await loop.run_in_executor(None, self._get_batch))
+        except StopReceiveLoopException:
+            pass
+        await self._join_pending_tasks()
+        _inbox_trace.info("receive loop stopped, batch sizes %r", self.batch_size_distribution)
+
+    def _handle_with_buffers(self, packet: Packet):
+        leases = self._buffer_transfer.attach(packet)
+        if not leases:
+            self._handler.handle(packet)
+            return
+
+        running = asyncio.all_tasks()
+        try:
+            self._handler.handle(packet)
+        except BaseException:
+            _release(leases)
+            raise
+
+        started = asyncio.all_tasks() - running
+        if not started:
+            _release(leases)
+            return
+
+        remaining = [len(started)]
+
+        def on_done(_):
+            remaining[0] -= 1
+            if remaining[0] == 0:
+                _release(leases)
+
+        for task in started:
+            task.add_done_callback(on_done)
+
+    @staticmethod
+    async def _join_pending_tasks():
+        current = asyncio.current_task()
+        while True:
+            tasks = [task for task in asyncio.all_tasks() if task is not current]
+            if not tasks:
+                return
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def _release(leases: List[SharedBufferLease]):
+    for lease in leases:
+        lease.release()
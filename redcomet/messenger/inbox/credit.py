@@ -0,0 +1,53 @@
+import time
+from multiprocessing import BoundedSemaphore, Lock
+from typing import Any
+
+
+class InboxCredits:
+    def __init__(self, capacity: int):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+
+        self._capacity = capacity
+        self._semaphore = BoundedSemaphore(capacity)
+        self._lock = Lock()
+
+    def acquire(self, block: bool = True, timeout: float = None, n: int = 1) -> bool:
+        if n == 1:
+            return self._semaphore.acquire(block, timeout)
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        if not self._lock.acquire(block, timeout):
+            return False
+        try:
+            for acquired in range(n):
+                remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+                if not self._semaphore.acquire(block, remaining):
+                    self.release(acquired)
+                    return False
+            return True
+        finally:
+            self._lock.release()
+
+    def release(self, n: int = 1):
+        for _ in range(n):
+            self._semaphore.release()
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def available(self) -> int:
+        return self._semaphore.get_value()
+
+
+class CreditedItem:
+    __slots__ = ("item", "credits")
+
+    def __init__(self, item: Any, credits: int = 1):
+        self.item = item
+        self.credits = credits
+
+    def __reduce__(self):
+        return CreditedItem, (self.item, self.credits)
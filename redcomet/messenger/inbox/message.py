@@ -2,6 +2,8 @@ from redcomet.base.messaging.content import PacketContentAbstract
 
 
 class StopReceiveLoop(PacketContentAbstract):
+    __slots__ = ()
+
     def __repr__(self) -> str:
         return "StopReceiveLoop()"
 
@@ -1,36 +1,129 @@
-import multiprocessing
+from typing import Any, List, Optional
 
+from redcomet.base.messaging.codec import PacketCodecAbstract
 from redcomet.base.messaging.handler import PacketHandlerAbstract
 from redcomet.base.messaging.packet import Packet
+from redcomet.messenger.batch import PacketBatch, message_count
+from redcomet.messenger.buffer import SharedBufferTransfer
 from redcomet.messenger.inbox import InboxAbstract
+from redcomet.messenger.inbox.credit import InboxCredits, CreditedItem
 from redcomet.messenger.inbox.exception import StopReceiveLoopException
 from redcomet.messenger.inbox.message import StopReceiveLoop
 from redcomet.messenger.inbox.queue import QueueAbstract, QueueManagerAbstract
+from redcomet.messenger.inbox.statistics import BatchSizeDistribution
+from redcomet.messenger.outbox import batched
+from redcomet.tracing import get_tracer
+
+_trace = get_tracer("packet")
+_inbox_trace = get_tracer("inbox")
 
 
 class ProcessSafeInbox(InboxAbstract):
-    def __init__(self, manager: QueueManagerAbstract, queue: QueueAbstract, handler: PacketHandlerAbstract = None):
+    def __init__(self, manager: QueueManagerAbstract, queue: QueueAbstract, handler: PacketHandlerAbstract = None,
+                 batch_size: int = 1, batch_wait_us: int = 0, codec: PacketCodecAbstract = None,
+                 buffer_transfer: SharedBufferTransfer = None, capacity: int = None):
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+
         self._manager = manager
         self._queue = queue
         self._handler = handler
+        self._batch_size = batch_size
+        self._batch_wait = batch_wait_us / 1_000_000
+        self._batch_sizes = BatchSizeDistribution()
+        self._codec = codec
+        self._buffer_transfer = buffer_transfer
+        self._credits = InboxCredits(capacity) if capacity is not None else None
 
     def set_handler(self, handler: PacketHandlerAbstract):
         self._handler = handler
 
     def receive(self, packet: Packet):
-        self._queue.put(packet)
+        if self._buffer_transfer is not None:
+            packet = self._buffer_transfer.export(packet)
+        self._queue.put(self._encode(packet))
+
+    def offer(self, packet: Packet, block: bool = True, timeout: float = None) -> bool:
+        if self._credits is None:
+            self.receive(packet)
+            return True
+        credits = min(message_count(packet), self._credits.capacity)
+        if not self._credits.acquire(block, timeout, credits):
+            return False
+        if self._buffer_transfer is not None:
+            packet = self._buffer_transfer.export(packet)
+        self._queue.put(CreditedItem(self._encode(packet), credits))
+        return True
+
+    def depth(self) -> int:
+        try:
+            return self._queue.qsize()
+        except NotImplementedError:
+            return 0
 
     def receive_loop(self):
-        while True:
-            packet = self._queue.get(block=True)
-            print(multiprocessing.current_process().name, "RECV", packet)
-            try:
+        try:
+            while True:
+                self._handle_batch(self._get_batch())
+        except StopReceiveLoopException:
+            pass
+        _inbox_trace.info("receive loop stopped, batch sizes %r", self._batch_sizes)
+
+    def _get_batch(self) -> List[Packet]:
+        if self._batch_size == 1:
+            items = [self._queue.get(block=True)]
+        else:
+            items = self._queue.get_batch(self._batch_size, wait=self._batch_wait, block=True)
+        self._batch_sizes.record(len(items))
+        return [self._decode(self._release_credit(item)) for item in items]
+
+    def _release_credit(self, item: Any) -> Any:
+        if item.__class__ is CreditedItem:
+            self._credits.release(item.credits)
+            return item.item
+        return item
+
+    def _handle_batch(self, packets):
+        for packet in packets:
+            if packet.content.__class__ is PacketBatch:
+                with batched():
+                    self._handle_batch(packet.content.packets)
+                continue
+            if _trace.debug_enabled:
+                _trace.debug("RECV %r", packet)
+            if self._buffer_transfer is None:
                 self._handler.handle(packet)
-            except StopReceiveLoopException:
-                break
+            else:
+                self._handle_with_buffers(packet)
+
+    def _handle_with_buffers(self, packet: Packet):
+        leases = self._buffer_transfer.attach(packet)
+        try:
+            self._handler.handle(packet)
+        finally:
+            for lease in leases:
+                lease.release()
+
+    def _encode(self, packet: Packet) -> Any:
+        if self._codec is None:
+            return packet
+        return self._codec.encode(packet)
+
+    def _decode(self, item: Any) -> Packet:
+        if self._codec is None:
+            return item
+        return self._codec.decode(item)
+
+    @property
+    def credits(self) -> Optional[InboxCredits]:
+        return self._credits
+
+    @property
+    def batch_size_distribution(self) -> BatchSizeDistribution:
+        return self._batch_sizes
 
     def stop_receive_loop(self):
-        self._queue.put(Packet(StopReceiveLoop(), sender=..., receiver=...))
+        self.receive(Packet(StopReceiveLoop(), sender=..., receiver=...))
 
     def close(self):
         self._manager.shutdown()
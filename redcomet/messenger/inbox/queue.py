@@ -1,5 +1,7 @@
+import time
 from abc import ABC, abstractmethod
-from typing import Any
+from queue import Empty
+from typing import Any, Callable, List
 
 
 class QueueAbstract(ABC):
@@ -11,6 +13,12 @@ class QueueAbstract(ABC):
     def get(self, block: bool = True, timeout: float = None) -> Any:
         pass
 
+    def get_batch(self, max_size: int, wait: float = 0.0, block: bool = True, timeout: float = None) -> List[Any]:
+        return drain_batch(self.get, max_size, wait=wait, block=block, timeout=timeout)
+
+    def qsize(self) -> int:
+        raise NotImplementedError()
+
 
 class QueueManagerAbstract(ABC):
 
@@ -27,3 +35,19 @@ class QueueManagerAbstract(ABC):
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.shutdown()
+
+
+def drain_batch(get: Callable[..., Any], max_size: int, wait: float = 0.0, block: bool = True,
+                timeout: float = None) -> List[Any]:
+    items = [get(block=block, timeout=timeout)]
+    deadline = time.monotonic() + wait
+    while len(items) < max_size:
+        remaining = deadline - time.monotonic()
+        try:
+            if remaining > 0:
+                items.append(get(block=True, timeout=remaining))
+            else:
+                items.append(get(block=False))
+        except Empty:
+            break
+    return items
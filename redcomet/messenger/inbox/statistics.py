@@ -0,0 +1,30 @@
+from typing import Dict
+
+
+class BatchSizeDistribution:
+    def __init__(self):
+        self._counts: Dict[int, int] = {}
+
+    def record(self, size: int):
+        self._counts[size] = self._counts.get(size, 0) + 1
+
+    @property
+    def counts(self) -> Dict[int, int]:
+        return dict(self._counts)
+
+    @property
+    def n_batches(self) -> int:
+        return sum(self._counts.values())
+
+    @property
+    def n_items(self) -> int:
+        return sum(size * count for size, count in self._counts.items())
+
+    @property
+    def mean(self) -> float:
+        n_batches = self.n_batches
+        return self.n_items / n_batches if n_batches else 0.0
+
+    def __repr__(self) -> str:
+        return f"BatchSizeDistribution(n_batches={self.n_batches}, mean={self.mean:.2f}, " \
+               f"counts={dict(sorted(self._counts.items()))!r})"
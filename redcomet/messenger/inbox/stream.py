@@ -0,0 +1,185 @@
+import os
+import selectors
+import socket
+import threading
+from collections import deque
+from multiprocessing import AuthenticationError
+from typing import Deque, Dict, List, Optional
+
+from redcomet.base.messaging.codec import PacketCodecAbstract
+from redcomet.base.messaging.endpoint import EndpointAbstract
+from redcomet.base.messaging.handler import PacketHandlerAbstract
+from redcomet.base.messaging.packet import Packet
+from redcomet.messenger.codec.default import PickleCodec
+from redcomet.messenger.inbox import InboxAbstract
+from redcomet.messenger.inbox.exception import StopReceiveLoopException
+from redcomet.messenger.inbox.message import StopReceiveLoop
+from redcomet.messenger.inbox.statistics import BatchSizeDistribution
+from redcomet.messenger.transport.auth import ServerHandshake
+from redcomet.messenger.transport.connection import StreamConnection, cork
+from redcomet.messenger.transport.frame import FrameDecoder
+from redcomet.tracing import get_tracer
+
+_trace = get_tracer("packet")
+_inbox_trace = get_tracer("inbox")
+
+_RECV_SIZE = 256 * 1024
+
+
+class RemoteStreamInbox(InboxAbstract):
+    def __init__(self, endpoint: EndpointAbstract, codec: PacketCodecAbstract = None,
+                 max_buffer_size: int = 256 * 1024):
+        self._codec = codec or PickleCodec()
+        self._max_buffer_size = max_buffer_size
+        self._connection = StreamConnection(endpoint, max_buffer_size)
+
+    def set_handler(self, handler: PacketHandlerAbstract):
+        raise NotImplementedError()
+
+    def receive(self, packet: Packet):
+        self._connection.send(self._codec.encode(packet))
+
+    def stop_receive_loop(self):
+        self.receive(Packet(StopReceiveLoop(), sender=..., receiver=...))
+
+    @property
+    def endpoint(self) -> EndpointAbstract:
+        return self._connection.endpoint
+
+    @property
+    def connection(self) -> StreamConnection:
+        return self._connection
+
+    def close(self):
+        self._connection.close()
+
+
+class StreamInbox(RemoteStreamInbox):
+    def __init__(self, endpoint: EndpointAbstract, handler: PacketHandlerAbstract = None,
+                 codec: PacketCodecAbstract = None, max_buffer_size: int = 256 * 1024, authkey: bytes = None):
+        if authkey is not None:
+            endpoint = endpoint.with_authkey(authkey)
+        self._listener, endpoint = endpoint.listen(backlog=128)
+        super().__init__(endpoint, codec=codec, max_buffer_size=max_buffer_size)
+
+        self._authkey = authkey
+
+        self._handler = handler
+        self._batch_sizes = BatchSizeDistribution()
+        self._local: Deque[Packet] = deque()
+        self._loop_pid: Optional[int] = None
+        self._loop_thread: Optional[int] = None
+        self._handshakes: Dict[socket.socket, ServerHandshake] = {}
+
+    def set_handler(self, handler: PacketHandlerAbstract):
+        self._handler = handler
+
+    def receive(self, packet: Packet):
+        if self._loop_thread == threading.get_ident() and self._loop_pid == os.getpid():
+            self._local.append(packet)
+        else:
+            super().receive(packet)
+
+    def depth(self) -> int:
+        return len(self._local)
+
+    def remote(self, endpoint: EndpointAbstract) -> RemoteStreamInbox:
+        if self._authkey is not None:
+            endpoint = endpoint.with_authkey(self._authkey)
+        return RemoteStreamInbox(endpoint, codec=self._codec, max_buffer_size=self._max_buffer_size)
+
+    def receive_loop(self):
+        self._loop_pid = os.getpid()
+        self._loop_thread = threading.get_ident()
+        selector = selectors.DefaultSelector()
+        selector.register(self._listener, selectors.EVENT_READ)
+        decoders: Dict[socket.socket, FrameDecoder] = {}
+        try:
+            while True:
+                self._handle_local()
+                for key, _ in selector.select(timeout=0 if self._local else None):
+                    if key.fileobj is self._listener:
+                        self._accept(selector, decoders)
+                    else:
+                        self._read(key.fileobj, selector, decoders)
+        except StopReceiveLoopException:
+            pass
+        finally:
+            for sock in decoders:
+                sock.close()
+            self._handshakes.clear()
+            selector.close()
+            self._loop_thread = None
+        _inbox_trace.info("receive loop stopped, batch sizes %r", self._batch_sizes)
+
+    def _accept(self, selector: selectors.BaseSelector, decoders: Dict[socket.socket, FrameDecoder]):
+        sock, _ = self._listener.accept()
+        self.endpoint.configure(sock)
+        authkey = self.endpoint.authkey
+        if authkey is not None:
+            try:
+                self._handshakes[sock] = ServerHandshake(sock, authkey)
+            except OSError:
+                sock.close()
+                return
+        decoders[sock] = FrameDecoder()
+        selector.register(sock, selectors.EVENT_READ)
+
+    def _read(self, sock: socket.socket, selector: selectors.BaseSelector,
+              decoders: Dict[socket.socket, FrameDecoder]):
+        try:
+            data = sock.recv(_RECV_SIZE)
+        except ConnectionError:
+            data = b""
+        if data and sock in self._handshakes:
+            data = self._authenticate(sock, data)
+            if data is not None and not data:
+                return
+        if not data:
+            self._disconnect(sock, selector, decoders)
+            return
+        frames = decoders[sock].feed(data)
+        if frames:
+            self._handle_batch([self._codec.decode(frame) for frame in frames])
+
+    def _authenticate(self, sock: socket.socket, data: bytes) -> Optional[bytes]:
+        try:
+            data = self._handshakes[sock].feed(data)
+        except AuthenticationError:
+            _inbox_trace.warning("rejected unauthenticated connection from %r", sock.getpeername())
+            return None
+        if data is None:
+            return b""
+        del self._handshakes[sock]
+        return data
+
+    def _disconnect(self, sock: socket.socket, selector: selectors.BaseSelector,
+                    decoders: Dict[socket.socket, FrameDecoder]):
+        selector.unregister(sock)
+        del decoders[sock]
+        self._handshakes.pop(sock, None)
+        sock.close()
+
+    def _handle_local(self):
+        packets: List[Packet] = []
+        for _ in range(len(self._local)):
+            packets.append(self._local.popleft())
+        if packets:
+            self._handle_batch(packets)
+
+    def _handle_batch(self, packets: List[Packet]):
+        self._batch_sizes.record(len(packets))
+        with cork():
+            for packet in packets:
+                if _trace.debug_enabled:
+                    _trace.debug("RECV %r", packet)
+                self._handler.handle(packet)
+
+    @property
+    def batch_size_distribution(self) -> BatchSizeDistribution:
+        return self._batch_sizes
+
+    def close(self):
+        super().close()
+        self._listener.close()
+        self.endpoint.release()
@@ -1,4 +1,5 @@
-from typing import Dict, List
+from concurrent.futures import Future
+from typing import ContextManager, Dict, Iterable, List, Optional, Tuple
 
 from redcomet.base.actor import ActorRefAbstract
 from redcomet.base.actor.abstract import ActorAbstract
@@ -6,29 +7,42 @@ from redcomet.base.actor.message import MessageAbstract
 from redcomet.base.cluster.ref import ClusterRefAbstract
 from redcomet.base.discovery.ref import ActorDiscoveryRefAbstract
 from redcomet.base.messaging.address import Address
+from redcomet.base.messaging.endpoint import EndpointAbstract
 from redcomet.base.messaging.packet import Packet
 from redcomet.base.messenger.abstract import MessengerAbstract
+from redcomet.base.messenger.backpressure import Backpressure
 from redcomet.base.messenger.direct_message.ref import DirectMessageBoxRefAbstract
 from redcomet.messenger.address_cache import AddressCache
+from redcomet.messenger.announce import AddressAnnouncement
 from redcomet.messenger.direct_message.manager import DirectMessageManager
 from redcomet.messenger.inbox import InboxAbstract
-from redcomet.messenger.outbox import Outbox
-from redcomet.messenger.request import MessageForwardRequest
+from redcomet.messenger.inbox.stream import StreamInbox
+from redcomet.messenger.multicast import Multicast
+from redcomet.messenger.outbox import Outbox, batched
+from redcomet.messenger.pending import PendingMessages
+from redcomet.messenger.remote import RemoteMessenger
+from redcomet.messenger.reply.registry import ReplyRegistry
+from redcomet.messenger.reply.unclaimed import UnclaimedReply
+from redcomet.messenger.request import MessageForwardRequest, MessageForwardBatch, MulticastRequest
+
+_MULTICAST_TARGET = "__multicast"
 
 
 class Messenger(ActorAbstract, MessengerAbstract):
     def __init__(self, actor_id: str, inbox: InboxAbstract, outbox: Outbox, address_cache: AddressCache = None,
                  node_id: str = None, discovery: ActorDiscoveryRefAbstract = None,
-                 direct_message_manager: DirectMessageManager = None):
+                 direct_message_manager: DirectMessageManager = None, pending_messages: PendingMessages = None,
+                 reply_registry: ReplyRegistry = None):
         self._actor_id = actor_id
         self._inbox = inbox
         self._outbox = outbox
         self._node_id = node_id
         self._discovery = discovery
 
-        self._address_cache = address_cache or AddressCache()
-        self._pending_messages: Dict[str, List[MessageForwardRequest]] = {}
+        self._address_cache = address_cache if address_cache is not None else AddressCache()
+        self._pending_messages = pending_messages if pending_messages is not None else PendingMessages()
         self._direct_message_manager = direct_message_manager
+        self._reply_registry = reply_registry if reply_registry is not None else ReplyRegistry()
 
     def assign_node_id(self, node_id: str):
         self._node_id = node_id
@@ -42,8 +56,18 @@ class Messenger(ActorAbstract, MessengerAbstract):
                 cluster: ClusterRefAbstract):
         if isinstance(message, MessageForwardRequest):
             self._forward_or_query_address(message)
+        elif isinstance(message, MessageForwardBatch):
+            with batched():
+                for request in message.requests:
+                    self._forward_or_query_address(request)
+        elif isinstance(message, MulticastRequest):
+            self._multicast(message)
+        elif isinstance(message, AddressAnnouncement):
+            self._address_cache.update_cache(message.address, announced=True)
         elif self._discovery.call_on_query_address_response(message, self._query_address_response):
             pass
+        elif self._discovery.call_on_address_invalidated(message, self._address_cache.invalidate):
+            pass
         else:
             raise NotImplementedError()
 
@@ -51,15 +75,51 @@ class Messenger(ActorAbstract, MessengerAbstract):
         receiver = self._address_cache.get_address(message.receiver_id)
         if receiver is not None:
             self._forward(message, Address(self._node_id, message.sender_id), receiver)
-        else:
-            self._store_message(message, wait_for_address=message.receiver_id)
+        elif self._pending_messages.add(message.receiver_id, message):
             self._query_address_request(message.receiver_id)
 
+    def _multicast(self, message: MulticastRequest):
+        targets: Dict[str, List[str]] = {}
+        for receiver_id in message.receiver_ids:
+            receiver = self._address_cache.get_address(receiver_id)
+            if receiver is not None:
+                targets.setdefault(receiver.node_id, []).append(receiver.target)
+            else:
+                self._forward_or_query_address(MessageForwardRequest(message.message, message.sender_id, receiver_id,
+                                                                     message.backpressure))
+
+        sender = Address(self._node_id, message.sender_id)
+        for node_id, receiver_ids in targets.items():
+            if len(receiver_ids) == 1:
+                packet = Packet(message.message, sender=sender, receiver=Address(node_id, receiver_ids[0]))
+            else:
+                packet = Packet(Multicast(message.message, receiver_ids), sender=sender,
+                                receiver=Address(node_id, _MULTICAST_TARGET))
+            self._outbox.send(packet, message.backpressure)
+
     def _forward(self, message: MessageForwardRequest, sender: Address, receiver: Address):
-        self.send_packet(Packet(message.message, sender=sender, receiver=receiver))
+        self._outbox.send(Packet(message.message, sender=sender, receiver=receiver), message.backpressure)
 
-    def send(self, message: MessageAbstract, sender_id: str, receiver_id: str):
-        packet = Packet(MessageForwardRequest(message, sender_id, receiver_id),
+    def send(self, message: MessageAbstract, sender_id: str, receiver_id: str,
+             backpressure: Backpressure = Backpressure.BLOCK):
+        packet = Packet(MessageForwardRequest(message, sender_id, receiver_id, backpressure),
+                        sender=Address.on_local(sender_id),
+                        receiver=Address.on_local(self._actor_id))
+
+        self.send_packet(packet)
+
+    def send_many(self, messages: Iterable[Tuple[MessageAbstract, str, str, Backpressure]]):
+        requests = [MessageForwardRequest(message, sender_id, receiver_id, backpressure)
+                    for message, sender_id, receiver_id, backpressure in messages]
+        packet = Packet(MessageForwardBatch(requests),
+                        sender=Address.on_local(self._actor_id),
+                        receiver=Address.on_local(self._actor_id))
+
+        self.send_packet(packet)
+
+    def multicast(self, message: MessageAbstract, sender_id: str, receiver_ids: Iterable[str],
+                  backpressure: Backpressure = Backpressure.BLOCK):
+        packet = Packet(MulticastRequest(message, sender_id, list(receiver_ids), backpressure),
                         sender=Address.on_local(sender_id),
                         receiver=Address.on_local(self._actor_id))
 
@@ -68,25 +128,84 @@ class Messenger(ActorAbstract, MessengerAbstract):
     def send_packet(self, packet: Packet):
         self._outbox.send(packet)
 
+    def forward_packet(self, packet: Packet):
+        self._outbox.forward(packet)
+
+    def batch(self) -> ContextManager:
+        return batched()
+
+    def ask(self, message: MessageAbstract, receiver: Address, timeout: float = None,
+            backpressure: Backpressure = Backpressure.BLOCK) -> Future:
+        correlation_id, future = self._reply_registry.register(timeout)
+        if receiver.is_global():
+            self.send(message, correlation_id, receiver.target, backpressure)
+        else:
+            self.send_packet(Packet(message, sender=Address.on_local(correlation_id), receiver=receiver))
+        return future
+
+    def claim_reply(self, reply: UnclaimedReply) -> bool:
+        if reply.correlation_id is not None:
+            return self._reply_registry.resolve(reply.correlation_id, reply.message)
+        box = self._direct_message_manager.get_message_box(reply.message.ref_id)
+        if box is None:
+            return False
+        box.put(reply.message)
+        return True
+
+    def announce_address(self, address: Address):
+        self._address_cache.update_cache(address)
+        for node_id in self._outbox.node_ids:
+            if node_id != self._node_id:
+                self.send_packet(Packet(AddressAnnouncement(address), sender=Address.on_local(self._actor_id),
+                                        receiver=Address(node_id, self._actor_id)))
+
+    def connected_node_ids(self) -> List[str]:
+        return self._outbox.node_ids
+
     def make_connection_to(self, other: MessengerAbstract):
         if other is self:
             raise NotImplementedError
-        if not isinstance(other, Messenger):
+        if not isinstance(other, (Messenger, RemoteMessenger)):
             raise TypeError("Messenger can only connect with another messenger")
-        self._outbox.register_inbox(other._inbox, other.node_id)
+        self._outbox.register_inbox(other.inbox, other.node_id)
 
-    def _store_message(self, message: MessageForwardRequest, wait_for_address: str):
-        self._pending_messages[wait_for_address] = self._pending_messages.get(wait_for_address, []) + [message]
+    def connect_remote(self, node_id: str, endpoint: EndpointAbstract):
+        if not isinstance(self._inbox, StreamInbox):
+            raise NotImplementedError()
+        self._outbox.register_inbox(self._inbox.remote(endpoint), node_id)
+
+    @property
+    def inbox(self) -> InboxAbstract:
+        return self._inbox
+
+    @property
+    def endpoint(self) -> Optional[EndpointAbstract]:
+        if isinstance(self._inbox, StreamInbox):
+            return self._inbox.endpoint
+        return None
 
     def _query_address_request(self, target: str):
         self._discovery.query_address(target, self._node_id, self._actor_id)
 
     def _query_address_response(self, target: str, address: Address):
+        messages = self._pending_messages.pop(target)
         if address is not None:
             self._address_cache.update_cache(address)
-            for message in self._pending_messages.get(target, []):
-                self._forward(message, Address(self._node_id, message.sender_id), address)
-        self._pending_messages[target] = []
+            with batched():
+                for message in messages:
+                    self._forward(message, Address(self._node_id, message.sender_id), address)
+
+    @property
+    def address_cache(self) -> AddressCache:
+        return self._address_cache
+
+    @property
+    def reply_registry(self) -> ReplyRegistry:
+        return self._reply_registry
+
+    @property
+    def pending_messages(self) -> PendingMessages:
+        return self._pending_messages
 
     @property
     def actor_id(self) -> str:
@@ -99,6 +218,22 @@ class Messenger(ActorAbstract, MessengerAbstract):
     def create_direct_message_box(self) -> DirectMessageBoxRefAbstract:
         return self._direct_message_manager.create_message_box()
 
+    def inbox_depth(self) -> int:
+        return self._inbox.depth()
+
+    def node_queue_depth(self, receiver_id: str) -> Optional[int]:
+        receiver = self._address_cache.get_address(receiver_id)
+        if receiver is None:
+            return None
+        return self._outbox.depth(receiver.node_id)
+
+    def blocked_send_time(self) -> float:
+        return self._outbox.blocked_time
+
+    @property
+    def outbox(self) -> Outbox:
+        return self._outbox
+
     def start_receive_loop(self):
         self._inbox.receive_loop()
 
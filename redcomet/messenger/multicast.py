@@ -0,0 +1,32 @@
+from typing import List
+
+from redcomet.base.actor.message import MessageAbstract
+from redcomet.base.messaging.content import PacketContentAbstract
+
+
+class Multicast(PacketContentAbstract):
+    __slots__ = ("_message", "_receiver_ids")
+
+    def __init__(self, message: MessageAbstract, receiver_ids: List[str]):
+        self._message = message
+        self._receiver_ids = receiver_ids
+
+    @property
+    def message(self) -> MessageAbstract:
+        return self._message
+
+    @property
+    def receiver_ids(self) -> List[str]:
+        return self._receiver_ids
+
+    def __len__(self) -> int:
+        return len(self._receiver_ids)
+
+    def __repr__(self) -> str:
+        return f"Multicast({self._message!r}, receiver_ids={self._receiver_ids!r})"
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return False
+        assert isinstance(other, Multicast)
+        return self._message == other._message and self._receiver_ids == other._receiver_ids
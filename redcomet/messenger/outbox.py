@@ -1,14 +1,49 @@
-import multiprocessing
-from typing import Dict, Optional
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Tuple
 
+from redcomet.base.messaging.address import Address
 from redcomet.base.messaging.packet import Packet
+from redcomet.base.messenger.backpressure import Backpressure
+from redcomet.messenger.batch import PacketBatch, message_count
 from redcomet.messenger.inbox import InboxAbstract
+from redcomet.messenger.spill import SpillBuffer
+from redcomet.tracing import get_tracer
+
+_trace = get_tracer("packet")
+
+_BATCH_TARGET = "__batch"
+
+_batching = threading.local()
+
+
+@contextmanager
+def batched():
+    if getattr(_batching, "outboxes", None) is not None:
+        yield
+        return
+    _batching.outboxes = {}
+    try:
+        yield
+    finally:
+        outboxes: Dict[Outbox, Dict[Tuple[str, Backpressure], List[Packet]]] = _batching.outboxes
+        _batching.outboxes = None
+        for outbox, batches in outboxes.items():
+            outbox.flush_batch(batches)
 
 
 class Outbox:
-    def __init__(self, node_id: str = None):
+    def __init__(self, node_id: str = None, spill_directory: str = None):
         self._node_id = node_id
         self._inboxes: Dict[str, InboxAbstract] = {}
+        self._spill_directory = spill_directory
+        self._spills: Dict[str, SpillBuffer] = {}
+
+        self._blocked_time = 0.0
+        self._blocked_sends = 0
+        self._dropped = 0
+        self._spilled = 0
 
     def assign_node_id(self, node_id: str):
         if self._node_id is not None:
@@ -16,17 +51,97 @@ class Outbox:
                 raise NotImplementedError()
         self._node_id = node_id
 
-    def send(self, packet: Packet):
-        print(multiprocessing.current_process().name, "SEND", packet)
+    def send(self, packet: Packet, backpressure: Backpressure = None):
+        if _trace.debug_enabled:
+            _trace.debug("SEND %r", packet)
         packet.set_sender_node_id(self._node_id)
         if packet.is_local_receiver():
             packet.set_receiver_node_id(self._node_id)
-        self._find_inbox(packet.receiver.node_id).receive(packet)
+        self._enqueue(packet.receiver.node_id or self._node_id, packet, backpressure)
+
+    def forward(self, packet: Packet):
+        if _trace.debug_enabled:
+            _trace.debug("FORWARD %r", packet)
+        self._enqueue(packet.receiver.node_id, packet)
+
+    def _enqueue(self, node_id: str, packet: Packet, backpressure: Backpressure = None):
+        outboxes = getattr(_batching, "outboxes", None)
+        if outboxes is not None:
+            outboxes.setdefault(self, {}).setdefault((node_id, backpressure), []).append(packet)
+            return
+        self._deliver(node_id, packet, backpressure)
 
-    def _find_inbox(self, node_id: Optional[str]) -> InboxAbstract:
-        return self._inboxes.get(node_id or self._node_id)
+    def flush_batch(self, batches: Dict[Tuple[str, Backpressure], List[Packet]]):
+        for (node_id, backpressure), packets in batches.items():
+            if len(packets) > 1:
+                packets = [Packet(PacketBatch(packets), sender=packets[0].sender,
+                                  receiver=Address(node_id, _BATCH_TARGET))]
+            self._deliver(node_id, packets[0], backpressure)
+
+    def _deliver(self, node_id: str, packet: Packet, backpressure: Backpressure = None):
+        inbox = self._inboxes.get(node_id)
+        if backpressure is None or node_id == self._node_id:
+            inbox.receive(packet)
+        elif backpressure is Backpressure.BLOCK:
+            self._send_or_block(inbox, packet)
+        elif backpressure is Backpressure.DROP:
+            self._send_or_drop(inbox, packet)
+        elif backpressure is Backpressure.SPILL:
+            self._send_or_spill(inbox, node_id, packet)
+        else:
+            raise NotImplementedError()
+
+    def _send_or_block(self, inbox: InboxAbstract, packet: Packet):
+        if inbox.offer(packet, block=False):
+            return
+        started = time.monotonic()
+        inbox.offer(packet)
+        self._blocked_time += time.monotonic() - started
+        self._blocked_sends += 1
+
+    def _send_or_drop(self, inbox: InboxAbstract, packet: Packet):
+        if inbox.offer(packet, block=False):
+            return
+        self._dropped += message_count(packet)
+        if _trace.debug_enabled:
+            _trace.debug("inbox full, dropping %r", packet)
+
+    def _send_or_spill(self, inbox: InboxAbstract, node_id: str, packet: Packet):
+        spill = self._spills.get(node_id)
+        if (spill is None or not len(spill)) and inbox.offer(packet, block=False):
+            return
+        if spill is None:
+            spill = self._spills[node_id] = SpillBuffer(inbox, self._spill_directory)
+        spill.add(packet)
+        self._spilled += message_count(packet)
 
     def register_inbox(self, inbox: InboxAbstract, node_id: str):
         if node_id in self._inboxes:
             raise NotImplementedError()
         self._inboxes[node_id] = inbox
+
+    def depth(self, node_id: str) -> int:
+        inbox = self._inboxes.get(node_id)
+        if inbox is None:
+            return 0
+        return inbox.depth()
+
+    @property
+    def node_ids(self) -> List[str]:
+        return list(self._inboxes)
+
+    @property
+    def blocked_time(self) -> float:
+        return self._blocked_time
+
+    @property
+    def blocked_sends(self) -> int:
+        return self._blocked_sends
+
+    @property
+    def dropped(self) -> int:
+        return self._dropped
+
+    @property
+    def spilled(self) -> int:
+        return self._spilled
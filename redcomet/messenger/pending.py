@@ -0,0 +1,127 @@
+import time
+from collections import deque
+from enum import Enum
+from typing import Deque, Dict, Iterable, Optional, Tuple
+
+from redcomet.messenger.request import MessageForwardRequest
+from redcomet.tracing import get_tracer
+
+_trace = get_tracer("messenger")
+
+
+class PendingOverflow(Enum):
+    DROP_NEWEST = "drop_newest"
+    DROP_OLDEST = "drop_oldest"
+
+
+class PendingMessages:
+    def __init__(self, capacity: int = 100_000, timeout: float = None,
+                 overflow: PendingOverflow = PendingOverflow.DROP_NEWEST):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+
+        self._capacity = capacity
+        self._timeout = timeout
+        self._overflow = overflow
+        self._messages: Dict[str, Deque[MessageForwardRequest]] = {}
+        self._queried_at: Dict[str, float] = {}
+        self._order: Optional[Deque[Tuple[str, MessageForwardRequest]]] = \
+            deque() if overflow is PendingOverflow.DROP_OLDEST else None
+        self._size = 0
+
+        self._queries = 0
+        self._coalesced = 0
+        self._dropped = 0
+        self._expired = 0
+
+    def add(self, target: str, message: MessageForwardRequest) -> bool:
+        if self._timeout is not None:
+            self._expire_overdue()
+        messages = self._messages.get(target)
+        should_query = messages is None
+        if should_query:
+            messages = self._messages[target] = deque()
+            self._queries += 1
+            if self._timeout is not None:
+                self._queried_at[target] = time.monotonic()
+        else:
+            self._coalesced += 1
+
+        if self._size >= self._capacity:
+            if self._order is None:
+                self._drop(target, message)
+                return should_query
+            self._drop_oldest()
+        messages.append(message)
+        self._size += 1
+        if self._order is not None:
+            self._order.append((target, message))
+            if len(self._order) > 2 * self._capacity:
+                self._compact_order()
+        return should_query
+
+    def pop(self, target: str) -> Iterable[MessageForwardRequest]:
+        self._queried_at.pop(target, None)
+        messages = self._messages.pop(target, None)
+        if self._timeout is not None:
+            self._expire_overdue()
+        if messages is None:
+            return ()
+        self._size -= len(messages)
+        return messages
+
+    def _expire_overdue(self):
+        deadline = time.monotonic() - self._timeout
+        while self._queried_at:
+            target, queried_at = next(iter(self._queried_at.items()))
+            if queried_at > deadline:
+                return
+            del self._queried_at[target]
+            self._expire(target, self._messages.pop(target))
+
+    def _expire(self, target: str, messages: Deque[MessageForwardRequest]):
+        _trace.warning("query for %r timed out, dropping %d pending messages", target, len(messages))
+        self._expired += len(messages)
+        self._size -= len(messages)
+
+    def _drop_oldest(self):
+        while self._order:
+            target, message = self._order.popleft()
+            messages = self._messages.get(target)
+            if messages and messages[0] is message:
+                messages.popleft()
+                self._size -= 1
+                self._drop(target, message)
+                return
+
+    def _compact_order(self):
+        pending = {id(message) for messages in self._messages.values() for message in messages}
+        self._order = deque(entry for entry in self._order if id(entry[1]) in pending)
+
+    def _drop(self, target: str, message: MessageForwardRequest):
+        self._dropped += 1
+        if _trace.debug_enabled:
+            _trace.debug("pending messages full, dropping %r to %r", message, target)
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def queries(self) -> int:
+        return self._queries
+
+    @property
+    def coalesced(self) -> int:
+        return self._coalesced
+
+    @property
+    def dropped(self) -> int:
+        return self._dropped
+
+    @property
+    def expired(self) -> int:
+        return self._expired
+
+    def __repr__(self) -> str:
+        return f"PendingMessages(size={self._size}, capacity={self._capacity}, queries={self._queries}, " \
+               f"coalesced={self._coalesced}, dropped={self._dropped}, expired={self._expired})"
@@ -0,0 +1,53 @@
+from typing import Optional
+
+from redcomet.base.actor.message import MessageAbstract
+from redcomet.base.discovery.ref import ActorDiscoveryRefAbstract
+from redcomet.base.messaging.endpoint import EndpointAbstract
+from redcomet.base.messaging.packet import Packet
+from redcomet.base.messenger.abstract import MessengerAbstract
+from redcomet.base.messenger.backpressure import Backpressure
+from redcomet.base.messenger.direct_message.ref import DirectMessageBoxRefAbstract
+from redcomet.messenger.inbox.stream import RemoteStreamInbox
+
+
+class RemoteMessenger(MessengerAbstract):
+    def __init__(self, inbox: RemoteStreamInbox, node_id: str = None):
+        self._inbox = inbox
+        self._node_id = node_id
+
+    def send(self, message: MessageAbstract, sender_id: str, receiver_id: str,
+             backpressure: Backpressure = Backpressure.BLOCK):
+        raise NotImplementedError()
+
+    def send_packet(self, packet: Packet):
+        self._inbox.receive(packet)
+
+    def assign_node_id(self, node_id: str):
+        self._node_id = node_id
+
+    def bind_discovery(self, ref: ActorDiscoveryRefAbstract):
+        raise NotImplementedError()
+
+    def make_connection_to(self, other: MessengerAbstract):
+        raise NotImplementedError()
+
+    def create_direct_message_box(self) -> DirectMessageBoxRefAbstract:
+        raise NotImplementedError()
+
+    @property
+    def inbox(self) -> RemoteStreamInbox:
+        return self._inbox
+
+    @property
+    def node_id(self) -> str:
+        return self._node_id
+
+    @property
+    def endpoint(self) -> Optional[EndpointAbstract]:
+        return self._inbox.endpoint
+
+    def stop_receive_loop(self):
+        self._inbox.stop_receive_loop()
+
+    def close(self):
+        self._inbox.close()
@@ -0,0 +1,72 @@
+import heapq
+import itertools
+import os
+import threading
+import time
+from concurrent.futures import Future
+from typing import Dict, List, Tuple
+
+from redcomet.base.actor.message import MessageAbstract
+
+REPLY_PREFIX = "__reply."
+
+
+def is_reply_target(target: str) -> bool:
+    return target.startswith(REPLY_PREFIX)
+
+
+class ReplyRegistry:
+    def __init__(self):
+        self._futures: Dict[str, Future] = {}
+        self._deadlines: List[Tuple[float, str]] = []
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._sweeper = None
+
+    def register(self, timeout: float = None) -> Tuple[str, Future]:
+        correlation_id = f"{REPLY_PREFIX}{os.getpid()}.{next(self._counter)}"
+        future = Future()
+        with self._condition:
+            self._futures[correlation_id] = future
+            if timeout is not None:
+                heapq.heappush(self._deadlines, (time.monotonic() + timeout, correlation_id))
+                self._ensure_sweeper()
+                self._condition.notify()
+        return correlation_id, future
+
+    def resolve(self, correlation_id: str, message: MessageAbstract) -> bool:
+        with self._condition:
+            future = self._futures.pop(correlation_id, None)
+        if future is None:
+            return False
+        if not future.cancelled():
+            future.set_result(message)
+        return True
+
+    def discard(self, correlation_id: str):
+        with self._condition:
+            self._futures.pop(correlation_id, None)
+
+    def _ensure_sweeper(self):
+        if self._sweeper is None or not self._sweeper.is_alive():
+            self._sweeper = threading.Thread(target=self._sweep, daemon=True)
+            self._sweeper.start()
+
+    def _sweep(self):
+        with self._condition:
+            while True:
+                if not self._deadlines:
+                    self._condition.wait()
+                    continue
+                deadline, correlation_id = self._deadlines[0]
+                remaining = deadline - time.monotonic()
+                if remaining > 0:
+                    self._condition.wait(remaining)
+                    continue
+                heapq.heappop(self._deadlines)
+                future = self._futures.pop(correlation_id, None)
+                if future is not None and not future.cancelled():
+                    future.set_exception(TimeoutError())
+
+    def __len__(self) -> int:
+        return len(self._futures)
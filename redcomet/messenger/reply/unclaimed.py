@@ -0,0 +1,22 @@
+from typing import Optional
+
+from redcomet.base.actor.message import MessageAbstract
+
+
+class UnclaimedReply(MessageAbstract):
+    __slots__ = ("_message", "_correlation_id")
+
+    def __init__(self, message: MessageAbstract, correlation_id: Optional[str] = None):
+        self._message = message
+        self._correlation_id = correlation_id
+
+    @property
+    def message(self) -> MessageAbstract:
+        return self._message
+
+    @property
+    def correlation_id(self) -> Optional[str]:
+        return self._correlation_id
+
+    def __repr__(self) -> str:
+        return f"UnclaimedReply({self._message!r}, correlation_id={self._correlation_id!r})"
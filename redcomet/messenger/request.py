@@ -1,11 +1,19 @@
+import sys
+from typing import List
+
 from redcomet.base.actor.message import MessageAbstract
+from redcomet.base.messenger.backpressure import Backpressure
 
 
 class MessageForwardRequest(MessageAbstract):
-    def __init__(self, message: MessageAbstract, sender_id: str, receiver_id: str):
+    __slots__ = ("_message", "_sender_id", "_receiver_id", "_backpressure")
+
+    def __init__(self, message: MessageAbstract, sender_id: str, receiver_id: str,
+                 backpressure: Backpressure = Backpressure.BLOCK):
         self._message = message
-        self._sender_id = sender_id
-        self._receiver_id = receiver_id
+        self._sender_id = sys.intern(sender_id)
+        self._receiver_id = sys.intern(receiver_id)
+        self._backpressure = backpressure
 
     @property
     def message(self) -> MessageAbstract:
@@ -19,9 +27,13 @@ class MessageForwardRequest(MessageAbstract):
     def receiver_id(self) -> str:
         return self._receiver_id
 
+    @property
+    def backpressure(self) -> Backpressure:
+        return self._backpressure
+
     def __repr__(self) -> str:
         return f"MessageForwardRequest({self._message!r}, sender_id={self._sender_id!r}, " \
-               f"receiver_id={self.receiver_id!r})"
+               f"receiver_id={self.receiver_id!r}, backpressure={self._backpressure!r})"
 
     def __eq__(self, other):
         if self.__class__ != other.__class__:
@@ -29,4 +41,65 @@ class MessageForwardRequest(MessageAbstract):
         assert isinstance(other, MessageForwardRequest)
         return (self._message == other._message
                 and self._sender_id == other._sender_id
-                and self._receiver_id == other._receiver_id)
+                and self._receiver_id == other._receiver_id
+                and self._backpressure == other._backpressure)
+
+
+class MessageForwardBatch(MessageAbstract):
+    __slots__ = ("_requests",)
+
+    def __init__(self, requests: List[MessageForwardRequest]):
+        self._requests = requests
+
+    @property
+    def requests(self) -> List[MessageForwardRequest]:
+        return self._requests
+
+    def __repr__(self) -> str:
+        return f"MessageForwardBatch({self._requests!r})"
+
+    def __eq__(self, other):
+        if self.__class__ != other.__class__:
+            return False
+        assert isinstance(other, MessageForwardBatch)
+        return self._requests == other._requests
+
+
+class MulticastRequest(MessageAbstract):
+    __slots__ = ("_message", "_sender_id", "_receiver_ids", "_backpressure")
+
+    def __init__(self, message: MessageAbstract, sender_id: str, receiver_ids: List[str],
+                 backpressure: Backpressure = Backpressure.BLOCK):
+        self._message = message
+        self._sender_id = sys.intern(sender_id)
+        self._receiver_ids = receiver_ids
+        self._backpressure = backpressure
+
+    @property
+    def message(self) -> MessageAbstract:
+        return self._message
+
+    @property
+    def sender_id(self) -> str:
+        return self._sender_id
+
+    @property
+    def receiver_ids(self) -> List[str]:
+        return self._receiver_ids
+
+    @property
+    def backpressure(self) -> Backpressure:
+        return self._backpressure
+
+    def __repr__(self) -> str:
+        return f"MulticastRequest({self._message!r}, sender_id={self._sender_id!r}, " \
+               f"receiver_ids={self._receiver_ids!r}, backpressure={self._backpressure!r})"
+
+    def __eq__(self, other):
+        if self.__class__ != other.__class__:
+            return False
+        assert isinstance(other, MulticastRequest)
+        return (self._message == other._message
+                and self._sender_id == other._sender_id
+                and self._receiver_ids == other._receiver_ids
+                and self._backpressure == other._backpressure)
@@ -0,0 +1,62 @@
+import pickle
+import struct
+import tempfile
+import threading
+
+from redcomet.base.messaging.packet import Packet
+from redcomet.messenger.inbox import InboxAbstract
+from redcomet.tracing import get_tracer
+
+_trace = get_tracer("messenger")
+
+_LENGTH = struct.Struct("I")
+
+
+class SpillBuffer:
+    def __init__(self, inbox: InboxAbstract, directory: str = None):
+        self._inbox = inbox
+        self._file = tempfile.TemporaryFile(dir=directory)
+        self._lock = threading.Lock()
+        self._ready = threading.Semaphore(0)
+        self._read_offset = 0
+        self._write_offset = 0
+        self._size = 0
+        self._thread = None
+
+    def add(self, packet: Packet):
+        data = pickle.dumps(packet, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._file.seek(self._write_offset)
+            self._file.write(_LENGTH.pack(len(data)))
+            self._file.write(data)
+            self._write_offset = self._file.tell()
+            self._size += 1
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._drain, daemon=True)
+                self._thread.start()
+        self._ready.release()
+
+    def _drain(self):
+        while True:
+            self._ready.acquire()
+            packet = self._pop()
+            self._inbox.offer(packet)
+            with self._lock:
+                self._size -= 1
+            if _trace.debug_enabled:
+                _trace.debug("delivered spilled %r", packet)
+
+    def _pop(self) -> Packet:
+        with self._lock:
+            self._file.seek(self._read_offset)
+            length = _LENGTH.unpack(self._file.read(_LENGTH.size))[0]
+            data = self._file.read(length)
+            self._read_offset += _LENGTH.size + length
+            if self._read_offset == self._write_offset:
+                self._file.seek(0)
+                self._file.truncate()
+                self._read_offset = self._write_offset = 0
+        return pickle.loads(data)
+
+    def __len__(self) -> int:
+        return self._size
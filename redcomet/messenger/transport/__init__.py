@@ -0,0 +1,2 @@
+from .endpoint import TcpEndpoint, UnixEndpoint
+from .kind import Transport
@@ -0,0 +1,49 @@
+import hashlib
+import hmac
+import os
+import socket
+from multiprocessing import AuthenticationError, current_process
+from typing import Optional
+
+_NONCE_SIZE = 32
+_HANDSHAKE_TIMEOUT = 5.0
+
+
+def default_authkey() -> bytes:
+    return bytes(current_process().authkey)
+
+
+def _digest(authkey: bytes, nonce: bytes) -> bytes:
+    return hmac.new(authkey, nonce, hashlib.sha256).digest()
+
+
+def answer_challenge(sock: socket.socket, authkey: bytes):
+    timeout = sock.gettimeout()
+    sock.settimeout(_HANDSHAKE_TIMEOUT)
+    try:
+        nonce = bytearray()
+        while len(nonce) < _NONCE_SIZE:
+            chunk = sock.recv(_NONCE_SIZE - len(nonce))
+            if not chunk:
+                raise AuthenticationError("connection closed during handshake")
+            nonce += chunk
+        sock.sendall(_digest(authkey, bytes(nonce)))
+    finally:
+        sock.settimeout(timeout)
+
+
+class ServerHandshake:
+    def __init__(self, sock: socket.socket, authkey: bytes):
+        nonce = os.urandom(_NONCE_SIZE)
+        sock.sendall(nonce)
+        self._expected = _digest(authkey, nonce)
+        self._received = bytearray()
+
+    def feed(self, data: bytes) -> Optional[bytes]:
+        self._received += data
+        if len(self._received) < len(self._expected):
+            return None
+        digest = bytes(self._received[:len(self._expected)])
+        if not hmac.compare_digest(digest, self._expected):
+            raise AuthenticationError("peer failed the handshake")
+        return bytes(self._received[len(self._expected):])
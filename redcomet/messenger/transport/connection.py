@@ -0,0 +1,97 @@
+import os
+import socket
+import threading
+from contextlib import contextmanager
+from typing import Optional, Set
+
+from redcomet.base.messaging.endpoint import EndpointAbstract
+from redcomet.messenger.transport.frame import encode_frame
+_corked = threading.local()
+
+
+@contextmanager
+def cork():
+    if getattr(_corked, "connections", None) is not None:
+        yield
+        return
+    _corked.connections = set()
+    try:
+        yield
+    finally:
+        connections: Set[StreamConnection] = _corked.connections
+        _corked.connections = None
+        for connection in connections:
+            connection.flush()
+
+
+class StreamConnection:
+    def __init__(self, endpoint: EndpointAbstract, max_buffer_size: int = 256 * 1024):
+        self._endpoint = endpoint
+        self._max_buffer_size = max_buffer_size
+        self._reset()
+
+    def _reset(self):
+        self._pid = os.getpid()
+        self._socket: Optional[socket.socket] = None
+        self._buffer = bytearray()
+        self._lock = threading.Lock()
+        self._writing = False
+        self.frames = 0
+        self.writes = 0
+
+    def send(self, data: bytes):
+        if self._pid != os.getpid():
+            self._reset()
+        corked = getattr(_corked, "connections", None)
+        with self._lock:
+            self._buffer += encode_frame(data)
+            self.frames += 1
+            if corked is not None and len(self._buffer) < self._max_buffer_size:
+                corked.add(self)
+                return
+            if self._writing:
+                return
+            self._writing = True
+        self._drain()
+
+    def flush(self):
+        if self._pid != os.getpid():
+            return
+        with self._lock:
+            if self._writing or not self._buffer:
+                return
+            self._writing = True
+        self._drain()
+
+    def _drain(self):
+        while True:
+            with self._lock:
+                if not self._buffer:
+                    self._writing = False
+                    return
+                chunk = bytes(self._buffer)
+                self._buffer.clear()
+            try:
+                self._connect().sendall(chunk)
+            except BaseException:
+                with self._lock:
+                    self._writing = False
+                raise
+            self.writes += 1
+
+    def _connect(self) -> socket.socket:
+        if self._socket is None:
+            self._socket = self._endpoint.connect()
+        return self._socket
+
+    @property
+    def endpoint(self) -> EndpointAbstract:
+        return self._endpoint
+
+    def close(self):
+        if self._pid != os.getpid():
+            return
+        self.flush()
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
@@ -0,0 +1,142 @@
+import ipaddress
+import os
+import shutil
+import socket
+import tempfile
+import warnings
+from typing import Optional, Tuple
+
+from redcomet.base.messaging.endpoint import EndpointAbstract
+from redcomet.messenger.transport.auth import answer_challenge, default_authkey
+
+_SOCKET_BUFFER_SIZE = 4 * 1024 * 1024
+
+
+class TcpEndpoint(EndpointAbstract):
+    __slots__ = ("_host", "_port", "_authkey")
+
+    def __init__(self, host: str, port: int, authkey: bytes = None):
+        self._host = host
+        self._port = port
+        self._authkey = authkey
+
+    def listen(self, backlog: int) -> Tuple[socket.socket, 'TcpEndpoint']:
+        self._check_authkey()
+        if not _is_loopback(self._host):
+            warnings.warn(f"listening on non-loopback host {self._host!r}: peers are authenticated with a shared "
+                          f"authkey but packets are neither encrypted nor integrity protected, "
+                          f"so only expose it on a trusted network", RuntimeWarning, stacklevel=2)
+        listener = socket.create_server((self._host, self._port), backlog=backlog)
+        return listener, TcpEndpoint(self._host, listener.getsockname()[1], self._authkey)
+
+    def connect(self) -> socket.socket:
+        self._check_authkey()
+        sock = socket.create_connection((self._host, self._port))
+        self.configure(sock)
+        try:
+            answer_challenge(sock, self.authkey)
+        except BaseException:
+            sock.close()
+            raise
+        return sock
+
+    def _check_authkey(self):
+        if self._authkey is None and not _is_loopback(self._host):
+            raise ValueError(f"non-loopback host {self._host!r} requires an explicit authkey")
+
+    def with_authkey(self, authkey: bytes) -> 'TcpEndpoint':
+        return TcpEndpoint(self._host, self._port, authkey)
+
+    def configure(self, sock: socket.socket):
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, _SOCKET_BUFFER_SIZE)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, _SOCKET_BUFFER_SIZE)
+
+    @property
+    def host(self) -> str:
+        return self._host
+
+    @property
+    def port(self) -> int:
+        return self._port
+
+    @property
+    def authkey(self) -> Optional[bytes]:
+        return self._authkey if self._authkey is not None else default_authkey()
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return False
+        return self._host == other._host and self._port == other._port
+
+    def __hash__(self):
+        return hash((self._host, self._port))
+
+    def __reduce__(self):
+        return TcpEndpoint, (self._host, self._port)
+
+    def __repr__(self) -> str:
+        return f"TcpEndpoint({self._host!r}, {self._port!r})"
+
+
+class UnixEndpoint(EndpointAbstract):
+    __slots__ = ("_path", "_owned_directory")
+
+    def __init__(self, path: str = None):
+        self._path = path
+        self._owned_directory = None
+
+    def listen(self, backlog: int) -> Tuple[socket.socket, 'UnixEndpoint']:
+        endpoint = self
+        if self._path is None:
+            directory = tempfile.mkdtemp(prefix="redcomet-")
+            endpoint = UnixEndpoint(os.path.join(directory, "inbox.sock"))
+            endpoint._owned_directory = directory
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        listener.bind(endpoint.path)
+        listener.listen(backlog)
+        return listener, endpoint
+
+    def connect(self) -> socket.socket:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.connect(self._path)
+        self.configure(sock)
+        return sock
+
+    def configure(self, sock: socket.socket):
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, _SOCKET_BUFFER_SIZE)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, _SOCKET_BUFFER_SIZE)
+
+    def release(self):
+        if self._owned_directory is not None:
+            shutil.rmtree(self._owned_directory, ignore_errors=True)
+            self._owned_directory = None
+        elif self._path is not None and os.path.exists(self._path):
+            os.unlink(self._path)
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return False
+        return self._path == other._path
+
+    def __hash__(self):
+        return hash(self._path)
+
+    def __reduce__(self):
+        return UnixEndpoint, (self._path,)
+
+    def __repr__(self) -> str:
+        return f"UnixEndpoint({self._path!r})"
+
+
+def _is_loopback(host: str) -> bool:
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
@@ -0,0 +1,30 @@
+import struct
+from typing import List
+
+_LENGTH = struct.Struct("!I")
+
+
+def encode_frame(data: bytes) -> bytes:
+    return _LENGTH.pack(len(data)) + data
+
+
+class FrameDecoder:
+    def __init__(self):
+        self._buffer = bytearray()
+
+    def feed(self, data: bytes) -> List[bytes]:
+        self._buffer += data
+        frames = []
+        position = 0
+        while len(self._buffer) - position >= _LENGTH.size:
+            length = _LENGTH.unpack_from(self._buffer, position)[0]
+            end = position + _LENGTH.size + length
+            if end > len(self._buffer):
+                break
+            frames.append(bytes(self._buffer[position + _LENGTH.size:end]))
+            position = end
+        del self._buffer[:position]
+        return frames
+
+    def __len__(self) -> int:
+        return len(self._buffer)
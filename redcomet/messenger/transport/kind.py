@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class Transport(Enum):
+    QUEUE = "queue"
+    TCP = "tcp"
+    UNIX = "unix"
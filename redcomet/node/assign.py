@@ -0,0 +1,15 @@
+from redcomet.base.actor.message import MessageAbstract
+
+
+class AssignNodeIdRequest(MessageAbstract):
+    __slots__ = ("_node_id",)
+
+    def __init__(self, node_id: str):
+        self._node_id = node_id
+
+    @property
+    def node_id(self) -> str:
+        return self._node_id
+
+    def __repr__(self) -> str:
+        return f"AssignNodeIdRequest({self._node_id!r})"
@@ -0,0 +1,10 @@
+from redcomet.actor.asynchronous import AsyncioActorExecutor
+from redcomet.messenger import Messenger
+from redcomet.node.process import ProcessNode
+
+
+class AsyncioNode(ProcessNode):
+    def __init__(self, messenger: Messenger, executor: AsyncioActorExecutor):
+        if not isinstance(executor, AsyncioActorExecutor):
+            raise TypeError("AsyncioNode requires an AsyncioActorExecutor")
+        super().__init__(messenger, executor)
@@ -0,0 +1,16 @@
+from redcomet.base.actor.message import MessageAbstract
+from redcomet.base.messaging.address import Address
+
+
+class BindDiscoveryRequest(MessageAbstract):
+    __slots__ = ("_address",)
+
+    def __init__(self, address: Address):
+        self._address = address
+
+    @property
+    def address(self) -> Address:
+        return self._address
+
+    def __repr__(self) -> str:
+        return f"BindDiscoveryRequest({self._address!r})"
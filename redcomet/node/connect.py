@@ -0,0 +1,21 @@
+from redcomet.base.actor.message import MessageAbstract
+from redcomet.base.messaging.endpoint import EndpointAbstract
+
+
+class ConnectNodeRequest(MessageAbstract):
+    __slots__ = ("_node_id", "_endpoint")
+
+    def __init__(self, node_id: str, endpoint: EndpointAbstract):
+        self._node_id = node_id
+        self._endpoint = endpoint
+
+    @property
+    def node_id(self) -> str:
+        return self._node_id
+
+    @property
+    def endpoint(self) -> EndpointAbstract:
+        return self._endpoint
+
+    def __repr__(self) -> str:
+        return f"ConnectNodeRequest({self._node_id!r}, {self._endpoint!r})"
@@ -1,21 +1,70 @@
+from typing import Callable
+
+from redcomet.actor.asynchronous import AsyncioActorExecutor
 from redcomet.actor.executor import ActorExecutor
+from redcomet.actor.passivation import PassivationPolicy
+from redcomet.actor.thread_pool import ThreadPoolActorExecutor
+from redcomet.base.messaging.codec import PacketCodecAbstract
+from redcomet.base.messaging.endpoint import EndpointAbstract
 from redcomet.base.node.abstract import NodeAbstract
 from redcomet.messenger.factory import create_messenger
+from redcomet.messenger.inbox.queue import QueueAbstract, QueueManagerAbstract
+from redcomet.messenger.pending import PendingOverflow
+from redcomet.messenger.transport.kind import Transport
+from redcomet.node.asynchronous import AsyncioNode
 from redcomet.node.manager.actor import NodeManager
 from redcomet.node.process import ProcessNode
 from redcomet.node.synchronous import SynchronousNode
+from redcomet.node.thread_pool import ThreadPoolNode
+
 
+def create_node(parallel: bool = False, *, asynchronous: bool = False, thread_pool_size: int = None,
+                inbox_queue_manager_factory: Callable[[], QueueManagerAbstract] = None,
+                batch_size: int = 1, batch_wait_us: int = 0, codec: PacketCodecAbstract = None,
+                shared_buffer_min_size: int = 64 * 1024, address_cache_capacity: int = 65536,
+                address_cache_ttl: float = None, pending_capacity: int = 100_000, pending_timeout: float = None,
+                pending_overflow: PendingOverflow = PendingOverflow.DROP_NEWEST,
+                announce_addresses: bool = False, load_report_interval: float = None,
+                heartbeat_interval: float = None, transport: Transport = Transport.QUEUE,
+                listen: EndpointAbstract = None, inbox_capacity: int = None,
+                spill_directory: str = None, unclaimed_replies: QueueAbstract = None,
+                passivation: PassivationPolicy = None, authkey: bytes = None) -> NodeAbstract:
+    if asynchronous and thread_pool_size is not None:
+        raise ValueError("a node is either asynchronous or thread pooled")
+    parallel = parallel or thread_pool_size is not None or transport is not Transport.QUEUE
 
-def create_node(parallel: bool = False) -> NodeAbstract:
-    executor = ActorExecutor()
-    messenger = create_messenger(executor, actor_id="messenger", parallel=parallel)
-    if not parallel:
+    if asynchronous:
+        executor = AsyncioActorExecutor(passivation=passivation)
+    elif thread_pool_size is not None:
+        executor = ThreadPoolActorExecutor(max_workers=thread_pool_size, passivation=passivation)
+    else:
+        executor = ActorExecutor(passivation=passivation)
+    inbox_queue_manager = inbox_queue_manager_factory() if inbox_queue_manager_factory is not None else None
+    messenger = create_messenger(executor, actor_id="messenger", inbox_queue_manager=inbox_queue_manager,
+                                 parallel=parallel, asynchronous=asynchronous,
+                                 batch_size=batch_size, batch_wait_us=batch_wait_us, codec=codec,
+                                 shared_buffer_min_size=shared_buffer_min_size,
+                                 address_cache_capacity=address_cache_capacity, address_cache_ttl=address_cache_ttl,
+                                 pending_capacity=pending_capacity, pending_timeout=pending_timeout,
+                                 pending_overflow=pending_overflow, transport=transport, listen=listen,
+                                 inbox_capacity=inbox_capacity, spill_directory=spill_directory,
+                                 unclaimed_replies=unclaimed_replies, authkey=authkey)
+    if asynchronous:
+        node = AsyncioNode(messenger, executor)
+    elif thread_pool_size is not None:
+        node = ThreadPoolNode(messenger, executor)
+    elif not parallel:
         node = SynchronousNode(executor, messenger)
     else:
         node = ProcessNode(messenger, executor)
     executor.set_node(node)
 
-    manager = NodeManager("manager", node)
+    passivation_sweep_interval = None
+    if passivation is not None and passivation.idle_timeout is not None:
+        passivation_sweep_interval = passivation.sweep_interval
+    manager = NodeManager("manager", node, announce_addresses=announce_addresses,
+                          load_report_interval=load_report_interval, heartbeat_interval=heartbeat_interval,
+                          passivation_sweep_interval=passivation_sweep_interval)
     node.assign_manager(manager)
 
     executor.register("messenger", messenger)
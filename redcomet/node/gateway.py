@@ -1,3 +1,7 @@
+import threading
+import time
+from typing import List
+
 from redcomet.base.actor import ActorRefAbstract
 from redcomet.base.actor.abstract import ActorAbstract
 from redcomet.base.actor.message import MessageAbstract
@@ -6,9 +10,47 @@ from redcomet.messenger.inbox.queue import QueueAbstract
 
 
 class GatewayActor(ActorAbstract):
-    def __init__(self, queue: QueueAbstract):
+    def __init__(self, queue: QueueAbstract, batch_size: int = 1, flush_interval: float = 0.001):
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+
         self._queue = queue
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._pending: List[MessageAbstract] = []
+        self._condition = threading.Condition()
+        self._flusher = None
 
     def receive(self, message: MessageAbstract, sender: ActorRefAbstract, me: ActorRefAbstract,
                 cluster: ClusterRefAbstract):
-        self._queue.put(message)
+        if self._batch_size == 1:
+            self._queue.put(message)
+            return
+
+        with self._condition:
+            self._pending.append(message)
+            if len(self._pending) < self._batch_size:
+                self._ensure_flusher()
+                self._condition.notify()
+                return
+            batch, self._pending = self._pending, []
+        self._queue.put(batch)
+
+    def flush(self):
+        with self._condition:
+            batch, self._pending = self._pending, []
+        if batch:
+            self._queue.put(batch)
+
+    def _ensure_flusher(self):
+        if self._flusher is None or not self._flusher.is_alive():
+            self._flusher = threading.Thread(target=self._flush_periodically, daemon=True)
+            self._flusher.start()
+
+    def _flush_periodically(self):
+        while True:
+            with self._condition:
+                while not self._pending:
+                    self._condition.wait()
+            time.sleep(self._flush_interval)
+            self.flush()
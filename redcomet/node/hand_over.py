@@ -0,0 +1,20 @@
+from redcomet.base.actor.message import MessageAbstract
+
+
+class HandOverActorRequest(MessageAbstract):
+    __slots__ = ("_actor_id", "_state")
+
+    def __init__(self, actor_id: str, state: bytes):
+        self._actor_id = actor_id
+        self._state = state
+
+    @property
+    def actor_id(self) -> str:
+        return self._actor_id
+
+    @property
+    def state(self) -> bytes:
+        return self._state
+
+    def __repr__(self) -> str:
+        return f"HandOverActorRequest({self._actor_id!r}, <{len(self._state)} bytes>)"
@@ -7,3 +7,9 @@ class NodeManagerAbstract(ABC):
     @abstractmethod
     def bind_discovery(self, discovery: ActorDiscoveryRefAbstract):
         pass
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
@@ -1,29 +1,129 @@
+import pickle
+import threading
+import time
+from typing import Optional, List, Callable
+
 from redcomet.base.actor import ActorRefAbstract
 from redcomet.base.actor.abstract import ActorAbstract
 from redcomet.base.actor.message import MessageAbstract
 from redcomet.base.cluster.ref import ClusterRefAbstract
 from redcomet.base.discovery.ref import ActorDiscoveryRefAbstract
+from redcomet.base.messaging.address import Address
+from redcomet.base.messaging.packet import Packet
 from redcomet.base.node.abstract import NodeAbstract
+from redcomet.cluster.message.heartbeat.request import HeartbeatRequest
+from redcomet.cluster.message.heartbeat.response import HeartbeatResponse
+from redcomet.cluster.message.load_report.report import NodeLoadReport
+from redcomet.cluster.message.migrate_actor.request import MigrateActorRequest
+from redcomet.node.assign import AssignNodeIdRequest
+from redcomet.node.bind import BindDiscoveryRequest
+from redcomet.node.connect import ConnectNodeRequest
+from redcomet.node.hand_over import HandOverActorRequest
 from redcomet.node.manager.abstract import NodeManagerAbstract
+from redcomet.node.passivate import PassivateIdleActorsRequest
 from redcomet.node.register import RegisterActorRequest
 
 
 class NodeManager(ActorAbstract, NodeManagerAbstract):
-    def __init__(self, actor_id: str, node: NodeAbstract, discovery: ActorDiscoveryRefAbstract = None):
+    def __init__(self, actor_id: str, node: NodeAbstract, discovery: ActorDiscoveryRefAbstract = None,
+                 announce_addresses: bool = False, load_report_interval: float = None,
+                 heartbeat_interval: float = None, passivation_sweep_interval: float = None):
         self._actor_id = actor_id
         self._node = node
         self._discovery = discovery
+        self._announce_addresses = announce_addresses
+        self._load_report_interval = load_report_interval
+        self._heartbeat_interval = heartbeat_interval
+        self._passivation_sweep_interval = passivation_sweep_interval
+        self._n_actors = 0
+        self._rtt: Optional[float] = None
+
+        self._stopped = threading.Event()
+        self._threads: List[threading.Thread] = []
 
     def bind_discovery(self, discovery: ActorDiscoveryRefAbstract):
         self._discovery = discovery
 
+    def start(self):
+        self._stopped.clear()
+        if self._load_report_interval is not None:
+            self._start_periodic(self._load_report_interval, self._report_load)
+        if self._heartbeat_interval is not None:
+            self._start_periodic(self._heartbeat_interval, self._send_heartbeat)
+        if self._passivation_sweep_interval is not None:
+            self._start_periodic(self._passivation_sweep_interval, self._request_passivation)
+
+    def stop(self):
+        self._stopped.set()
+        for thread in self._threads:
+            thread.join()
+        self._threads.clear()
+
+    def _start_periodic(self, interval: float, callback: Callable[[ClusterRefAbstract], None]):
+        thread = threading.Thread(target=self._run_periodically, args=(interval, callback), daemon=True)
+        thread.start()
+        self._threads.append(thread)
+
+    def _run_periodically(self, interval: float, callback: Callable[[ClusterRefAbstract], None]):
+        cluster = self._node.issue_cluster_ref(self._actor_id)
+        callback(cluster)
+        while not self._stopped.wait(interval):
+            callback(cluster)
+
     def receive(self, message: MessageAbstract, sender: ActorRefAbstract, me: ActorRefAbstract,
                 cluster: ClusterRefAbstract):
         if isinstance(message, RegisterActorRequest):
-            self._register(message)
+            self._register(message.actor_id, message.actor, message.replace)
+            self._report_load(cluster)
+        elif isinstance(message, HandOverActorRequest):
+            self._register(message.actor_id, pickle.loads(message.state), replace=True)
+            self._report_load(cluster)
+        elif isinstance(message, MigrateActorRequest):
+            self._migrate(message)
+            self._report_load(cluster)
+        elif isinstance(message, PassivateIdleActorsRequest):
+            self._node.passivate_idle_actors()
+        elif isinstance(message, HeartbeatResponse):
+            self._rtt = time.monotonic() - message.sent_at
+        elif isinstance(message, AssignNodeIdRequest):
+            self._node.assign_node_id(message.node_id)
+        elif isinstance(message, ConnectNodeRequest):
+            self._node.connect_remote(message.node_id, message.endpoint)
+        elif isinstance(message, BindDiscoveryRequest):
+            self._node.bind_discovery(message.address)
         else:
             raise NotImplementedError()
 
-    def _register(self, request: RegisterActorRequest):
-        self._node.register_executable_actor(request.actor, request.actor_id)
-        self._discovery.register_address(request.actor_id, self._node.node_id)
+    def _register(self, actor_id: str, actor: ActorAbstract, replace: bool):
+        self._node.register_executable_actor(actor, actor_id)
+        self._n_actors += 1
+        self._discovery.register_address(actor_id, self._node.node_id, replace=replace)
+        if self._announce_addresses:
+            self._node.messenger.announce_address(Address(self._node.node_id, actor_id))
+
+    def _migrate(self, request: MigrateActorRequest):
+        self._node.migrate_executable_actor(request.actor_id, request.node_id,
+                                            lambda actor: self._hand_off(request, actor))
+
+    def _hand_off(self, request: MigrateActorRequest, actor: ActorAbstract):
+        state = pickle.dumps(actor, protocol=pickle.HIGHEST_PROTOCOL)
+        node = self._node.issue_node_ref(self._actor_id, request.node_id)
+        node.hand_over_actor(request.actor_id, state)
+        self._n_actors -= 1
+
+    def _report_load(self, cluster: ClusterRefAbstract):
+        messenger = self._node.messenger
+        report = NodeLoadReport(self._node.node_id, messenger.inbox_depth(), self._n_actors,
+                                messenger.blocked_send_time())
+        cluster.report_load(report)
+
+    def _send_heartbeat(self, cluster: ClusterRefAbstract):
+        cluster.heartbeat(HeartbeatRequest(self._node.node_id, time.monotonic(), rtt=self._rtt))
+
+    def _request_passivation(self, cluster: ClusterRefAbstract):
+        address = Address.on_local(self._actor_id)
+        self._node.messenger.send_packet(Packet(PassivateIdleActorsRequest(), address, address))
+
+    @property
+    def rtt(self) -> Optional[float]:
+        return self._rtt
@@ -0,0 +1,8 @@
+from redcomet.base.actor.message import MessageAbstract
+
+
+class PassivateIdleActorsRequest(MessageAbstract):
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "PassivateIdleActorsRequest()"
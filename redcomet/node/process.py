@@ -1,31 +1,44 @@
 from multiprocessing import Process
-from typing import Optional
+from typing import Callable, Optional
 
 from redcomet.actor.ref import ActorRef
 from redcomet.base.actor import ActorRefAbstract
 from redcomet.base.actor.abstract import ActorAbstract
 from redcomet.base.cluster.ref import ClusterRefAbstract
+from redcomet.base.discovery.ref import ActorDiscoveryRefAbstract
 from redcomet.base.messaging.address import Address
+from redcomet.base.messaging.endpoint import EndpointAbstract
 from redcomet.base.messenger.abstract import MessengerAbstract
 from redcomet.base.node.abstract import NodeAbstract
 from redcomet.cluster.ref import ClusterRef
-from redcomet.discovery.ref import ActorDiscoveryRef
+from redcomet.discovery.ref import ActorDiscoveryRef, ShardedActorDiscoveryRef
+from redcomet.discovery.ring import ConsistentHashRing
 from redcomet.messenger.handler.executor.actor import ActorExecutorAbstract
 from redcomet.node.manager.abstract import NodeManagerAbstract
 from redcomet.node.ref import NodeRef
+from redcomet.tracing import get_tracer
+
+_trace = get_tracer("node")
 
 
 class ProcessNode(NodeAbstract):
-    def __init__(self, messenger: MessengerAbstract, executor: ActorExecutorAbstract):
+    def __init__(self, messenger: MessengerAbstract, executor: ActorExecutorAbstract, join_timeout: float = 5.0):
         self._messenger = messenger
         self._executor = executor
+        self._join_timeout = join_timeout
 
         self._manager: Optional[NodeManagerAbstract] = None
+        self._process: Optional[Process] = None
         self._actor_id: Optional[str] = None
         self._node_id: Optional[str] = None
 
     def bind_discovery(self, address: Address):
-        ref = ActorDiscoveryRef(self._messenger, address, self._actor_id)
+        self._bind_discovery_ref(ActorDiscoveryRef(self._messenger, address, self._actor_id))
+
+    def bind_sharded_discovery(self, ring: ConsistentHashRing, actor_id: str):
+        self._bind_discovery_ref(ShardedActorDiscoveryRef(self._messenger, ring, actor_id, self._actor_id))
+
+    def _bind_discovery_ref(self, ref: ActorDiscoveryRefAbstract):
         self._messenger.bind_discovery(ref)
         self._manager.bind_discovery(ref)
 
@@ -41,6 +54,15 @@ class ProcessNode(NodeAbstract):
     def register_executable_actor(self, actor: ActorAbstract, actor_id: str):
         self._executor.register(actor_id, actor)
 
+    def unregister_executable_actor(self, actor_id: str, forward_to: str = None) -> Optional[ActorAbstract]:
+        return self._executor.unregister(actor_id, forward_to)
+
+    def migrate_executable_actor(self, actor_id: str, node_id: str, hand_off: Callable[[ActorAbstract], None]):
+        self._executor.migrate(actor_id, node_id, hand_off)
+
+    def passivate_idle_actors(self):
+        self._executor.passivate_idle_actors()
+
     def assign_node_id(self, node_id: str):
         self._node_id = node_id
         self._actor_id = node_id
@@ -57,14 +79,36 @@ class ProcessNode(NodeAbstract):
     def make_connection_to(self, node: 'NodeAbstract'):
         self._messenger.make_connection_to(node.messenger)
 
+    def connect_remote(self, node_id: str, endpoint: EndpointAbstract):
+        self._messenger.connect_remote(node_id, endpoint)
+
     def assign_manager(self, manager: NodeManagerAbstract):
         self._manager = manager
 
     def start(self):
-        Process(target=self._messenger.start_receive_loop).start()
+        self._process = Process(target=self.run)
+        self._process.start()
+
+    def is_alive(self) -> bool:
+        return self._process is not None and self._process.is_alive()
+
+    def run(self):
+        if self._manager is not None:
+            self._manager.start()
+        self._messenger.start_receive_loop()
+        if self._manager is not None:
+            self._manager.stop()
+        self._executor.shutdown()
 
     def stop(self):
         self._messenger.stop_receive_loop()
 
     def close(self):
+        if self._process is not None:
+            self._process.join(self._join_timeout)
+            if self._process.is_alive():
+                _trace.warning("node %r did not stop within %ss, terminating", self._node_id, self._join_timeout)
+                self._process.terminate()
+                self._process.join()
+            self._process = None
         self._messenger.close()
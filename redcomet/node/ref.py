@@ -1,25 +1,61 @@
+from typing import Optional
+
 from redcomet.base.actor.abstract import ActorAbstract
 from redcomet.base.messaging.address import Address
 from redcomet.base.messaging.packet import Packet
 from redcomet.base.messenger.abstract import MessengerAbstract
 from redcomet.base.node.ref import NodeRefAbstract
+from redcomet.cluster.message.migrate_actor.request import MigrateActorRequest
+from redcomet.cluster.message.node_status.request import NodeStatusRequest
+from redcomet.cluster.message.node_status.response import NodeStatusResponse
+from redcomet.cluster.status import NodeStatus
+from redcomet.node.hand_over import HandOverActorRequest
 from redcomet.node.register import RegisterActorRequest
 
 
 class NodeRef(NodeRefAbstract):
-    def __init__(self, messenger: MessengerAbstract, issuer_id: str, node_id: str):
+    __slots__ = ("_messenger", "_issuer_id", "_node_id", "_status")
+
+    def __init__(self, messenger: MessengerAbstract, issuer_id: str, node_id: str, status: NodeStatus = None):
         self._messenger = messenger
         self._issuer_id = issuer_id
         self._node_id = node_id
+        self._status = status
 
     def is_active(self, timeout: float) -> bool:
-        return False
+        with self._messenger.create_direct_message_box() as box:
+            packet = Packet(NodeStatusRequest(self._node_id, box.ref_id),
+                            sender=Address.on_local("messenger"),
+                            receiver=Address("main", "cluster"))
+            self._messenger.send_packet(packet)
+            try:
+                response: NodeStatusResponse = box.get(timeout=timeout)
+            except TimeoutError:
+                return False
+        if response is None:
+            return False
+        self._status = response.status
+        return response.status.active
 
     @property
     def node_id(self) -> str:
         return self._node_id
 
-    def register_address(self, actor_id: str, actor: ActorAbstract):
-        message = RegisterActorRequest(actor_id, actor)
+    @property
+    def status(self) -> Optional[NodeStatus]:
+        return self._status
+
+    def register_address(self, actor_id: str, actor: ActorAbstract, replace: bool = False):
+        message = RegisterActorRequest(actor_id, actor, replace)
         packet = Packet(message, Address.on_local(self._issuer_id), Address(self._node_id, "manager"))
         self._messenger.send_packet(packet)
+
+    def hand_over_actor(self, actor_id: str, state: bytes):
+        packet = Packet(HandOverActorRequest(actor_id, state), Address.on_local(self._issuer_id),
+                        Address(self._node_id, "manager"))
+        self._messenger.send_packet(packet)
+
+    def migrate_actor(self, actor_id: str, node_id: str):
+        packet = Packet(MigrateActorRequest(actor_id, node_id), Address.on_local(self._issuer_id),
+                        Address(self._node_id, "manager"))
+        self._messenger.send_packet(packet)
@@ -3,9 +3,12 @@ from redcomet.base.actor.message import MessageAbstract
 
 
 class RegisterActorRequest(MessageAbstract):
-    def __init__(self, actor_id: str, actor: ActorAbstract):
+    __slots__ = ("_actor_id", "_actor", "_replace")
+
+    def __init__(self, actor_id: str, actor: ActorAbstract, replace: bool = False):
         self._actor_id = actor_id
         self._actor = actor
+        self._replace = replace
 
     @property
     def actor_id(self) -> str:
@@ -15,5 +18,9 @@ class RegisterActorRequest(MessageAbstract):
     def actor(self) -> ActorAbstract:
         return self._actor
 
+    @property
+    def replace(self) -> bool:
+        return self._replace
+
     def __repr__(self) -> str:
-        return f"RegisterActorRequest({self._actor_id!r}, {self._actor!r})"
+        return f"RegisterActorRequest({self._actor_id!r}, {self._actor!r}, replace={self._replace!r})"
@@ -0,0 +1,73 @@
+from redcomet.base.actor import ActorRefAbstract
+from redcomet.base.actor.abstract import ActorAbstract
+from redcomet.base.actor.message import MessageAbstract
+from redcomet.base.cluster.ref import ClusterRefAbstract
+from redcomet.base.messaging.address import Address
+from redcomet.base.messaging.codec import PacketCodecAbstract
+from redcomet.base.messaging.endpoint import EndpointAbstract
+from redcomet.base.messaging.packet import Packet
+from redcomet.base.messenger.abstract import MessengerAbstract
+from redcomet.base.node.abstract import NodeAbstract
+from redcomet.messenger.inbox.stream import RemoteStreamInbox
+from redcomet.messenger.remote import RemoteMessenger
+from redcomet.node.assign import AssignNodeIdRequest
+from redcomet.node.bind import BindDiscoveryRequest
+from redcomet.node.connect import ConnectNodeRequest
+from redcomet.node.manager.abstract import NodeManagerAbstract
+from redcomet.node.ref import NodeRef
+
+
+class RemoteNode(NodeAbstract):
+    def __init__(self, endpoint: EndpointAbstract, codec: PacketCodecAbstract = None):
+        self._messenger = RemoteMessenger(RemoteStreamInbox(endpoint, codec=codec))
+        self._node_id = None
+
+    def _send(self, message: MessageAbstract):
+        self._messenger.send_packet(Packet(message, sender=..., receiver=Address(self._node_id, "manager")))
+
+    def stop(self):
+        self._messenger.stop_receive_loop()
+
+    def close(self):
+        self._messenger.close()
+
+    def bind_discovery(self, address: Address):
+        self._send(BindDiscoveryRequest(address))
+
+    def issue_actor_ref(self, local_issuer_id: str, address: Address) -> ActorRefAbstract:
+        raise NotImplementedError()
+
+    def issue_cluster_ref(self, local_issuer_id: str) -> ClusterRefAbstract:
+        raise NotImplementedError()
+
+    def issue_node_ref(self, local_issuer_id: str, node_id: str) -> NodeRef:
+        raise NotImplementedError()
+
+    def register_executable_actor(self, actor: ActorAbstract, actor_id: str):
+        raise NotImplementedError()
+
+    def assign_node_id(self, node_id: str):
+        self._node_id = node_id
+        self._messenger.assign_node_id(node_id)
+        self._send(AssignNodeIdRequest(node_id))
+
+    @property
+    def node_id(self) -> str:
+        return self._node_id
+
+    @property
+    def messenger(self) -> MessengerAbstract:
+        return self._messenger
+
+    @property
+    def endpoint(self) -> EndpointAbstract:
+        return self._messenger.endpoint
+
+    def make_connection_to(self, node: NodeAbstract):
+        endpoint = node.messenger.endpoint
+        if endpoint is None:
+            raise TypeError("a remote node can only connect to nodes using a socket transport")
+        self._send(ConnectNodeRequest(node.node_id, endpoint))
+
+    def assign_manager(self, manager: NodeManagerAbstract):
+        raise NotImplementedError()
@@ -1,13 +1,17 @@
+from typing import Callable, Optional
+
 from redcomet.actor.executor import ActorExecutor
 from redcomet.actor.ref import ActorRef
 from redcomet.base.actor import ActorRefAbstract
 from redcomet.base.actor.abstract import ActorAbstract
 from redcomet.base.cluster.ref import ClusterRefAbstract
+from redcomet.base.discovery.ref import ActorDiscoveryRefAbstract
 from redcomet.base.messaging.address import Address
 from redcomet.base.messenger.abstract import MessengerAbstract
 from redcomet.base.node.abstract import NodeAbstract
 from redcomet.cluster.ref import ClusterRef
-from redcomet.discovery.ref import ActorDiscoveryRef
+from redcomet.discovery.ref import ActorDiscoveryRef, ShardedActorDiscoveryRef
+from redcomet.discovery.ring import ConsistentHashRing
 from redcomet.messenger import Messenger
 from redcomet.messenger.handler import PacketHandler
 from redcomet.messenger.inbox import InboxAbstract
@@ -43,14 +47,36 @@ class SynchronousNode(NodeAbstract):
 
         return node
 
+    def start(self):
+        if self._manager is not None:
+            self._manager.start()
+
+    def stop(self):
+        if self._manager is not None:
+            self._manager.stop()
+
     def bind_discovery(self, address: Address):
-        ref = ActorDiscoveryRef(self._messenger, address, self._actor_id)
+        self._bind_discovery_ref(ActorDiscoveryRef(self._messenger, address, self._actor_id))
+
+    def bind_sharded_discovery(self, ring: ConsistentHashRing, actor_id: str):
+        self._bind_discovery_ref(ShardedActorDiscoveryRef(self._messenger, ring, actor_id, self._actor_id))
+
+    def _bind_discovery_ref(self, ref: ActorDiscoveryRefAbstract):
         self._manager.bind_discovery(ref)
         self._messenger.bind_discovery(ref)
 
     def register_executable_actor(self, actor: ActorAbstract, actor_id: str):
         self._executor.register(actor_id, actor)
 
+    def unregister_executable_actor(self, actor_id: str, forward_to: str = None) -> Optional[ActorAbstract]:
+        return self._executor.unregister(actor_id, forward_to)
+
+    def migrate_executable_actor(self, actor_id: str, node_id: str, hand_off: Callable[[ActorAbstract], None]):
+        self._executor.migrate(actor_id, node_id, hand_off)
+
+    def passivate_idle_actors(self):
+        self._executor.passivate_idle_actors()
+
     def issue_cluster_ref(self, local_issuer_id: str) -> ClusterRefAbstract:
         return ClusterRef(self._messenger, local_issuer_id, "main", "cluster")
 
@@ -0,0 +1,10 @@
+from redcomet.actor.thread_pool import ThreadPoolActorExecutor
+from redcomet.messenger import Messenger
+from redcomet.node.process import ProcessNode
+
+
+class ThreadPoolNode(ProcessNode):
+    def __init__(self, messenger: Messenger, executor: ThreadPoolActorExecutor):
+        if not isinstance(executor, ThreadPoolActorExecutor):
+            raise TypeError("ThreadPoolNode requires a ThreadPoolActorExecutor")
+        super().__init__(messenger, executor)
@@ -0,0 +1,63 @@
+from typing import Iterable
+
+from redcomet.base.messaging.codec import PacketCodecAbstract
+from redcomet.cluster.message.heartbeat.request import HeartbeatRequest
+from redcomet.cluster.message.heartbeat.response import HeartbeatResponse
+from redcomet.cluster.message.list_active_node.request import ListActiveNodeRequest
+from redcomet.cluster.message.list_active_node.response import ListActiveNodeResponse
+from redcomet.cluster.message.load_report.report import NodeLoadReport
+from redcomet.cluster.message.migrate_actor.request import MigrateActorRequest
+from redcomet.cluster.message.node_status.request import NodeStatusRequest
+from redcomet.cluster.message.node_status.response import NodeStatusResponse
+from redcomet.cluster.message.spawn_actor.batch import SpawnActorBatchRequest
+from redcomet.cluster.message.spawn_actor.request import SpawnActorRequest
+from redcomet.discovery.message.deregister.request import DeregisterAddressRequest
+from redcomet.discovery.message.invalidate.notification import AddressInvalidated
+from redcomet.discovery.message.query.request import QueryAddressRequest
+from redcomet.discovery.message.query.response import QueryAddressResponse
+from redcomet.discovery.message.register.request import RegisterAddressRequest
+from redcomet.messenger.announce import AddressAnnouncement
+from redcomet.messenger.batch import PacketBatch
+from redcomet.messenger.multicast import Multicast
+from redcomet.messenger.request import MessageForwardRequest, MessageForwardBatch, MulticastRequest
+from redcomet.node.assign import AssignNodeIdRequest
+from redcomet.node.bind import BindDiscoveryRequest
+from redcomet.node.connect import ConnectNodeRequest
+from redcomet.node.hand_over import HandOverActorRequest
+from redcomet.node.register import RegisterActorRequest
+
+_SYSTEM_MESSAGE_TYPES = (
+    MessageForwardRequest,
+    QueryAddressRequest,
+    QueryAddressResponse,
+    RegisterAddressRequest,
+    RegisterActorRequest,
+    SpawnActorRequest,
+    ListActiveNodeRequest,
+    ListActiveNodeResponse,
+    DeregisterAddressRequest,
+    AddressInvalidated,
+    AddressAnnouncement,
+    NodeLoadReport,
+    HeartbeatRequest,
+    HeartbeatResponse,
+    NodeStatusRequest,
+    NodeStatusResponse,
+    AssignNodeIdRequest,
+    ConnectNodeRequest,
+    BindDiscoveryRequest,
+    MessageForwardBatch,
+    SpawnActorBatchRequest,
+    PacketBatch,
+    MulticastRequest,
+    Multicast,
+    MigrateActorRequest,
+    HandOverActorRequest,
+)
+
+
+def register_system_codec(codec: PacketCodecAbstract, node_ids: Iterable[str]):
+    for node_id in node_ids:
+        codec.intern(node_id)
+    for message_type in _SYSTEM_MESSAGE_TYPES:
+        codec.register_type(message_type)
@@ -1,14 +1,36 @@
+from typing import Callable
+
+from redcomet.actor.passivation import PassivationPolicy
+from redcomet.base.messaging.codec import PacketCodecAbstract
 from redcomet.base.node.abstract import NodeAbstract
-from redcomet.messenger.inbox.queue import QueueAbstract
+from redcomet.messenger.inbox.queue import QueueAbstract, QueueManagerAbstract
+from redcomet.messenger.transport.kind import Transport
 from redcomet.node.factory import create_node
 from redcomet.node.gateway import GatewayActor
 
 
-def create_gateway_node(incoming_messages: QueueAbstract, parallel: bool = False) -> NodeAbstract:
-    node = create_node(parallel=parallel)
-    node.register_executable_actor(GatewayActor(incoming_messages), actor_id="main")
+def create_gateway_node(incoming_messages: QueueAbstract, parallel: bool = False, *, asynchronous: bool = False,
+                        inbox_queue_manager_factory: Callable[[], QueueManagerAbstract] = None,
+                        codec: PacketCodecAbstract = None, announce_addresses: bool = False,
+                        transport: Transport = Transport.QUEUE, batch_size: int = 1,
+                        flush_interval: float = 0.001, authkey: bytes = None) -> NodeAbstract:
+    node = create_node(parallel=parallel, asynchronous=asynchronous,
+                       inbox_queue_manager_factory=inbox_queue_manager_factory, codec=codec,
+                       announce_addresses=announce_addresses, transport=transport,
+                       unclaimed_replies=incoming_messages, authkey=authkey)
+    node.register_executable_actor(GatewayActor(incoming_messages, batch_size, flush_interval), actor_id="main")
     return node
 
 
-def create_worker_node(parallel: bool = False) -> NodeAbstract:
-    return create_node(parallel=parallel)
+def create_worker_node(parallel: bool = False, *, asynchronous: bool = False, thread_pool_size: int = None,
+                       inbox_queue_manager_factory: Callable[[], QueueManagerAbstract] = None,
+                       codec: PacketCodecAbstract = None, announce_addresses: bool = False,
+                       load_report_interval: float = None, heartbeat_interval: float = None,
+                       transport: Transport = Transport.QUEUE, inbox_capacity: int = None,
+                       spill_directory: str = None, passivation: PassivationPolicy = None,
+                       authkey: bytes = None) -> NodeAbstract:
+    return create_node(parallel=parallel, asynchronous=asynchronous, thread_pool_size=thread_pool_size,
+                       inbox_queue_manager_factory=inbox_queue_manager_factory, codec=codec,
+                       announce_addresses=announce_addresses, load_report_interval=load_report_interval,
+                       heartbeat_interval=heartbeat_interval, transport=transport, inbox_capacity=inbox_capacity,
+                       spill_directory=spill_directory, passivation=passivation, authkey=authkey)
@@ -1,40 +1,129 @@
-from typing import List
+import asyncio
+import threading
+from queue import Empty, Queue
+from typing import List, Callable, Mapping, Iterable, Tuple, Iterator, AsyncIterator
 
+from redcomet.actor.passivation import PassivationPolicy
 from redcomet.base.actor import ActorRefAbstract
 from redcomet.base.actor.abstract import ActorAbstract
+from redcomet.base.actor.group import ActorGroupAbstract
 from redcomet.base.actor.message import MessageAbstract
+from redcomet.base.actor.routing import RoutingStrategyAbstract
+from redcomet.base.cluster.placement import PlacementStrategyAbstract
 from redcomet.base.cluster.ref import ClusterRefAbstract
+from redcomet.base.messaging.codec import PacketCodecAbstract
+from redcomet.base.messaging.endpoint import EndpointAbstract
+from redcomet.base.messenger.abstract import MessengerAbstract
+from redcomet.base.messenger.backpressure import Backpressure
 from redcomet.cluster.manager import ClusterManager
+from redcomet.implementation.messenger.inbox.queue.pipe import PipeQueueManager
 from redcomet.implementation.messenger.inbox.queue.process_safe import ProcessSafeQueueManager
-from redcomet.messenger.inbox.queue import QueueAbstract
+from redcomet.messenger.inbox.message import StopReceiveLoop
+from redcomet.messenger.inbox.queue import QueueAbstract, QueueManagerAbstract, drain_batch
+from redcomet.messenger.reply.unclaimed import UnclaimedReply
+from redcomet.messenger.transport.kind import Transport
 from redcomet.node.ref import NodeRef
+from redcomet.system.codec import register_system_codec
 from redcomet.system.node_factory import create_gateway_node, create_worker_node
+from redcomet.tracing import TracingConfig, configure_tracing
 
 
 class ActorSystem:
     def __init__(self, cluster: ClusterManager, cluster_ref: ClusterRefAbstract, incoming_messages: QueueAbstract,
-                 manager: ProcessSafeQueueManager):
+                 manager: QueueManagerAbstract, messenger: MessengerAbstract = None):
         self._cluster = cluster
         self._cluster_ref = cluster_ref
         self._incoming_messages = incoming_messages
         self._manager = manager
+        self._messenger = messenger
+        self._messages = Queue()
+        self._dispatcher = None
 
     @classmethod
-    def create(cls, n_worker_nodes: int = 1, node_id_prefix: str = "node", parallel: bool = False) -> 'ActorSystem':
-        incoming_messages_manager = ProcessSafeQueueManager()
+    def create(cls, n_worker_nodes: int = 1, node_id_prefix: str = "node", parallel: bool = False, *,
+               asynchronous: bool = False, thread_pool_size: int = None,
+               inbox_queue_manager_factory: Callable[[], QueueManagerAbstract] = None,
+               codec: PacketCodecAbstract = None, tracing: TracingConfig = None,
+               sharded_discovery: bool = False, announce_addresses: bool = False,
+               placement: PlacementStrategyAbstract = None, load_report_interval: float = None,
+               heartbeat_interval: float = None, heartbeat_timeout: float = None,
+               transport: Transport = Transport.QUEUE, remote_nodes: Mapping[str, EndpointAbstract] = None,
+               inbox_capacity: int = None, spill_directory: str = None, gateway_batch_size: int = 1,
+               gateway_flush_interval: float = 0.001, passivation: PassivationPolicy = None,
+               authkey: bytes = None) -> 'ActorSystem':
+        remote_nodes = remote_nodes or {}
+        if remote_nodes and transport is Transport.QUEUE:
+            raise ValueError("remote nodes require a socket transport")
+        if remote_nodes and sharded_discovery:
+            raise ValueError("sharded discovery does not support remote nodes")
+        if tracing is not None:
+            configure_tracing(tracing)
+
+        worker_node_ids = [f"{node_id_prefix}{i}" for i in range(n_worker_nodes)]
+        if codec is not None:
+            register_system_codec(codec, ["main"] + worker_node_ids + list(remote_nodes))
+
+        if transport is Transport.QUEUE:
+            incoming_messages_manager = ProcessSafeQueueManager()
+        else:
+            incoming_messages_manager = PipeQueueManager()
         incoming_messages = incoming_messages_manager.__enter__()
 
-        gateway = create_gateway_node(incoming_messages, parallel=parallel)
+        gateway = create_gateway_node(incoming_messages,
+                                      parallel=parallel or asynchronous or thread_pool_size is not None,
+                                      inbox_queue_manager_factory=inbox_queue_manager_factory, codec=codec,
+                                      announce_addresses=announce_addresses, transport=transport,
+                                      batch_size=gateway_batch_size, flush_interval=gateway_flush_interval,
+                                      authkey=authkey)
 
-        cluster = ClusterManager.create(gateway, "main", "cluster")
-        for i in range(n_worker_nodes):
-            cluster.add_node(create_worker_node(parallel=parallel), f"{node_id_prefix}{i}")
+        if heartbeat_interval is not None and heartbeat_timeout is None:
+            heartbeat_timeout = 3 * heartbeat_interval
+        cluster = ClusterManager.create(gateway, "main", "cluster", sharded_discovery=sharded_discovery,
+                                        announce_addresses=announce_addresses, placement=placement,
+                                        heartbeat_timeout=heartbeat_timeout, codec=codec)
+        for node_id in worker_node_ids:
+            worker = create_worker_node(parallel=parallel, asynchronous=asynchronous,
+                                        thread_pool_size=thread_pool_size,
+                                        inbox_queue_manager_factory=inbox_queue_manager_factory,
+                                        codec=codec, announce_addresses=announce_addresses,
+                                        load_report_interval=load_report_interval,
+                                        heartbeat_interval=heartbeat_interval, transport=transport,
+                                        inbox_capacity=inbox_capacity, spill_directory=spill_directory,
+                                        passivation=passivation, authkey=authkey)
+            cluster.add_node(worker, node_id)
+        for node_id, endpoint in remote_nodes.items():
+            cluster.add_node(endpoint if authkey is None else endpoint.with_authkey(authkey), node_id)
 
-        return cls(cluster, gateway.issue_cluster_ref("main"), incoming_messages, incoming_messages_manager)
+        return cls(cluster, gateway.issue_cluster_ref("main"), incoming_messages, incoming_messages_manager,
+                   messenger=gateway.messenger)
 
     def spawn(self, actor: ActorAbstract) -> ActorRefAbstract:
         return self._cluster_ref.spawn(actor)
 
+    def spawn_many(self, actors: Iterable[ActorAbstract]) -> List[ActorRefAbstract]:
+        return self._cluster_ref.spawn_many(actors)
+
+    def spawn_router(self, actors: Iterable[ActorAbstract],
+                     strategy: RoutingStrategyAbstract = None) -> ActorRefAbstract:
+        return self._cluster_ref.spawn_router(actors, strategy)
+
+    def migrate(self, actor: ActorRefAbstract, node_id: str):
+        self._cluster_ref.migrate(actor, node_id)
+
+    def group(self, refs: Iterable[ActorRefAbstract],
+              backpressure: Backpressure = Backpressure.BLOCK) -> ActorGroupAbstract:
+        return self._cluster_ref.group(refs, backpressure)
+
+    def tell_many(self, messages: Iterable[Tuple[ActorRefAbstract, MessageAbstract]]):
+        batch = []
+        for ref, message in messages:
+            if ref.is_addressable() and ref.address.is_global():
+                batch.append((message, "main", ref.address.target, ref.backpressure))
+            else:
+                ref.tell(message)
+        if batch:
+            self._messenger.send_many(batch)
+
     def __enter__(self) -> 'ActorSystem':
         self.start()
         return self
@@ -44,13 +133,54 @@ class ActorSystem:
         self._manager.__exit__(exc_type, exc_val, exc_tb)
 
     def fetch_message(self, timeout: float = None) -> MessageAbstract:
-        return self._incoming_messages.get(timeout=timeout)
+        return self._messages.get(timeout=timeout)
+
+    def fetch_messages(self, max_n: int, timeout: float = None) -> List[MessageAbstract]:
+        return drain_batch(self._messages.get, max_n, timeout=timeout)
+
+    def iter_messages(self, timeout: float = None, batch_size: int = 1024) -> Iterator[MessageAbstract]:
+        while True:
+            try:
+                messages = self.fetch_messages(batch_size, timeout=timeout)
+            except Empty:
+                return
+            yield from messages
+
+    async def aiter_messages(self, timeout: float = None, batch_size: int = 1024) -> AsyncIterator[MessageAbstract]:
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                messages = await loop.run_in_executor(None, self.fetch_messages, batch_size, timeout)
+            except Empty:
+                return
+            for message in messages:
+                yield message
 
     def start(self):
         self._cluster.start()
+        self._dispatcher = threading.Thread(target=self._dispatch, daemon=True)
+        self._dispatcher.start()
 
     def stop(self):
         self._cluster.stop()
+        if self._dispatcher is not None:
+            self._incoming_messages.put(StopReceiveLoop())
+            self._dispatcher.join()
+            self._dispatcher = None
+
+    def _dispatch(self):
+        while True:
+            for item in self._incoming_messages.get_batch(1024):
+                if isinstance(item, list):
+                    for message in item:
+                        self._messages.put(message)
+                elif isinstance(item, StopReceiveLoop):
+                    return
+                elif isinstance(item, UnclaimedReply):
+                    if self._messenger is not None:
+                        self._messenger.claim_reply(item)
+                else:
+                    self._messages.put(item)
 
     def get_active_nodes(self, timeout: float) -> List[NodeRef]:
         return self._cluster_ref.get_active_nodes(timeout=timeout)
@@ -0,0 +1,17 @@
+from .config import TracingConfig
+from .level import TraceLevel
+from .tracer import Tracer, TraceChannel
+
+_tracer = Tracer()
+
+
+def get_tracer(category: str) -> TraceChannel:
+    return _tracer.channel(category)
+
+
+def configure_tracing(config: TracingConfig):
+    _tracer.configure(config)
+
+
+def flush_traces():
+    _tracer.flush()
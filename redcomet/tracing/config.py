@@ -0,0 +1,28 @@
+from typing import Dict, TextIO
+
+from redcomet.tracing.level import TraceLevel
+
+
+class TracingConfig:
+    def __init__(self, level: int = TraceLevel.WARNING, categories: Dict[str, int] = None, buffer_size: int = 65536,
+                 flush_interval: float = 0.1, sink: TextIO = None):
+        self._level = level
+        self._categories = dict(categories or {})
+        self._buffer_size = buffer_size
+        self._flush_interval = flush_interval
+        self._sink = sink
+
+    def level_of(self, category: str) -> int:
+        return self._categories.get(category, self._level)
+
+    @property
+    def buffer_size(self) -> int:
+        return self._buffer_size
+
+    @property
+    def flush_interval(self) -> float:
+        return self._flush_interval
+
+    @property
+    def sink(self) -> TextIO:
+        return self._sink
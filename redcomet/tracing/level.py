@@ -0,0 +1,5 @@
+class TraceLevel:
+    DEBUG = 10
+    INFO = 20
+    WARNING = 30
+    OFF = 100
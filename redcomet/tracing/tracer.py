@@ -0,0 +1,100 @@
+import multiprocessing
+import os
+import sys
+import threading
+import time
+from collections import deque
+from multiprocessing.util import Finalize
+from typing import Dict, Tuple, Any, Optional
+
+from redcomet.tracing.config import TracingConfig
+from redcomet.tracing.level import TraceLevel
+
+_LEVEL_NAMES = {TraceLevel.DEBUG: "DEBUG", TraceLevel.INFO: "INFO", TraceLevel.WARNING: "WARNING"}
+
+
+class TraceChannel:
+    __slots__ = ("_tracer", "_category", "debug_enabled", "info_enabled", "warning_enabled")
+
+    def __init__(self, tracer: 'Tracer', category: str):
+        self._tracer = tracer
+        self._category = category
+        self.set_level(TraceLevel.OFF)
+
+    def set_level(self, level: int):
+        self.debug_enabled = level <= TraceLevel.DEBUG
+        self.info_enabled = level <= TraceLevel.INFO
+        self.warning_enabled = level <= TraceLevel.WARNING
+
+    def debug(self, message: str, *args: Any):
+        if self.debug_enabled:
+            self._tracer.record(self._category, TraceLevel.DEBUG, message, args)
+
+    def info(self, message: str, *args: Any):
+        if self.info_enabled:
+            self._tracer.record(self._category, TraceLevel.INFO, message, args)
+
+    def warning(self, message: str, *args: Any):
+        if self.warning_enabled:
+            self._tracer.record(self._category, TraceLevel.WARNING, message, args)
+
+
+class Tracer:
+    def __init__(self, config: TracingConfig = None):
+        self._config = config or TracingConfig()
+        self._channels: Dict[str, TraceChannel] = {}
+        self._records: deque = deque(maxlen=self._config.buffer_size)
+        self._flush_lock = threading.Lock()
+        self._flusher_pid: Optional[int] = None
+
+    def channel(self, category: str) -> TraceChannel:
+        channel = self._channels.get(category)
+        if channel is None:
+            channel = self._channels[category] = TraceChannel(self, category)
+            channel.set_level(self._config.level_of(category))
+        return channel
+
+    def configure(self, config: TracingConfig):
+        self.flush()
+        self._config = config
+        self._records = deque(maxlen=config.buffer_size)
+        for category, channel in self._channels.items():
+            channel.set_level(config.level_of(category))
+
+    def record(self, category: str, level: int, message: str, args: Tuple[Any, ...]):
+        if self._flusher_pid != os.getpid():
+            self._start_flusher()
+        self._records.append((time.time(), multiprocessing.current_process().name, category, level, message, args))
+
+    def flush(self):
+        with self._flush_lock:
+            lines = []
+            records = self._records
+            while records:
+                lines.append(_format(*records.popleft()))
+            if lines:
+                sink = self._config.sink or sys.stderr
+                sink.write("".join(lines))
+                sink.flush()
+
+    def _start_flusher(self):
+        self._flusher_pid = os.getpid()
+        self._flush_lock = threading.Lock()
+        self._records.clear()
+        Finalize(self, self.flush, exitpriority=10)
+        threading.Thread(target=self._flush_periodically, daemon=True).start()
+
+    def _flush_periodically(self):
+        while True:
+            time.sleep(self._config.flush_interval)
+            self.flush()
+
+
+def _format(timestamp: float, process_name: str, category: str, level: int, message: str,
+            args: Tuple[Any, ...]) -> str:
+    try:
+        text = message % args if args else message
+    except Exception as e:
+        text = f"{message!r} % {args!r} failed: {e!r}"
+    level_name = _LEVEL_NAMES.get(level, str(level))
+    return f"{timestamp:.6f} {process_name} {level_name} [{category}] {text}\n"
@@ -22,7 +22,7 @@ setup(
     author_email=EMAIL,
     description=None,
     long_description=None,
-    python_requires='>=3.6',
+    python_requires='>=3.8',
     install_requires=requirements,
     classifiers=[],
     include_package_data=True,
@@ -0,0 +1,69 @@
+import asyncio
+import time
+
+import pytest
+
+from redcomet.base.actor import ActorRefAbstract
+from redcomet.base.actor.abstract import ActorAbstract
+from redcomet.base.actor.asynchronous import AsyncActorAbstract
+from redcomet.base.actor.message import MessageAbstract
+from redcomet.base.cluster.ref import ClusterRefAbstract
+from redcomet.implementation.messenger.inbox.queue.process_safe import ProcessSafeQueueManager
+from redcomet.messenger.inbox.queue import QueueAbstract
+from redcomet.system import ActorSystem
+
+N_ACTORS = 100
+N_MESSAGES_PER_ACTOR = 10
+IO_LATENCY = 0.01
+
+
+class Request(MessageAbstract):
+    pass
+
+
+class BlockingWorker(ActorAbstract):
+    def __init__(self, done: QueueAbstract):
+        self._done = done
+        self._count = 0
+
+    def receive(self, message: MessageAbstract, sender: ActorRefAbstract, me: ActorRefAbstract,
+                cluster: ClusterRefAbstract):
+        time.sleep(IO_LATENCY)
+        self._count += 1
+        if self._count == N_MESSAGES_PER_ACTOR:
+            self._done.put(time.monotonic())
+
+
+class AsyncWorker(AsyncActorAbstract):
+    def __init__(self, done: QueueAbstract):
+        self._done = done
+        self._count = 0
+
+    async def receive(self, message: MessageAbstract, sender: ActorRefAbstract, me: ActorRefAbstract,
+                      cluster: ClusterRefAbstract):
+        await asyncio.sleep(IO_LATENCY)
+        self._count += 1
+        if self._count == N_MESSAGES_PER_ACTOR:
+            self._done.put(time.monotonic())
+
+
+def _messages_per_second(asynchronous: bool) -> float:
+    worker_type = AsyncWorker if asynchronous else BlockingWorker
+    with ProcessSafeQueueManager() as done:
+        with ActorSystem.create(parallel=True, asynchronous=asynchronous) as system:
+            workers = [system.spawn(worker_type(done)) for _ in range(N_ACTORS)]
+            time.sleep(0.5)
+            start = time.monotonic()
+            for _ in range(N_MESSAGES_PER_ACTOR):
+                for worker in workers:
+                    worker.tell(Request())
+            finished = max(done.get(timeout=120) for _ in range(N_ACTORS))
+    return N_ACTORS * N_MESSAGES_PER_ACTOR / (finished - start)
+
+
+@pytest.mark.benchmark
+def test_io_bound_actor_messages_per_second():
+    process_rate = _messages_per_second(asynchronous=False)
+    asyncio_rate = _messages_per_second(asynchronous=True)
+    print(f"\nio-bound actors ({IO_LATENCY * 1000:.0f} ms latency): process node={process_rate:.0f} messages/s, "
+          f"asyncio node={asyncio_rate:.0f} messages/s ({asyncio_rate / process_rate:.1f}x)")
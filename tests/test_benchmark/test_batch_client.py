@@ -0,0 +1,58 @@
+import time
+
+import pytest
+
+from redcomet.base.actor import ActorRefAbstract
+from redcomet.base.actor.abstract import ActorAbstract
+from redcomet.base.actor.message import MessageAbstract
+from redcomet.base.cluster.ref import ClusterRefAbstract
+from redcomet.system import ActorSystem
+
+N_EVENTS = 20_000
+BATCH_SIZE = 1000
+
+
+class Event(MessageAbstract):
+    __slots__ = ("value",)
+
+    def __init__(self, value: int):
+        self.value = value
+
+
+class Echo(ActorAbstract):
+    def receive(self, message: MessageAbstract, sender: ActorRefAbstract, me: ActorRefAbstract,
+                cluster: ClusterRefAbstract):
+        sender.tell(message)
+
+
+def _one_by_one() -> float:
+    with ActorSystem.create(n_worker_nodes=2, parallel=True) as system:
+        actors = [system.spawn(Echo()) for _ in range(4)]
+        time.sleep(0.2)
+        start = time.perf_counter()
+        for i in range(N_EVENTS):
+            actors[i % 4].tell(Event(i))
+        for _ in range(N_EVENTS):
+            system.fetch_message(timeout=30)
+        return N_EVENTS / (time.perf_counter() - start)
+
+
+def _batched() -> float:
+    with ActorSystem.create(n_worker_nodes=2, parallel=True, gateway_batch_size=BATCH_SIZE) as system:
+        actors = system.spawn_many(Echo() for _ in range(4))
+        time.sleep(0.2)
+        start = time.perf_counter()
+        for offset in range(0, N_EVENTS, BATCH_SIZE):
+            system.tell_many((actors[i % 4], Event(i)) for i in range(offset, offset + BATCH_SIZE))
+        received = 0
+        while received < N_EVENTS:
+            received += len(system.fetch_messages(BATCH_SIZE, timeout=30))
+        return N_EVENTS / (time.perf_counter() - start)
+
+
+@pytest.mark.benchmark
+def test_batched_client_round_trip_throughput():
+    single = _one_by_one()
+    batched = _batched()
+    print(f"\nclient round trip through gateway: one by one={single:.0f} events/s, "
+          f"batched={batched:.0f} events/s ({batched / single:.1f}x)")
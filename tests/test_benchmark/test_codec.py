@@ -0,0 +1,42 @@
+import time
+
+import pytest
+
+from redcomet.base.actor.message import MessageAbstract
+from redcomet.base.messaging.address import Address
+from redcomet.base.messaging.codec import PacketCodecAbstract
+from redcomet.base.messaging.packet import Packet
+from redcomet.messenger.codec import CompactCodec, PickleCodec
+from redcomet.system.codec import register_system_codec
+
+N_PACKETS = 20000
+
+
+class Tick(MessageAbstract):
+    def __init__(self, value: int):
+        self.value = value
+
+
+def _packet() -> Packet:
+    return Packet(Tick(1), sender=Address("node0", "0123456789abcdef0123456789abcdef"),
+                  receiver=Address("node1", "fedcba9876543210fedcba9876543210"))
+
+
+def _measure(codec: PacketCodecAbstract):
+    packet = _packet()
+    start = time.perf_counter()
+    for _ in range(N_PACKETS):
+        codec.decode(codec.encode(packet))
+    elapsed = time.perf_counter() - start
+    return len(codec.encode(packet)), elapsed / N_PACKETS * 1_000_000
+
+
+@pytest.mark.benchmark
+def test_codec_size_and_roundtrip_time():
+    compact = CompactCodec()
+    register_system_codec(compact, ["main", "node0", "node1"])
+    compact.register_type(Tick)
+
+    for name, codec in [("pickle", PickleCodec()), ("compact", compact)]:
+        size, roundtrip_us = _measure(codec)
+        print(f"\n{name} codec: {size} bytes, {roundtrip_us:.2f} us per encode+decode")
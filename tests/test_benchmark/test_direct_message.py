@@ -0,0 +1,40 @@
+import time
+
+import pytest
+
+from redcomet.base.messaging.address import Address
+from redcomet.base.messaging.packet import Packet
+from redcomet.messenger.direct_message.manager import DirectMessageManager
+from redcomet.messenger.handler.executor.messenger_command import MessengerCommandExecutor
+from redcomet.system import ActorSystem
+from tests.test_messenger.mock import DummyMessage
+
+N_ASKS = 100_000
+
+
+@pytest.mark.benchmark
+def test_sequential_direct_message_asks():
+    manager = DirectMessageManager()
+    executor = MessengerCommandExecutor(manager)
+    sender, receiver = Address("node1", "actor"), Address("node0", "messenger")
+
+    start = time.perf_counter()
+    for i in range(N_ASKS):
+        with manager.create_message_box() as box:
+            executor.filter_packet(Packet(DummyMessage(i, box.ref_id), sender=sender, receiver=receiver))
+            box.get(timeout=1)
+    elapsed = time.perf_counter() - start
+
+    print(f"\n{N_ASKS} sequential direct message asks: {elapsed:.2f} s, {elapsed / N_ASKS * 1_000_000:.2f} us/ask")
+
+
+@pytest.mark.benchmark
+def test_sequential_active_node_queries():
+    with ActorSystem.create(n_worker_nodes=1) as system:
+        start = time.perf_counter()
+        for _ in range(N_ASKS):
+            system.get_active_nodes(timeout=1)
+        elapsed = time.perf_counter() - start
+
+    print(f"\n{N_ASKS} sequential active node queries: {elapsed:.2f} s, "
+          f"{elapsed / N_ASKS * 1_000_000:.2f} us/query")
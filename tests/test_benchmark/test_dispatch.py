@@ -0,0 +1,38 @@
+import time
+
+import pytest
+
+from redcomet.actor.executor import ActorExecutor
+from redcomet.base.actor import ActorRefAbstract
+from redcomet.base.actor.abstract import ActorAbstract
+from redcomet.base.actor.message import MessageAbstract
+from redcomet.base.cluster.ref import ClusterRefAbstract
+from redcomet.base.messaging.address import Address
+from redcomet.node.process import ProcessNode
+
+N_MESSAGES = 1_000_000
+
+
+class Noop(MessageAbstract):
+    pass
+
+
+class NoopActor(ActorAbstract):
+    def receive(self, message: MessageAbstract, sender: ActorRefAbstract, me: ActorRefAbstract,
+                cluster: ClusterRefAbstract):
+        pass
+
+
+@pytest.mark.benchmark
+def test_dispatch_overhead_per_message():
+    executor = ActorExecutor()
+    executor.set_node(ProcessNode(None, executor))
+    executor.register("actor", NoopActor())
+    message = Noop()
+    sender = Address("node0", "sender")
+
+    start = time.perf_counter()
+    for _ in range(N_MESSAGES):
+        executor.execute(message, sender, "actor")
+    elapsed = time.perf_counter() - start
+    print(f"\ndispatch to no-op actor: {elapsed / N_MESSAGES * 1e9:.0f} ns/message")
@@ -0,0 +1,82 @@
+import time
+from multiprocessing import Process
+from typing import Callable
+
+import pytest
+
+from redcomet.base.actor import ActorRefAbstract
+from redcomet.base.actor.abstract import ActorAbstract
+from redcomet.base.actor.message import MessageAbstract
+from redcomet.base.cluster.ref import ClusterRefAbstract
+from redcomet.base.messaging.address import Address
+from redcomet.base.messaging.packet import Packet
+from redcomet.implementation.messenger.inbox.queue.process_safe import ProcessSafeQueueManager
+from redcomet.implementation.messenger.inbox.queue.shared_memory import SharedMemoryQueueManager
+from redcomet.messenger.inbox.queue import QueueAbstract, QueueManagerAbstract
+from redcomet.system import ActorSystem
+
+N_PACKETS = 20000
+N_MESSAGES = 2000
+
+
+class Tick(MessageAbstract):
+    pass
+
+
+class Counter(ActorAbstract):
+    def __init__(self, n: int, done: QueueAbstract):
+        self._n = n
+        self._done = done
+        self._count = 0
+
+    def receive(self, message: MessageAbstract, sender: ActorRefAbstract, me: ActorRefAbstract,
+                cluster: ClusterRefAbstract):
+        self._count += 1
+        if self._count == self._n:
+            self._done.put(time.monotonic())
+
+
+def _produce(queue: QueueAbstract, n: int):
+    packet = Packet(Tick(), sender=Address("node0", "sender"), receiver=Address("node1", "receiver"))
+    for _ in range(n):
+        queue.put(packet)
+
+
+def _packets_per_second(manager: QueueManagerAbstract) -> float:
+    with manager as queue:
+        producer = Process(target=_produce, args=(queue, N_PACKETS))
+        start = time.monotonic()
+        producer.start()
+        for _ in range(N_PACKETS):
+            queue.get(timeout=10)
+        elapsed = time.monotonic() - start
+        producer.join()
+    return N_PACKETS / elapsed
+
+
+def _node_messages_per_second(factory: Callable[[], QueueManagerAbstract]) -> float:
+    with ProcessSafeQueueManager() as done:
+        with ActorSystem.create(parallel=True, inbox_queue_manager_factory=factory) as system:
+            counter = system.spawn(Counter(N_MESSAGES, done))
+            time.sleep(0.1)
+            start = time.monotonic()
+            for _ in range(N_MESSAGES):
+                counter.tell(Tick())
+            finished = done.get(timeout=60)
+    return N_MESSAGES / (finished - start)
+
+
+@pytest.mark.benchmark
+def test_inbox_queue_packets_per_second():
+    manager_rate = _packets_per_second(ProcessSafeQueueManager())
+    shared_memory_rate = _packets_per_second(SharedMemoryQueueManager())
+    print(f"\ninbox queue: manager={manager_rate:.0f} packets/s, shared memory={shared_memory_rate:.0f} packets/s "
+          f"({shared_memory_rate / manager_rate:.1f}x)")
+
+
+@pytest.mark.benchmark
+def test_process_node_messages_per_second():
+    manager_rate = _node_messages_per_second(ProcessSafeQueueManager)
+    shared_memory_rate = _node_messages_per_second(SharedMemoryQueueManager)
+    print(f"\nprocess nodes: manager={manager_rate:.0f} messages/s, shared memory={shared_memory_rate:.0f} messages/s "
+          f"({shared_memory_rate / manager_rate:.1f}x)")
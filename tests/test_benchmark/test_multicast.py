@@ -0,0 +1,64 @@
+import time
+
+import pytest
+
+from redcomet.base.actor import ActorRefAbstract
+from redcomet.base.actor.abstract import ActorAbstract
+from redcomet.base.actor.message import MessageAbstract
+from redcomet.base.cluster.ref import ClusterRefAbstract
+from redcomet.system import ActorSystem
+
+N_SUBSCRIBERS = 2000
+N_EVENTS = 20
+
+
+class Event(MessageAbstract):
+    __slots__ = ("value",)
+
+    def __init__(self, value: int):
+        self.value = value
+
+
+class Subscriber(ActorAbstract):
+    def receive(self, message: MessageAbstract, sender: ActorRefAbstract, me: ActorRefAbstract,
+                cluster: ClusterRefAbstract):
+        if message.value < 0:
+            sender.tell(message)
+
+
+def _wait_for_acks(system: ActorSystem):
+    received = 0
+    while received < N_SUBSCRIBERS:
+        received += len(system.fetch_messages(N_SUBSCRIBERS, timeout=60))
+
+
+def _fan_out(grouped: bool) -> float:
+    with ActorSystem.create(n_worker_nodes=2, parallel=True, gateway_batch_size=256) as system:
+        subscribers = system.spawn_many(Subscriber() for _ in range(N_SUBSCRIBERS))
+        group = system.group(subscribers)
+
+        def broadcast(event: Event):
+            if grouped:
+                group.tell(event)
+            else:
+                for subscriber in subscribers:
+                    subscriber.tell(event)
+
+        time.sleep(2.0)
+        broadcast(Event(-1))
+        _wait_for_acks(system)
+
+        start = time.perf_counter()
+        for i in range(N_EVENTS):
+            broadcast(Event(i))
+        broadcast(Event(-1))
+        _wait_for_acks(system)
+        return (N_EVENTS + 1) * N_SUBSCRIBERS / (time.perf_counter() - start)
+
+
+@pytest.mark.benchmark
+def test_multicast_fan_out_throughput():
+    single = _fan_out(grouped=False)
+    grouped = _fan_out(grouped=True)
+    print(f"\nfan out to {N_SUBSCRIBERS} subscribers: per receiver={single:.0f} deliveries/s, "
+          f"group={grouped:.0f} deliveries/s ({grouped / single:.1f}x)")
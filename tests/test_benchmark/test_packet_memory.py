@@ -0,0 +1,41 @@
+import gc
+import os
+import tracemalloc
+import uuid
+from collections import deque
+
+import pytest
+
+from redcomet.base.messaging.address import Address
+from redcomet.base.messaging.packet import Packet
+from redcomet.messenger.request import MessageForwardRequest
+from redcomet.messenger.inbox.message import StopReceiveLoop
+
+N_PACKETS = 1_000_000
+N_ACTORS = 1000
+
+
+def _queued_packets(n: int, actor_ids) -> deque:
+    content = StopReceiveLoop()
+    queue = deque()
+    for i in range(n):
+        sender_id, receiver_id = actor_ids[i % len(actor_ids)], actor_ids[(i + 1) % len(actor_ids)]
+        queue.append(Packet(MessageForwardRequest(content, sender_id, receiver_id),
+                            sender=Address("node0", "".join(sender_id)),
+                            receiver=Address("node1", "".join(receiver_id))))
+    return queue
+
+
+@pytest.mark.benchmark
+def test_in_flight_packet_memory_footprint():
+    n_packets = int(os.environ.get("REDCOMET_BENCHMARK_PACKETS", N_PACKETS))
+    actor_ids = [uuid.uuid4().hex for _ in range(N_ACTORS)]
+    gc.collect()
+    tracemalloc.start()
+    try:
+        queue = _queued_packets(n_packets, actor_ids)
+        allocated, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert len(queue) == n_packets
+    print(f"\n{n_packets} queued packets: {allocated / 2 ** 20:.1f} MiB, {allocated / n_packets:.0f} bytes per packet")
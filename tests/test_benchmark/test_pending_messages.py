@@ -0,0 +1,49 @@
+import time
+
+import pytest
+
+from redcomet.base.actor.message import MessageAbstract
+from redcomet.base.messaging.address import Address
+from redcomet.discovery.message.query.response import QueryAddressResponse
+from redcomet.discovery.ref import ActorDiscoveryRef
+from redcomet.messenger.batch import message_count
+from redcomet.messenger.request import MessageForwardRequest
+from tests.test_messenger.factory import create_messenger_for_test
+from tests.test_messenger.mock import MockQueue
+
+N_MESSAGES = 10000
+
+
+class Tick(MessageAbstract):
+    pass
+
+
+class CountingDiscoveryRef(ActorDiscoveryRef):
+    def __init__(self):
+        super().__init__(..., Address("main", "discovery"), "messenger")
+        self.queries = 0
+
+    def query_address(self, target: str, requester_node_id: str, requester_target: str):
+        self.queries += 1
+
+
+@pytest.mark.benchmark
+def test_first_messages_to_fresh_actor():
+    discovery = CountingDiscoveryRef()
+    your_inbox_queue = MockQueue()
+    me = create_messenger_for_test("me", discovery_ref=discovery)
+    you = create_messenger_for_test("you", inbox_queue=your_inbox_queue)
+    me.make_connection_to(you)
+
+    start = time.perf_counter()
+    for _ in range(N_MESSAGES):
+        me.receive(MessageForwardRequest(Tick(), "mine", "fresh"), ..., ..., ...)
+    me.receive(QueryAddressResponse("fresh", Address("you", "fresh")), ..., ..., ...)
+    elapsed = time.perf_counter() - start
+
+    received = 0
+    while not your_inbox_queue.empty():
+        received += message_count(your_inbox_queue.get())
+    assert received == N_MESSAGES
+    print(f"\nfirst {N_MESSAGES} messages to a fresh actor: {elapsed * 1000:.1f} ms, "
+          f"{discovery.queries} discovery queries")
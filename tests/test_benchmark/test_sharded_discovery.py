@@ -0,0 +1,48 @@
+import time
+
+import pytest
+
+from redcomet.base.actor import ActorRefAbstract
+from redcomet.base.actor.abstract import ActorAbstract
+from redcomet.base.actor.message import MessageAbstract
+from redcomet.base.cluster.ref import ClusterRefAbstract
+from redcomet.implementation.messenger.inbox.queue.process_safe import ProcessSafeQueueManager
+from redcomet.messenger.inbox.queue import QueueAbstract
+from redcomet.system import ActorSystem
+
+N_WORKER_NODES = 4
+N_ACTORS = 400
+
+
+class Hello(MessageAbstract):
+    pass
+
+
+class Greeter(ActorAbstract):
+    def __init__(self, done: QueueAbstract):
+        self._done = done
+
+    def receive(self, message: MessageAbstract, sender: ActorRefAbstract, me: ActorRefAbstract,
+                cluster: ClusterRefAbstract):
+        self._done.put(time.monotonic())
+
+
+def _lookups_per_second(sharded_discovery: bool) -> float:
+    with ProcessSafeQueueManager() as done:
+        with ActorSystem.create(n_worker_nodes=N_WORKER_NODES, parallel=True,
+                                sharded_discovery=sharded_discovery) as system:
+            greeters = [system.spawn(Greeter(done)) for _ in range(N_ACTORS)]
+            time.sleep(1)
+            start = time.monotonic()
+            for greeter in greeters:
+                greeter.tell(Hello())
+            finished = max(done.get(timeout=60) for _ in range(N_ACTORS))
+    return N_ACTORS / (finished - start)
+
+
+@pytest.mark.benchmark
+def test_first_message_lookups_per_second():
+    central_rate = _lookups_per_second(sharded_discovery=False)
+    sharded_rate = _lookups_per_second(sharded_discovery=True)
+    print(f"\nfirst-message lookups with {N_WORKER_NODES} workers: central={central_rate:.0f}/s, "
+          f"sharded={sharded_rate:.0f}/s ({sharded_rate / central_rate:.1f}x)")
@@ -0,0 +1,54 @@
+import hashlib
+import time
+
+import pytest
+
+from redcomet.base.actor import ActorRefAbstract
+from redcomet.base.actor.abstract import ActorAbstract
+from redcomet.base.actor.message import MessageAbstract
+from redcomet.base.cluster.ref import ClusterRefAbstract
+from redcomet.implementation.messenger.inbox.queue.process_safe import ProcessSafeQueueManager
+from redcomet.messenger.inbox.queue import QueueAbstract
+from redcomet.system import ActorSystem
+
+N_ACTORS = 8
+N_MESSAGES_PER_ACTOR = 20
+PAYLOAD = bytes(8 * 1024 * 1024)
+
+
+class Digest(MessageAbstract):
+    pass
+
+
+class Hasher(ActorAbstract):
+    def __init__(self, done: QueueAbstract):
+        self._done = done
+        self._count = 0
+
+    def receive(self, message: MessageAbstract, sender: ActorRefAbstract, me: ActorRefAbstract,
+                cluster: ClusterRefAbstract):
+        hashlib.sha256(PAYLOAD).digest()
+        self._count += 1
+        if self._count == N_MESSAGES_PER_ACTOR:
+            self._done.put(time.monotonic())
+
+
+def _messages_per_second(thread_pool_size: int = None) -> float:
+    with ProcessSafeQueueManager() as done:
+        with ActorSystem.create(parallel=True, thread_pool_size=thread_pool_size) as system:
+            hashers = [system.spawn(Hasher(done)) for _ in range(N_ACTORS)]
+            time.sleep(0.5)
+            start = time.monotonic()
+            for _ in range(N_MESSAGES_PER_ACTOR):
+                for hasher in hashers:
+                    hasher.tell(Digest())
+            finished = max(done.get(timeout=120) for _ in range(N_ACTORS))
+    return N_ACTORS * N_MESSAGES_PER_ACTOR / (finished - start)
+
+
+@pytest.mark.benchmark
+def test_gil_releasing_actor_messages_per_second():
+    process_rate = _messages_per_second()
+    thread_pool_rate = _messages_per_second(thread_pool_size=N_ACTORS)
+    print(f"\ngil-releasing actors: process node={process_rate:.0f} messages/s, "
+          f"thread pool node={thread_pool_rate:.0f} messages/s ({thread_pool_rate / process_rate:.1f}x)")
@@ -0,0 +1,124 @@
+import multiprocessing
+import time
+
+import pytest
+
+from redcomet.base.actor import ActorRefAbstract
+from redcomet.base.actor.abstract import ActorAbstract
+from redcomet.base.actor.message import MessageAbstract
+from redcomet.base.cluster.ref import ClusterRefAbstract
+from redcomet.implementation.messenger.inbox.queue.process_safe import ProcessSafeQueueManager
+from redcomet.messenger.inbox.queue import QueueAbstract
+from redcomet.messenger.transport import Transport
+from redcomet.system import ActorSystem
+
+N_MESSAGES = 5000
+N_ROUND_TRIPS = 1000
+
+
+class Tick(MessageAbstract):
+    pass
+
+
+class Prepare(MessageAbstract):
+    pass
+
+
+class Start(MessageAbstract):
+    pass
+
+
+class Ball(MessageAbstract):
+    __slots__ = ("hits",)
+
+    def __init__(self, hits: int):
+        self.hits = hits
+
+
+class Counter(ActorAbstract):
+    def __init__(self, n: int, done: QueueAbstract):
+        self._n = n
+        self._done = done
+        self._count = 0
+
+    def receive(self, message: MessageAbstract, sender: ActorRefAbstract, me: ActorRefAbstract,
+                cluster: ClusterRefAbstract):
+        self._count += 1
+        if self._count == self._n:
+            self._done.put(time.monotonic())
+
+
+class Player(ActorAbstract):
+    def __init__(self, n: int, done: QueueAbstract):
+        self._n = n
+        self._done = done
+        self._partner = None
+        self._started = None
+
+    def receive(self, message: MessageAbstract, sender: ActorRefAbstract, me: ActorRefAbstract,
+                cluster: ClusterRefAbstract):
+        if isinstance(message, Prepare):
+            self._partner = cluster.spawn(Player(self._n, self._done))
+        elif isinstance(message, Start):
+            self._started = time.monotonic()
+            self._partner.tell(Ball(0))
+        elif isinstance(message, Ball):
+            if self._started is None:
+                sender.tell(message)
+            elif message.hits + 1 == self._n:
+                self._done.put(time.monotonic() - self._started)
+            else:
+                sender.tell(Ball(message.hits + 1))
+        else:
+            raise NotImplementedError()
+
+
+def _messages_per_second(transport: Transport) -> float:
+    with ProcessSafeQueueManager() as done:
+        with ActorSystem.create(parallel=True, transport=transport) as system:
+            counter = system.spawn(Counter(N_MESSAGES, done))
+            time.sleep(0.1)
+            start = time.monotonic()
+            for _ in range(N_MESSAGES):
+                counter.tell(Tick())
+            finished = done.get(timeout=60)
+    return N_MESSAGES / (finished - start)
+
+
+def _round_trip_us(transport: Transport) -> float:
+    with ProcessSafeQueueManager() as done:
+        with ActorSystem.create(n_worker_nodes=2, parallel=True, transport=transport) as system:
+            ping = system.spawn(Player(N_ROUND_TRIPS, done))
+            time.sleep(0.1)
+            ping.tell(Prepare())
+            time.sleep(0.1)
+            ping.tell(Start())
+            elapsed = done.get(timeout=60)
+    return elapsed / N_ROUND_TRIPS * 1_000_000
+
+
+def _n_processes(transport: Transport) -> int:
+    with ActorSystem.create(n_worker_nodes=2, parallel=True, transport=transport):
+        return len(multiprocessing.active_children())
+
+
+@pytest.mark.benchmark
+def test_transport_messages_per_second():
+    rates = {transport: _messages_per_second(transport) for transport in Transport}
+    queue_rate = rates[Transport.QUEUE]
+    print("\nthroughput: " + ", ".join(f"{transport.name.lower()}={rate:.0f} messages/s ({rate / queue_rate:.1f}x)"
+                                        for transport, rate in rates.items()))
+
+
+@pytest.mark.benchmark
+def test_transport_round_trip_latency():
+    latencies = {transport: _round_trip_us(transport) for transport in Transport}
+    print("\nround trip between nodes: " + ", ".join(f"{transport.name.lower()}={latency:.0f} us"
+                                                     for transport, latency in latencies.items()))
+
+
+@pytest.mark.benchmark
+def test_transport_process_count():
+    counts = {transport: _n_processes(transport) for transport in Transport}
+    print("\nprocesses for 3 nodes: " + ", ".join(f"{transport.name.lower()}={count}"
+                                                  for transport, count in counts.items()))
@@ -1,3 +1,5 @@
+from pytest import raises
+
 from redcomet.base.actor import ActorRefAbstract
 from redcomet.base.actor.abstract import ActorAbstract
 from redcomet.base.cluster.ref import ClusterRefAbstract
@@ -5,6 +7,8 @@ from redcomet.base.messaging.address import Address
 from redcomet.base.messenger.abstract import MessengerAbstract
 from redcomet.base.node.abstract import NodeAbstract
 from redcomet.cluster.manager import ClusterManager
+from redcomet.discovery.ring import ConsistentHashRing
+from redcomet.messenger.transport import TcpEndpoint
 from redcomet.node.manager.abstract import NodeManagerAbstract
 from redcomet.node.ref import NodeRef
 
@@ -78,3 +82,9 @@ def test_should_connect_with_other_nodes():
 
     assert node0 in node.connected_nodes and node in node0.connected_nodes
     assert node1 in node.connected_nodes and node in node1.connected_nodes
+
+
+def test_should_reject_remote_node_with_sharded_discovery():
+    cluster = ClusterManager(MockNode(), "cluster", Address("main", "discovery"), discovery_ring=ConsistentHashRing())
+    with raises(ValueError):
+        cluster.add_node(TcpEndpoint("127.0.0.1", 1), "remote0")
@@ -0,0 +1,180 @@
+import time
+from typing import Any
+
+from redcomet.base.actor import ActorRefAbstract
+from redcomet.base.actor.abstract import ActorAbstract
+from redcomet.base.actor.message import MessageAbstract
+from redcomet.base.cluster.ref import ClusterRefAbstract
+from redcomet.base.discovery.ref import ActorDiscoveryRefAbstract
+from redcomet.base.messaging.packet import Packet
+from redcomet.base.messenger.abstract import MessengerAbstract
+from redcomet.base.messenger.backpressure import Backpressure
+from redcomet.base.messenger.direct_message.ref import DirectMessageBoxRefAbstract
+from redcomet.base.node.ref import NodeRefAbstract
+from redcomet.cluster.manager import ClusterManager
+from redcomet.cluster.message.heartbeat.request import HeartbeatRequest
+from redcomet.cluster.message.heartbeat.response import HeartbeatResponse
+from redcomet.cluster.message.list_active_node.request import ListActiveNodeRequest
+from redcomet.cluster.message.list_active_node.response import ListActiveNodeResponse
+from redcomet.cluster.message.node_status.request import NodeStatusRequest
+from redcomet.cluster.message.node_status.response import NodeStatusResponse
+from redcomet.cluster.message.spawn_actor.request import SpawnActorRequest
+from redcomet.cluster.status import NodeStatus
+from redcomet.node.ref import NodeRef
+
+
+class MockDirectMessageBoxRef(DirectMessageBoxRefAbstract):
+    def __init__(self, response: MessageAbstract = None):
+        self._response = response
+
+    def put(self, item: MessageAbstract):
+        pass
+
+    def get(self, timeout: float) -> Any:
+        if self._response is None:
+            raise TimeoutError()
+        return self._response
+
+    @property
+    def ref_id(self) -> str:
+        return "box"
+
+    def __enter__(self) -> 'DirectMessageBoxRefAbstract':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+
+class MockMessenger(MessengerAbstract):
+    def __init__(self, response: MessageAbstract = None):
+        self._response = response
+        self.sent_packet = None
+
+    def create_direct_message_box(self) -> DirectMessageBoxRefAbstract:
+        return MockDirectMessageBoxRef(self._response)
+
+    def send(self, message: MessageAbstract, sender_id: str, receiver_id: str,
+             backpressure: Backpressure = Backpressure.BLOCK):
+        pass
+
+    def send_packet(self, packet: Packet):
+        self.sent_packet = packet
+
+    def assign_node_id(self, node_id: str):
+        pass
+
+    def bind_discovery(self, ref: ActorDiscoveryRefAbstract):
+        pass
+
+    def make_connection_to(self, other: 'MessengerAbstract'):
+        pass
+
+    @property
+    def node_id(self) -> str:
+        return ""
+
+
+class MockActorRef(ActorRefAbstract):
+    def __init__(self):
+        self.told_messages = []
+
+    def tell(self, message: MessageAbstract):
+        self.told_messages.append(message)
+
+    def bind(self, ref: 'ActorRefAbstract') -> 'ActorRefAbstract':
+        pass
+
+    @property
+    def address(self) -> str:
+        return ""
+
+
+class MockNodeRef(NodeRefAbstract):
+    def __init__(self, node_id: str):
+        self._node_id = node_id
+        self.registered_actor_ids = []
+
+    def register_address(self, actor_id: str, actor: ActorAbstract):
+        self.registered_actor_ids.append(actor_id)
+
+    @property
+    def node_id(self) -> str:
+        return self._node_id
+
+
+class MyActor(ActorAbstract):
+    def receive(self, message: MessageAbstract, sender: ActorRefAbstract, me: ActorRefAbstract,
+                cluster: ClusterRefAbstract):
+        pass
+
+
+def test_should_reply_to_heartbeat_with_sent_time():
+    cluster = ClusterManager(..., "cluster", ..., node_refs={"node0": MockNodeRef("node0")})
+    sender = MockActorRef()
+
+    cluster.receive(HeartbeatRequest("node0", sent_at=12.5), sender, ..., ...)
+
+    response: HeartbeatResponse = sender.told_messages[0]
+    assert isinstance(response, HeartbeatResponse) and response.sent_at == 12.5
+
+
+def test_should_record_round_trip_time_from_heartbeat():
+    cluster = ClusterManager(..., "cluster", ..., node_refs={"node0": MockNodeRef("node0")})
+
+    cluster.receive(HeartbeatRequest("node0", sent_at=0.0, rtt=0.003), MockActorRef(), ..., ...)
+
+    liveness = cluster.liveness["node0"]
+    assert liveness.rtt == 0.003 and liveness.heartbeats == 1
+
+
+def test_should_list_only_nodes_with_recent_heartbeat():
+    cluster = ClusterManager(..., "cluster", ..., node_refs={"node0": MockNodeRef("node0"),
+                                                            "node1": MockNodeRef("node1")},
+                             heartbeat_timeout=0.05)
+    time.sleep(0.1)
+    cluster.receive(HeartbeatRequest("node1", sent_at=0.0, rtt=0.001), MockActorRef(), ..., ...)
+    sender = MockActorRef()
+
+    cluster.receive(ListActiveNodeRequest("abc"), sender, ..., ...)
+
+    response: ListActiveNodeResponse = sender.told_messages[0]
+    assert response.node_ids == ["node1"]
+    assert response.statuses[0].rtt == 0.001 and response.statuses[0].last_seen < 0.05
+
+
+def test_should_not_spawn_on_node_without_recent_heartbeat():
+    node0, node1 = MockNodeRef("node0"), MockNodeRef("node1")
+    cluster = ClusterManager(..., "cluster", ..., node_refs={"node0": node0, "node1": node1},
+                             heartbeat_timeout=0.05)
+    time.sleep(0.1)
+    cluster.receive(HeartbeatRequest("node1", sent_at=0.0), MockActorRef(), ..., ...)
+
+    for actor_id in ["a", "b"]:
+        cluster.receive(SpawnActorRequest(MyActor(), actor_id), ..., ..., ...)
+
+    assert node0.registered_actor_ids == [] and node1.registered_actor_ids == ["a", "b"]
+
+
+def test_should_reply_inactive_status_for_unknown_node():
+    cluster = ClusterManager(..., "cluster", ...)
+    sender = MockActorRef()
+
+    cluster.receive(NodeStatusRequest("node9", "abc"), sender, ..., ...)
+
+    response: NodeStatusResponse = sender.told_messages[0]
+    assert response.ref_id == "abc" and not response.status.active
+
+
+def test_node_ref_should_be_active_from_status_response():
+    messenger = MockMessenger(NodeStatusResponse(NodeStatus("node0", active=True, rtt=0.002), ""))
+    ref = NodeRef(messenger, "me", "node0")
+
+    assert ref.is_active(timeout=0.001) and ref.status.rtt == 0.002
+    assert isinstance(messenger.sent_packet.content, NodeStatusRequest)
+
+
+def test_node_ref_should_be_inactive_on_timeout():
+    ref = NodeRef(MockMessenger(), "me", "node0")
+
+    assert not ref.is_active(timeout=0.001)
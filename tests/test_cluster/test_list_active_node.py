@@ -5,6 +5,7 @@ from redcomet.base.actor.message import MessageAbstract
 from redcomet.base.discovery.ref import ActorDiscoveryRefAbstract
 from redcomet.base.messaging.packet import Packet
 from redcomet.base.messenger.abstract import MessengerAbstract
+from redcomet.base.messenger.backpressure import Backpressure
 from redcomet.base.messenger.direct_message.ref import DirectMessageBoxRefAbstract
 from redcomet.cluster.manager import ClusterManager
 from redcomet.cluster.message.list_active_node.request import ListActiveNodeRequest
@@ -43,7 +44,8 @@ class MockMessenger(MessengerAbstract):
         self._active_node_response = active_node_response
         self.sent_packet = None
 
-    def send(self, message: MessageAbstract, sender_id: str, receiver_id: str):
+    def send(self, message: MessageAbstract, sender_id: str, receiver_id: str,
+             backpressure: Backpressure = Backpressure.BLOCK):
         pass
 
     def send_packet(self, packet: Packet):
@@ -0,0 +1,55 @@
+from typing import List, Tuple
+
+from redcomet.base.actor import ActorRefAbstract
+from redcomet.base.actor.abstract import ActorAbstract
+from redcomet.base.actor.message import MessageAbstract
+from redcomet.base.cluster.ref import ClusterRefAbstract
+from redcomet.base.node.ref import NodeRefAbstract
+from redcomet.cluster.manager import ClusterManager
+from redcomet.cluster.message.migrate_actor.request import MigrateActorRequest
+from redcomet.cluster.message.spawn_actor.request import SpawnActorRequest
+
+
+class MockNodeRef(NodeRefAbstract):
+    def __init__(self, node_id: str):
+        self._node_id = node_id
+        self.migrated: List[Tuple[str, str]] = []
+
+    def register_address(self, actor_id: str, actor: ActorAbstract, replace: bool = False):
+        pass
+
+    def migrate_actor(self, actor_id: str, node_id: str):
+        self.migrated.append((actor_id, node_id))
+
+    @property
+    def node_id(self) -> str:
+        return self._node_id
+
+
+class MyActor(ActorAbstract):
+    def receive(self, message: MessageAbstract, sender: ActorRefAbstract, me: ActorRefAbstract,
+                cluster: ClusterRefAbstract):
+        pass
+
+
+def test_should_ask_source_node_to_migrate_actor():
+    node0, node1 = MockNodeRef("node0"), MockNodeRef("node1")
+    cluster = ClusterManager(..., "cluster", ..., node_refs={"node0": node0, "node1": node1})
+    cluster.receive(SpawnActorRequest(MyActor(), "abc"), ..., ..., ...)
+
+    cluster.receive(MigrateActorRequest("abc", "node1"), ..., ..., ...)
+
+    assert node0.migrated == [("abc", "node1")] and cluster.placements == {"abc": "node1"}
+    assert (cluster.loads["node0"].n_actors, cluster.loads["node1"].n_actors) == (0, 1)
+
+
+def test_should_ignore_migration_to_current_or_unknown_node():
+    node0 = MockNodeRef("node0")
+    cluster = ClusterManager(..., "cluster", ..., node_refs={"node0": node0})
+    cluster.receive(SpawnActorRequest(MyActor(), "abc"), ..., ..., ...)
+
+    cluster.receive(MigrateActorRequest("abc", "node0"), ..., ..., ...)
+    cluster.receive(MigrateActorRequest("abc", "node9"), ..., ..., ...)
+    cluster.receive(MigrateActorRequest("xyz", "node0"), ..., ..., ...)
+
+    assert node0.migrated == [] and cluster.placements == {"abc": "node0"}
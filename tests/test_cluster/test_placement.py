@@ -0,0 +1,109 @@
+from redcomet.base.actor import ActorRefAbstract
+from redcomet.base.actor.abstract import ActorAbstract
+from redcomet.base.actor.message import MessageAbstract
+from redcomet.base.cluster.ref import ClusterRefAbstract
+from redcomet.base.node.ref import NodeRefAbstract
+from redcomet.cluster.load import NodeLoad
+from redcomet.cluster.manager import ClusterManager
+from redcomet.cluster.message.load_report.report import NodeLoadReport
+from redcomet.cluster.message.spawn_actor.request import SpawnActorRequest
+from redcomet.cluster.placement import RoundRobinPlacement, LeastInboxDepthPlacement, LeastActorsPlacement, \
+    PowerOfTwoChoicesPlacement
+
+
+class MockNodeRef(NodeRefAbstract):
+    def __init__(self, node_id: str):
+        self._node_id = node_id
+        self.registered_actor_ids = []
+
+    def register_address(self, actor_id: str, actor: ActorAbstract):
+        self.registered_actor_ids.append(actor_id)
+
+    @property
+    def node_id(self) -> str:
+        return self._node_id
+
+
+class MyActor(ActorAbstract):
+    def receive(self, message: MessageAbstract, sender: ActorRefAbstract, me: ActorRefAbstract,
+                cluster: ClusterRefAbstract):
+        pass
+
+
+def test_should_place_in_round_robin():
+    placement = RoundRobinPlacement()
+    loads = {"node0": NodeLoad(), "node1": NodeLoad()}
+
+    selected = [placement.select(["node0", "node1"], loads) for _ in range(3)]
+
+    assert selected == ["node0", "node1", "node0"]
+
+
+def test_should_place_on_node_with_least_inbox_depth():
+    placement = LeastInboxDepthPlacement()
+    loads = {"node0": NodeLoad(inbox_depth=10), "node1": NodeLoad(inbox_depth=2, n_actors=5)}
+
+    assert placement.select(["node0", "node1"], loads) == "node1"
+
+
+def test_should_place_on_node_with_least_actors():
+    placement = LeastActorsPlacement()
+    loads = {"node0": NodeLoad(n_actors=3), "node1": NodeLoad(inbox_depth=100, n_actors=1)}
+
+    assert placement.select(["node0", "node1"], loads) == "node1"
+
+
+def test_should_place_on_less_loaded_of_two_sampled_nodes():
+    placement = PowerOfTwoChoicesPlacement(seed=0)
+    loads = {"node0": NodeLoad(inbox_depth=100), "node1": NodeLoad(inbox_depth=0)}
+
+    selected = {placement.select(["node0", "node1"], loads) for _ in range(10)}
+
+    assert selected == {"node1"}
+
+
+def test_should_update_node_load_from_report():
+    cluster = ClusterManager(..., "cluster", ..., node_refs={"node0": MockNodeRef("node0")})
+
+    cluster.receive(NodeLoadReport("node0", inbox_depth=7, n_actors=3), ..., ..., ...)
+
+    load = cluster.loads["node0"]
+    assert (load.inbox_depth, load.n_actors) == (7, 3) and load.reported_at is not None
+
+
+def test_should_record_blocked_send_time_from_report():
+    cluster = ClusterManager(..., "cluster", ..., node_refs={"node0": MockNodeRef("node0")})
+
+    cluster.receive(NodeLoadReport("node0", inbox_depth=0, n_actors=1, blocked_send_time=1.5), ..., ..., ...)
+
+    assert cluster.loads["node0"].blocked_send_time == 1.5
+
+
+def test_should_ignore_report_from_unknown_node():
+    cluster = ClusterManager(..., "cluster", ..., node_refs={"node0": MockNodeRef("node0")})
+
+    cluster.receive(NodeLoadReport("node9", inbox_depth=7, n_actors=3), ..., ..., ...)
+
+    assert list(cluster.loads.keys()) == ["node0"]
+
+
+def test_should_spawn_actor_on_least_loaded_node():
+    node0, node1 = MockNodeRef("node0"), MockNodeRef("node1")
+    cluster = ClusterManager(..., "cluster", ..., node_refs={"node0": node0, "node1": node1},
+                             placement=LeastInboxDepthPlacement())
+    cluster.receive(NodeLoadReport("node0", inbox_depth=50, n_actors=1), ..., ..., ...)
+
+    cluster.receive(SpawnActorRequest(MyActor(), "abc"), ..., ..., ...)
+
+    assert node0.registered_actor_ids == [] and node1.registered_actor_ids == ["abc"]
+
+
+def test_should_count_placed_actors_until_next_report():
+    node0, node1 = MockNodeRef("node0"), MockNodeRef("node1")
+    cluster = ClusterManager(..., "cluster", ..., node_refs={"node0": node0, "node1": node1},
+                             placement=LeastActorsPlacement())
+
+    for actor_id in ["a", "b", "c", "d"]:
+        cluster.receive(SpawnActorRequest(MyActor(), actor_id), ..., ..., ...)
+
+    assert node0.registered_actor_ids == ["a", "c"] and node1.registered_actor_ids == ["b", "d"]
@@ -0,0 +1,117 @@
+from typing import List, Optional
+
+import pytest
+
+from redcomet.actor.router import RouterRef
+from redcomet.actor.routing import RoundRobinRouting, RandomRouting, SmallestNodeQueueRouting, ConsistentHashRouting
+from redcomet.base.actor import ActorRefAbstract
+from redcomet.base.actor.message import MessageAbstract
+from redcomet.base.messaging.address import Address
+
+
+class KeyedMessage(MessageAbstract):
+    def __init__(self, key: str = None):
+        self.key = key
+
+    @property
+    def routing_key(self) -> str:
+        return self.key
+
+
+class MockActorRef(ActorRefAbstract):
+    def __init__(self, actor_id: str, depth: Optional[int] = 0):
+        self._address = Address.anywhere(actor_id)
+        self._depth = depth
+        self.told: List[MessageAbstract] = []
+
+    def tell(self, message: MessageAbstract):
+        self.told.append(message)
+
+    def bind(self, ref: ActorRefAbstract) -> ActorRefAbstract:
+        return self
+
+    def node_queue_depth(self) -> Optional[int]:
+        return self._depth
+
+    @property
+    def address(self) -> Address:
+        return self._address
+
+
+def test_should_route_in_round_robin():
+    routees = [MockActorRef("a"), MockActorRef("b")]
+    router = RouterRef(routees, RoundRobinRouting())
+
+    for i in range(3):
+        router.tell(KeyedMessage(str(i)))
+
+    assert [len(routee.told) for routee in routees] == [2, 1]
+
+
+def test_should_route_randomly_to_every_routee():
+    routees = [MockActorRef("a"), MockActorRef("b"), MockActorRef("c")]
+    router = RouterRef(routees, RandomRouting(seed=0))
+
+    for _ in range(100):
+        router.tell(KeyedMessage())
+
+    assert all(routee.told for routee in routees)
+
+
+def test_should_route_to_smallest_node_queue():
+    routees = [MockActorRef("a", depth=10), MockActorRef("b", depth=0), MockActorRef("c", depth=0)]
+    router = RouterRef(routees, SmallestNodeQueueRouting())
+
+    for _ in range(4):
+        router.tell(KeyedMessage())
+
+    assert [len(routee.told) for routee in routees] == [0, 2, 2]
+
+
+def test_should_balance_by_routed_messages_when_node_queue_depth_is_unknown():
+    routees = [MockActorRef("a", depth=None), MockActorRef("b", depth=0), MockActorRef("c", depth=0)]
+    router = RouterRef(routees, SmallestNodeQueueRouting())
+
+    for _ in range(6):
+        router.tell(KeyedMessage())
+
+    assert [len(routee.told) for routee in routees] == [2, 2, 2]
+
+
+def test_should_expand_router_into_its_routees():
+    routees = [MockActorRef("a"), MockActorRef("b")]
+    router = RouterRef(routees, RoundRobinRouting())
+
+    assert not router.is_addressable() and router.expand() == routees
+
+
+def test_should_route_same_key_to_same_routee():
+    routees = [MockActorRef(actor_id) for actor_id in "abcd"]
+    router = RouterRef(routees, ConsistentHashRouting())
+
+    for _ in range(3):
+        router.tell(KeyedMessage("user-1"))
+
+    assert sorted(len(routee.told) for routee in routees) == [0, 0, 0, 3]
+
+
+def test_should_route_with_custom_key_function():
+    routees = [MockActorRef(actor_id) for actor_id in "abcd"]
+    router = RouterRef(routees, ConsistentHashRouting(key=lambda message: message.key.split(":")[0]))
+
+    router.tell(KeyedMessage("user-1:login"))
+    router.tell(KeyedMessage("user-1:logout"))
+
+    assert sorted(len(routee.told) for routee in routees) == [0, 0, 0, 2]
+
+
+def test_should_reject_message_without_routing_key():
+    router = RouterRef([MockActorRef("a")], ConsistentHashRouting())
+
+    with pytest.raises(ValueError):
+        router.tell(KeyedMessage())
+
+
+def test_should_reject_router_without_routees():
+    with pytest.raises(ValueError):
+        RouterRef([], RoundRobinRouting())
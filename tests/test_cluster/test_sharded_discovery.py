@@ -0,0 +1,61 @@
+from typing import Dict
+
+from redcomet.base.actor.abstract import ActorAbstract
+from redcomet.base.messaging.address import Address
+from redcomet.cluster.manager import ClusterManager
+from redcomet.discovery.actor import ActorDiscovery
+from redcomet.discovery.ring import ConsistentHashRing
+from tests.test_cluster.test_add_node import MockNode
+
+
+class ShardedMockNode(MockNode):
+    def __init__(self):
+        super().__init__()
+        self.bound_ring = None
+        self.actors: Dict[str, ActorAbstract] = {}
+
+    def bind_sharded_discovery(self, ring: ConsistentHashRing, actor_id: str):
+        self.bound_ring = ring
+
+    def register_executable_actor(self, actor: ActorAbstract, actor_id: str):
+        self.actors[actor_id] = actor
+
+
+def _create_cluster(node_ids):
+    ring = ConsistentHashRing()
+    ring.add("main")
+    gateway_shard = ActorDiscovery(Address("main", "discovery"))
+    shards = {"main": gateway_shard}
+    cluster = ClusterManager(ShardedMockNode(), "cluster", gateway_shard.address, discovery_ring=ring,
+                             discovery_shards=shards)
+    nodes = {}
+    for node_id in node_ids:
+        nodes[node_id] = ShardedMockNode()
+        cluster.add_node(nodes[node_id], node_id)
+    return ring, shards, nodes
+
+
+def test_should_host_discovery_shard_on_added_node():
+    ring, shards, nodes = _create_cluster(["node0", "node1"])
+
+    assert ring.members == ["main", "node0", "node1"]
+    assert nodes["node0"].actors["discovery"] is shards["node0"]
+    assert nodes["node1"].bound_ring is ring
+
+
+def test_should_move_registered_addresses_to_owning_shard_when_node_is_added():
+    ring = ConsistentHashRing()
+    ring.add("main")
+    gateway_shard = ActorDiscovery(Address("main", "discovery"))
+    targets = [f"actor{i}" for i in range(50)]
+    for target in targets:
+        gateway_shard.register_address(target, "main")
+    shards = {"main": gateway_shard}
+    cluster = ClusterManager(ShardedMockNode(), "cluster", gateway_shard.address, discovery_ring=ring,
+                             discovery_shards=shards)
+
+    cluster.add_node(ShardedMockNode(), "node0")
+
+    for target in targets:
+        owner = shards[ring.get(target)]
+        assert owner.pop_addresses(lambda t: t == target) == {target: "main"}
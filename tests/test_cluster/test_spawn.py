@@ -6,6 +6,7 @@ from redcomet.base.discovery.ref import ActorDiscoveryRefAbstract
 from redcomet.base.messaging.address import Address
 from redcomet.base.messaging.packet import Packet
 from redcomet.base.messenger.abstract import MessengerAbstract
+from redcomet.base.messenger.backpressure import Backpressure
 from redcomet.base.messenger.direct_message.ref import DirectMessageBoxRefAbstract
 from redcomet.base.node.ref import NodeRefAbstract
 from redcomet.cluster.manager import ClusterManager
@@ -20,7 +21,8 @@ class MockMessenger(MessengerAbstract):
     def __init__(self):
         self.sent_packet = None
 
-    def send(self, message: MessageAbstract, sender_id: str, receiver_id: str):
+    def send(self, message: MessageAbstract, sender_id: str, receiver_id: str,
+             backpressure: Backpressure = Backpressure.BLOCK):
         pass
 
     def send_packet(self, packet: Packet):
@@ -0,0 +1,98 @@
+from typing import List
+
+from redcomet.base.actor.message import MessageAbstract
+from redcomet.base.discovery.ref import ActorDiscoveryRefAbstract
+from redcomet.base.messaging.address import Address
+from redcomet.base.messaging.packet import Packet
+from redcomet.base.messenger.abstract import MessengerAbstract
+from redcomet.base.messenger.backpressure import Backpressure
+from redcomet.base.messenger.direct_message.ref import DirectMessageBoxRefAbstract
+from redcomet.discovery.actor import ActorDiscovery
+from redcomet.discovery.message.deregister.request import DeregisterAddressRequest
+from redcomet.discovery.message.invalidate.notification import AddressInvalidated
+from redcomet.discovery.message.query.request import QueryAddressRequest
+from redcomet.discovery.message.register.request import RegisterAddressRequest
+
+
+class MockMessenger(MessengerAbstract):
+    def __init__(self, node_ids: List[str] = None):
+        self.sent_packets: List[Packet] = []
+        self._node_ids = node_ids or []
+
+    def send(self, message: MessageAbstract, sender_id: str, receiver_id: str,
+             backpressure: Backpressure = Backpressure.BLOCK):
+        pass
+
+    def send_packet(self, packet: Packet):
+        self.sent_packets.append(packet)
+
+    def assign_node_id(self, node_id: str):
+        pass
+
+    def bind_discovery(self, ref: ActorDiscoveryRefAbstract):
+        pass
+
+    def make_connection_to(self, other: 'MessengerAbstract'):
+        pass
+
+    def create_direct_message_box(self) -> DirectMessageBoxRefAbstract:
+        pass
+
+    def connected_node_ids(self) -> List[str]:
+        return self._node_ids
+
+    @property
+    def node_id(self) -> str:
+        return "main"
+
+
+def _create_discovery_with_queried_actor(messenger: MockMessenger) -> ActorDiscovery:
+    discovery = ActorDiscovery(Address("main", "discovery"), messenger)
+    discovery.register_address("actor", "node0")
+    discovery.receive(QueryAddressRequest("actor", "node1", "messenger"), ..., ..., ...)
+    messenger.sent_packets.clear()
+    return discovery
+
+
+def test_should_notify_querying_messengers_when_address_is_deregistered():
+    messenger = MockMessenger()
+    discovery = _create_discovery_with_queried_actor(messenger)
+
+    discovery.receive(DeregisterAddressRequest("actor"), ..., ..., ...)
+
+    assert [(packet.content.target, packet.receiver) for packet in messenger.sent_packets] == \
+           [("actor", Address("node1", "messenger"))]
+    assert isinstance(messenger.sent_packets[0].content, AddressInvalidated)
+
+
+def test_should_notify_querying_messengers_when_address_is_replaced():
+    messenger = MockMessenger()
+    discovery = _create_discovery_with_queried_actor(messenger)
+
+    discovery.receive(RegisterAddressRequest("actor", "node2", replace=True), ..., ..., ...)
+    discovery.receive(QueryAddressRequest("actor", "node1", "messenger"), ..., ..., ...)
+
+    invalidated, response = messenger.sent_packets
+    assert isinstance(invalidated.content, AddressInvalidated)
+    assert response.content.address == Address("node2", "actor")
+
+
+def test_should_notify_each_subscriber_only_once():
+    messenger = MockMessenger()
+    discovery = _create_discovery_with_queried_actor(messenger)
+
+    discovery.receive(RegisterAddressRequest("actor", "node2", replace=True), ..., ..., ...)
+    discovery.receive(DeregisterAddressRequest("actor"), ..., ..., ...)
+
+    assert len(messenger.sent_packets) == 1
+
+
+def test_should_broadcast_invalidation_to_all_node_messengers_when_addresses_are_announced():
+    messenger = MockMessenger(["main", "node0", "node1"])
+    discovery = ActorDiscovery(Address("main", "discovery"), messenger, broadcast_invalidations=True)
+    discovery.register_address("actor", "node0")
+
+    discovery.receive(DeregisterAddressRequest("actor"), ..., ..., ...)
+
+    assert sorted(packet.receiver.node_id for packet in messenger.sent_packets) == ["main", "node0", "node1"]
+    assert all(isinstance(packet.content, AddressInvalidated) for packet in messenger.sent_packets)
@@ -0,0 +1,54 @@
+from pytest import raises
+
+from redcomet.discovery.ring import ConsistentHashRing
+
+KEYS = [f"actor{i}" for i in range(2000)]
+
+
+def _ring(*members: str) -> ConsistentHashRing:
+    ring = ConsistentHashRing()
+    for member in members:
+        ring.add(member)
+    return ring
+
+
+def test_should_map_keys_the_same_way_on_every_ring_with_same_members():
+    first, second = _ring("node0", "node1", "node2"), _ring("node2", "node0", "node1")
+
+    assert [first.get(key) for key in KEYS] == [second.get(key) for key in KEYS]
+
+
+def test_should_spread_keys_over_all_members():
+    ring = _ring("node0", "node1", "node2", "node3")
+
+    counts = {}
+    for key in KEYS:
+        counts[ring.get(key)] = counts.get(ring.get(key), 0) + 1
+
+    assert sorted(counts) == ["node0", "node1", "node2", "node3"]
+    assert min(counts.values()) > len(KEYS) / 4 / 2
+
+
+def test_should_only_move_keys_to_new_member_when_added():
+    ring = _ring("node0", "node1", "node2")
+    before = {key: ring.get(key) for key in KEYS}
+
+    ring.add("node3")
+
+    moved = [key for key in KEYS if ring.get(key) != before[key]]
+    assert moved and all(ring.get(key) == "node3" for key in moved)
+
+
+def test_should_restore_mapping_when_member_is_removed():
+    ring = _ring("node0", "node1")
+    before = [ring.get(key) for key in KEYS]
+
+    ring.add("node2")
+    ring.remove("node2")
+
+    assert [ring.get(key) for key in KEYS] == before
+
+
+def test_should_raise_when_ring_is_empty():
+    with raises(LookupError):
+        ConsistentHashRing().get("actor")
@@ -0,0 +1,38 @@
+from redcomet.base.messaging.address import Address
+from redcomet.discovery.message.query.request import QueryAddressRequest
+from redcomet.discovery.message.register.request import RegisterAddressRequest
+from redcomet.discovery.ref import ShardedActorDiscoveryRef
+from redcomet.discovery.ring import ConsistentHashRing
+from tests.test_discovery.test_invalidation import MockMessenger
+
+
+def _ring() -> ConsistentHashRing:
+    ring = ConsistentHashRing()
+    for node_id in ["main", "node0", "node1"]:
+        ring.add(node_id)
+    return ring
+
+
+def test_should_send_register_request_to_owning_shard():
+    messenger, ring = MockMessenger(), _ring()
+    ref = ShardedActorDiscoveryRef(messenger, ring, "discovery", "node0")
+
+    ref.register_address("actor", "node0")
+
+    packet, = messenger.sent_packets
+    assert isinstance(packet.content, RegisterAddressRequest)
+    assert packet.receiver == Address(ring.get("actor"), "discovery")
+
+
+def test_should_send_query_requests_for_different_targets_to_their_shards():
+    messenger, ring = MockMessenger(), _ring()
+    ref = ShardedActorDiscoveryRef(messenger, ring, "discovery", "node0")
+    targets = [f"actor{i}" for i in range(20)]
+
+    for target in targets:
+        ref.query_address(target, "node0", "messenger")
+
+    assert all(isinstance(packet.content, QueryAddressRequest) for packet in messenger.sent_packets)
+    assert [packet.receiver for packet in messenger.sent_packets] == \
+           [Address(ring.get(target), "discovery") for target in targets]
+    assert len({packet.receiver for packet in messenger.sent_packets}) == 3
@@ -0,0 +1,19 @@
+from queue import Empty
+
+from pytest import raises
+
+from redcomet.implementation.messenger.inbox.queue.process_safe import ProcessSafeQueueManager
+
+
+def test_should_get_available_objects_in_one_batch():
+    with ProcessSafeQueueManager() as queue:
+        for i in range(5):
+            queue.put(i)
+        assert queue.get_batch(3) == [0, 1, 2]
+        assert queue.get_batch(3) == [3, 4]
+
+
+def test_should_raise_empty_when_no_object_arrives_for_batch():
+    with ProcessSafeQueueManager() as queue:
+        with raises(Empty):
+            queue.get_batch(3, timeout=0.001)
@@ -0,0 +1,59 @@
+from multiprocessing import Process
+from queue import Empty, Full
+
+from pytest import raises
+
+from redcomet.base.messaging.address import Address
+from redcomet.base.messaging.packet import Packet
+from redcomet.implementation.messenger.inbox.queue.shared_memory import SharedMemoryQueueManager
+from redcomet.messenger.inbox.queue import QueueAbstract
+from tests.test_messenger.mock import DummyPacketContent
+
+
+def _put_all(queue: QueueAbstract, n: int):
+    for i in range(n):
+        queue.put(i)
+
+
+def test_should_get_objects_in_put_order():
+    with SharedMemoryQueueManager() as queue:
+        queue.put("a")
+        queue.put(Packet(DummyPacketContent(1), Address("x", "me"), Address.on_local("you")))
+        assert queue.get() == "a"
+        assert queue.get() == Packet(DummyPacketContent(1), Address("x", "me"), Address.on_local("you"))
+
+
+def test_should_wrap_around_end_of_buffer():
+    with SharedMemoryQueueManager(capacity=100) as queue:
+        for i in range(50):
+            queue.put("x" * (i % 30))
+            assert queue.get() == "x" * (i % 30)
+
+
+def test_should_raise_empty_when_timeout():
+    with SharedMemoryQueueManager() as queue:
+        with raises(Empty):
+            queue.get(timeout=0.001)
+
+
+def test_should_raise_full_when_no_space():
+    with SharedMemoryQueueManager(capacity=64) as queue:
+        queue.put("x")
+        with raises(Full):
+            queue.put("y" * 30, timeout=0.001)
+
+
+def test_should_receive_objects_from_another_process():
+    with SharedMemoryQueueManager(capacity=1024) as queue:
+        process = Process(target=_put_all, args=(queue, 1000))
+        process.start()
+        assert [queue.get(timeout=2) for _ in range(1000)] == list(range(1000))
+        process.join()
+
+
+def test_should_get_available_objects_in_one_batch():
+    with SharedMemoryQueueManager() as queue:
+        for i in range(5):
+            queue.put(i)
+        assert queue.get_batch(3) == [0, 1, 2]
+        assert queue.get_batch(3, wait=0.001) == [3, 4]
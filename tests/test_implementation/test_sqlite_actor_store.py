@@ -0,0 +1,28 @@
+import os
+
+from redcomet.implementation.actor.store.sqlite import SqliteActorStore
+
+
+def test_should_load_saved_actor_once():
+    store = SqliteActorStore()
+    store.save("abc", b"alice")
+
+    assert "abc" in store and len(store) == 1
+    assert store.load("abc") == b"alice"
+    assert store.load("abc") is None and len(store) == 0
+
+
+def test_should_not_leave_temporary_file_behind():
+    store = SqliteActorStore()
+
+    assert not os.path.exists(store.path)
+    store.close()
+
+
+def test_should_keep_actors_in_given_file(tmp_path):
+    path = str(tmp_path / "actors.sqlite")
+    store = SqliteActorStore(path)
+    store.save("abc", b"alice")
+    store.close()
+
+    assert SqliteActorStore(path).load("abc") == b"alice"
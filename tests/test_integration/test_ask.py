@@ -0,0 +1,98 @@
+import asyncio
+import time
+
+import pytest
+
+from redcomet.base.actor import ActorRefAbstract
+from redcomet.base.actor.abstract import ActorAbstract
+from redcomet.base.actor.message import MessageAbstract
+from redcomet.base.cluster.ref import ClusterRefAbstract
+from redcomet.system import ActorSystem
+
+
+class Square(MessageAbstract):
+    def __init__(self, value: int):
+        self.value = value
+
+
+class Result(MessageAbstract):
+    def __init__(self, value: int):
+        self.value = value
+
+
+class Delegate(MessageAbstract):
+    def __init__(self, value: int):
+        self.value = value
+
+
+class Prepare(MessageAbstract):
+    pass
+
+
+class Calculator(ActorAbstract):
+    def receive(self, message: MessageAbstract, sender: ActorRefAbstract, me: ActorRefAbstract,
+                cluster: ClusterRefAbstract):
+        if isinstance(message, Square):
+            sender.tell(Result(message.value ** 2))
+        else:
+            raise NotImplementedError()
+
+
+class Broker(ActorAbstract):
+    def __init__(self):
+        self._calculator = None
+
+    def receive(self, message: MessageAbstract, sender: ActorRefAbstract, me: ActorRefAbstract,
+                cluster: ClusterRefAbstract):
+        if isinstance(message, Prepare):
+            self._calculator = cluster.spawn(Calculator())
+        elif isinstance(message, Delegate):
+            future = self._calculator.ask(Square(message.value), timeout=5)
+            future.add_done_callback(lambda done: sender.tell(Result(done.result().value + 1)))
+        else:
+            raise NotImplementedError()
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("parallel", [False, True])
+def test_should_ask_actor_and_get_reply(parallel: bool):
+    with ActorSystem.create(n_worker_nodes=2, parallel=parallel) as system:
+        calculator = system.spawn(Calculator())
+        time.sleep(0.1)
+
+        futures = [calculator.ask(Square(i), timeout=5) for i in range(10)]
+
+        assert [future.result(timeout=5).value for future in futures] == [i ** 2 for i in range(10)]
+
+
+@pytest.mark.integration
+def test_should_ask_actor_from_asyncio():
+    async def ask_all(calculator: ActorRefAbstract):
+        return await asyncio.gather(*(calculator.ask_async(Square(i), timeout=5) for i in range(5)))
+
+    with ActorSystem.create(n_worker_nodes=1, parallel=True) as system:
+        calculator = system.spawn(Calculator())
+        time.sleep(0.1)
+
+        results = asyncio.run(ask_all(calculator))
+
+        assert [result.value for result in results] == [i ** 2 for i in range(5)]
+
+
+@pytest.mark.integration
+def test_should_ask_between_actors():
+    with ActorSystem.create(n_worker_nodes=2, parallel=True) as system:
+        broker = system.spawn(Broker())
+        time.sleep(0.1)
+        broker.tell(Prepare())
+        time.sleep(0.1)
+
+        assert broker.ask(Delegate(3), timeout=5).result(timeout=5).value == 10
+
+
+@pytest.mark.integration
+def test_should_list_active_nodes_through_process_gateway():
+    with ActorSystem.create(n_worker_nodes=2, parallel=True) as system:
+        node_ids = [node.node_id for node in system.get_active_nodes(timeout=5)]
+
+        assert sorted(node_ids) == ["node0", "node1"]
@@ -0,0 +1,38 @@
+import asyncio
+import time
+
+import pytest
+
+from redcomet.base.actor import ActorRefAbstract
+from redcomet.base.actor.asynchronous import AsyncActorAbstract
+from redcomet.base.actor.message import MessageAbstract
+from redcomet.base.cluster.ref import ClusterRefAbstract
+from redcomet.system import ActorSystem
+
+
+class Ping(MessageAbstract):
+    pass
+
+
+class Pong(MessageAbstract):
+    pass
+
+
+class MyAsyncActor(AsyncActorAbstract):
+    async def receive(self, message: MessageAbstract, sender: ActorRefAbstract, me: ActorRefAbstract,
+                      cluster: ClusterRefAbstract):
+        if isinstance(message, Ping):
+            await asyncio.sleep(0.01)
+            sender.tell(Pong())
+        else:
+            raise NotImplementedError()
+
+
+@pytest.mark.integration
+def test_should_reply_from_async_actor_on_asyncio_node():
+    with ActorSystem.create(asynchronous=True) as system:
+        actor = system.spawn(MyAsyncActor())
+        time.sleep(0.1)
+        actor.tell(Ping())
+        reply = system.fetch_message(timeout=1)
+        assert isinstance(reply, Pong)
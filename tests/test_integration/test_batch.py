@@ -0,0 +1,61 @@
+import asyncio
+import time
+
+import pytest
+
+from redcomet.base.actor import ActorRefAbstract
+from redcomet.base.actor.abstract import ActorAbstract
+from redcomet.base.actor.message import MessageAbstract
+from redcomet.base.cluster.ref import ClusterRefAbstract
+from redcomet.system import ActorSystem
+
+
+class Event(MessageAbstract):
+    def __init__(self, value: int):
+        self.value = value
+
+
+class Echo(ActorAbstract):
+    def receive(self, message: MessageAbstract, sender: ActorRefAbstract, me: ActorRefAbstract,
+                cluster: ClusterRefAbstract):
+        sender.tell(message)
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("parallel", [False, True])
+def test_should_tell_and_fetch_batches(parallel: bool):
+    with ActorSystem.create(n_worker_nodes=2, parallel=parallel, gateway_batch_size=16) as system:
+        actors = system.spawn_many(Echo() for _ in range(4))
+        time.sleep(0.1)
+
+        system.tell_many((actors[i % 4], Event(i)) for i in range(100))
+
+        received = []
+        while len(received) < 100:
+            received += system.fetch_messages(100, timeout=5)
+        assert sorted(message.value for message in received) == list(range(100))
+
+
+@pytest.mark.integration
+def test_should_iterate_over_incoming_messages():
+    with ActorSystem.create(n_worker_nodes=1, parallel=True) as system:
+        actor = system.spawn(Echo())
+        time.sleep(0.1)
+        system.tell_many((actor, Event(i)) for i in range(10))
+
+        values = [message.value for message in system.iter_messages(timeout=0.5)]
+
+        assert values == list(range(10))
+
+
+@pytest.mark.integration
+def test_should_iterate_over_incoming_messages_asynchronously():
+    async def collect(system: ActorSystem):
+        return [message.value async for message in system.aiter_messages(timeout=0.5)]
+
+    with ActorSystem.create(n_worker_nodes=1, parallel=True) as system:
+        actor = system.spawn(Echo())
+        time.sleep(0.1)
+        system.tell_many((actor, Event(i)) for i in range(10))
+
+        assert asyncio.run(collect(system)) == list(range(10))
@@ -1,3 +1,5 @@
+import time
+
 import pytest
 
 from redcomet.system import ActorSystem
@@ -8,3 +10,11 @@ def test_should_create_system_with_one_worker_node():
     with ActorSystem.create(n_worker_nodes=1, node_id_prefix="local") as system:
         active_nodes = system.get_active_nodes(timeout=0.01)
     assert sorted(node.node_id for node in active_nodes) == ["local0"]
+
+
+@pytest.mark.integration
+def test_should_keep_synchronous_nodes_alive_with_heartbeats():
+    with ActorSystem.create(n_worker_nodes=2, heartbeat_interval=0.05) as system:
+        time.sleep(0.3)
+        active_nodes = system.get_active_nodes(timeout=0.01)
+    assert sorted(node.node_id for node in active_nodes) == ["node0", "node1"]
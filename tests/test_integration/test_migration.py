@@ -0,0 +1,72 @@
+import os
+import time
+
+import pytest
+
+from redcomet.base.actor import ActorRefAbstract
+from redcomet.base.actor.abstract import ActorAbstract
+from redcomet.base.actor.message import MessageAbstract
+from redcomet.base.cluster.ref import ClusterRefAbstract
+from redcomet.system import ActorSystem
+
+
+class Increment(MessageAbstract):
+    pass
+
+
+class GetCount(MessageAbstract):
+    pass
+
+
+class Count(MessageAbstract):
+    def __init__(self, value: int, pid: int):
+        self.value = value
+        self.pid = pid
+
+
+class Counter(ActorAbstract):
+    def __init__(self):
+        self._count = 0
+
+    def receive(self, message: MessageAbstract, sender: ActorRefAbstract, me: ActorRefAbstract,
+                cluster: ClusterRefAbstract):
+        if isinstance(message, Increment):
+            self._count += 1
+        elif isinstance(message, GetCount):
+            sender.tell(Count(self._count, os.getpid()))
+        else:
+            raise NotImplementedError()
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("parallel", [False, True])
+def test_should_keep_state_and_messages_when_migrating(parallel: bool):
+    with ActorSystem.create(n_worker_nodes=2, parallel=parallel) as system:
+        counter = system.spawn(Counter())
+        time.sleep(0.1)
+        for _ in range(10):
+            counter.tell(Increment())
+
+        counts = []
+        for node_id in ["node0", "node1"]:
+            system.migrate(counter, node_id)
+            for _ in range(10):
+                counter.tell(Increment())
+            counts.append(counter.ask(GetCount(), timeout=5).result(timeout=5))
+
+        assert [count.value for count in counts] == [20, 30]
+        assert not parallel or counts[0].pid != counts[1].pid
+
+
+@pytest.mark.integration
+def test_should_migrate_every_routee_of_router():
+    with ActorSystem.create(n_worker_nodes=2, parallel=True) as system:
+        router = system.spawn_router(Counter() for _ in range(2))
+        time.sleep(0.1)
+        system.migrate(router, "node1")
+        for _ in range(4):
+            router.tell(Increment())
+
+        counts = [routee.ask(GetCount(), timeout=5).result(timeout=5) for routee in router.routees]
+
+        assert [count.value for count in counts] == [2, 2] and counts[0].pid == counts[1].pid
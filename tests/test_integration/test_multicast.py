@@ -0,0 +1,37 @@
+import time
+
+import pytest
+
+from redcomet.base.actor import ActorRefAbstract
+from redcomet.base.actor.abstract import ActorAbstract
+from redcomet.base.actor.message import MessageAbstract
+from redcomet.base.cluster.ref import ClusterRefAbstract
+from redcomet.system import ActorSystem
+
+
+class Event(MessageAbstract):
+    def __init__(self, value: int):
+        self.value = value
+
+
+class Subscriber(ActorAbstract):
+    def receive(self, message: MessageAbstract, sender: ActorRefAbstract, me: ActorRefAbstract,
+                cluster: ClusterRefAbstract):
+        assert isinstance(message, Event)
+        sender.tell(Event(message.value))
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("parallel", [False, True])
+def test_should_deliver_multicast_to_every_group_member(parallel: bool):
+    with ActorSystem.create(n_worker_nodes=2, parallel=parallel) as system:
+        group = system.group(system.spawn_many(Subscriber() for _ in range(10)))
+        time.sleep(0.1)
+
+        group.tell(Event(1))
+        group.tell(Event(2))
+
+        received = []
+        while len(received) < 20:
+            received += system.fetch_messages(20, timeout=5)
+        assert sorted(message.value for message in received) == [1] * 10 + [2] * 10
@@ -0,0 +1,53 @@
+import time
+
+import pytest
+
+from redcomet.actor.passivation import PassivationPolicy
+from redcomet.base.actor import ActorRefAbstract
+from redcomet.base.actor.abstract import ActorAbstract
+from redcomet.base.actor.message import MessageAbstract
+from redcomet.base.cluster.ref import ClusterRefAbstract
+from redcomet.system import ActorSystem
+
+
+class Increment(MessageAbstract):
+    pass
+
+
+class GetCount(MessageAbstract):
+    pass
+
+
+class Count(MessageAbstract):
+    def __init__(self, value: int):
+        self.value = value
+
+
+class Counter(ActorAbstract):
+    def __init__(self):
+        self._count = 0
+
+    def receive(self, message: MessageAbstract, sender: ActorRefAbstract, me: ActorRefAbstract,
+                cluster: ClusterRefAbstract):
+        if isinstance(message, Increment):
+            self._count += 1
+        elif isinstance(message, GetCount):
+            sender.tell(Count(self._count))
+        else:
+            raise NotImplementedError()
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("parallel", [False, True])
+def test_should_reactivate_passivated_actors_transparently(parallel: bool):
+    passivation = PassivationPolicy(max_resident_actors=2)
+    with ActorSystem.create(n_worker_nodes=1, parallel=parallel, passivation=passivation) as system:
+        counters = system.spawn_many(Counter() for _ in range(5))
+        time.sleep(0.1)
+
+        for _ in range(3):
+            for counter in counters:
+                counter.tell(Increment())
+
+        counts = [counter.ask(GetCount(), timeout=5).result(timeout=5).value for counter in counters]
+        assert counts == [3] * 5
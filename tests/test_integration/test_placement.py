@@ -0,0 +1,39 @@
+import time
+
+import pytest
+
+from redcomet.base.actor import ActorRefAbstract
+from redcomet.base.actor.abstract import ActorAbstract
+from redcomet.base.actor.message import MessageAbstract
+from redcomet.base.cluster.ref import ClusterRefAbstract
+from redcomet.cluster.placement import LeastActorsPlacement
+from redcomet.system import ActorSystem
+
+
+class Ping(MessageAbstract):
+    pass
+
+
+class Pong(MessageAbstract):
+    pass
+
+
+class MyActor(ActorAbstract):
+    def receive(self, message: MessageAbstract, sender: ActorRefAbstract, me: ActorRefAbstract,
+                cluster: ClusterRefAbstract):
+        if isinstance(message, Ping):
+            sender.tell(Pong())
+        else:
+            raise NotImplementedError()
+
+
+@pytest.mark.integration
+def test_should_reply_from_actors_placed_by_load():
+    with ActorSystem.create(n_worker_nodes=2, parallel=True, placement=LeastActorsPlacement(),
+                            load_report_interval=0.05) as system:
+        actors = [system.spawn(MyActor()) for _ in range(4)]
+        time.sleep(0.2)
+        for actor in actors:
+            actor.tell(Ping())
+        replies = [system.fetch_message(timeout=1) for _ in actors]
+        assert all(isinstance(reply, Pong) for reply in replies)
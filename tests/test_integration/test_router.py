@@ -0,0 +1,57 @@
+import time
+
+import pytest
+
+from redcomet.actor.routing import ConsistentHashRouting, SmallestNodeQueueRouting
+from redcomet.base.actor import ActorRefAbstract
+from redcomet.base.actor.abstract import ActorAbstract
+from redcomet.base.actor.message import MessageAbstract
+from redcomet.base.cluster.ref import ClusterRefAbstract
+from redcomet.system import ActorSystem
+
+
+class Job(MessageAbstract):
+    def __init__(self, key: str, worker_id: str = None):
+        self.key = key
+        self.worker_id = worker_id
+
+    @property
+    def routing_key(self) -> str:
+        return self.key
+
+
+class Worker(ActorAbstract):
+    def receive(self, message: MessageAbstract, sender: ActorRefAbstract, me: ActorRefAbstract,
+                cluster: ClusterRefAbstract):
+        assert isinstance(message, Job)
+        sender.tell(Job(message.key, me.address.target))
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("parallel", [False, True])
+def test_should_route_same_key_to_same_worker(parallel: bool):
+    with ActorSystem.create(n_worker_nodes=2, parallel=parallel) as system:
+        router = system.spawn_router((Worker() for _ in range(4)), ConsistentHashRouting())
+        time.sleep(0.1)
+
+        for i in range(40):
+            router.tell(Job(f"key{i % 5}"))
+
+        received = []
+        while len(received) < 40:
+            received += system.fetch_messages(40, timeout=5)
+        workers = {}
+        for message in received:
+            workers.setdefault(message.key, set()).add(message.worker_id)
+        assert all(len(worker_ids) == 1 for worker_ids in workers.values())
+
+
+@pytest.mark.integration
+def test_should_ask_through_router():
+    with ActorSystem.create(n_worker_nodes=2, parallel=True) as system:
+        router = system.spawn_router((Worker() for _ in range(4)), SmallestNodeQueueRouting())
+        time.sleep(0.1)
+
+        replies = [router.ask(Job(str(i)), timeout=5) for i in range(8)]
+
+        assert sorted(int(future.result(timeout=5).key) for future in replies) == list(range(8))
@@ -0,0 +1,50 @@
+import time
+
+import pytest
+
+from redcomet.base.actor import ActorRefAbstract
+from redcomet.base.actor.abstract import ActorAbstract
+from redcomet.base.actor.message import MessageAbstract
+from redcomet.base.cluster.ref import ClusterRefAbstract
+from redcomet.system import ActorSystem
+
+
+class Ping(MessageAbstract):
+    def __init__(self, value: int):
+        self.value = value
+
+
+class Pong(MessageAbstract):
+    def __init__(self, value: int):
+        self.value = value
+
+
+class MyActor(ActorAbstract):
+    def receive(self, message: MessageAbstract, sender: ActorRefAbstract, me: ActorRefAbstract,
+                cluster: ClusterRefAbstract):
+        if isinstance(message, Ping):
+            sender.tell(Pong(message.value))
+        else:
+            raise NotImplementedError()
+
+
+@pytest.mark.integration
+def test_should_reply_to_gateway_with_sharded_discovery():
+    with ActorSystem.create(n_worker_nodes=3, parallel=True, sharded_discovery=True) as system:
+        actors = [system.spawn(MyActor()) for _ in range(10)]
+        time.sleep(0.2)
+        for i, actor in enumerate(actors):
+            actor.tell(Ping(i))
+        replies = sorted(system.fetch_message(timeout=2).value for _ in actors)
+        assert replies == list(range(10))
+
+
+@pytest.mark.integration
+def test_should_reply_to_gateway_with_announced_addresses():
+    with ActorSystem.create(n_worker_nodes=2, parallel=True, announce_addresses=True) as system:
+        actors = [system.spawn(MyActor()) for _ in range(10)]
+        time.sleep(0.2)
+        for i, actor in enumerate(actors):
+            actor.tell(Ping(i))
+        replies = sorted(system.fetch_message(timeout=2).value for _ in actors)
+        assert replies == list(range(10))
@@ -0,0 +1,100 @@
+import time
+from multiprocessing import Process, Queue
+from queue import Empty
+
+import pytest
+
+from redcomet.base.actor import ActorRefAbstract
+from redcomet.base.actor.abstract import ActorAbstract
+from redcomet.base.actor.message import MessageAbstract
+from redcomet.base.cluster.ref import ClusterRefAbstract
+from redcomet.messenger.transport import TcpEndpoint, Transport
+from redcomet.node.factory import create_node
+from redcomet.system import ActorSystem
+
+
+class Ping(MessageAbstract):
+    pass
+
+
+class Pong(MessageAbstract):
+    pass
+
+
+class MyActor(ActorAbstract):
+    def receive(self, message: MessageAbstract, sender: ActorRefAbstract, me: ActorRefAbstract,
+                cluster: ClusterRefAbstract):
+        if isinstance(message, Ping):
+            sender.tell(Pong())
+        else:
+            raise NotImplementedError()
+
+
+def _serve(endpoints: Queue, authkey: bytes = None):
+    node = create_node(transport=Transport.TCP, listen=TcpEndpoint("127.0.0.1", 0), authkey=authkey)
+    endpoints.put(node.messenger.endpoint)
+    node.run()
+
+
+@pytest.mark.integration
+def test_should_reply_over_tcp_transport():
+    with ActorSystem.create(n_worker_nodes=2, transport=Transport.TCP) as system:
+        actors = [system.spawn(MyActor()) for _ in range(2)]
+        time.sleep(0.1)
+        for actor in actors:
+            actor.tell(Ping())
+        replies = [system.fetch_message(timeout=1) for _ in actors]
+        assert all(isinstance(reply, Pong) for reply in replies)
+
+
+@pytest.mark.integration
+def test_should_reply_from_remote_node():
+    endpoints = Queue()
+    remote = Process(target=_serve, args=(endpoints,))
+    remote.start()
+    endpoint = endpoints.get(timeout=5)
+    with ActorSystem.create(n_worker_nodes=0, transport=Transport.TCP, remote_nodes={"remote0": endpoint}) as system:
+        actor = system.spawn(MyActor())
+        time.sleep(0.1)
+        actor.tell(Ping())
+        reply = system.fetch_message(timeout=1)
+    remote.join(timeout=5)
+    assert isinstance(reply, Pong) and remote.exitcode == 0
+
+
+@pytest.mark.integration
+def test_should_reply_from_remote_node_sharing_authkey():
+    endpoints = Queue()
+    remote = Process(target=_serve, args=(endpoints, b"secret"))
+    remote.start()
+    endpoint = endpoints.get(timeout=5)
+    with ActorSystem.create(n_worker_nodes=0, transport=Transport.TCP, remote_nodes={"remote0": endpoint},
+                            authkey=b"secret") as system:
+        actor = system.spawn(MyActor())
+        time.sleep(0.1)
+        actor.tell(Ping())
+        reply = system.fetch_message(timeout=1)
+    remote.join(timeout=5)
+    assert isinstance(reply, Pong) and remote.exitcode == 0
+
+
+@pytest.mark.integration
+def test_should_not_reach_remote_node_with_different_authkey():
+    endpoints = Queue()
+    remote = Process(target=_serve, args=(endpoints, b"theirs"))
+    remote.start()
+    endpoint = endpoints.get(timeout=5)
+    replies = []
+    try:
+        with ActorSystem.create(n_worker_nodes=0, transport=Transport.TCP, remote_nodes={"remote0": endpoint},
+                                authkey=b"mine") as system:
+            actor = system.spawn(MyActor())
+            time.sleep(0.1)
+            actor.tell(Ping())
+            replies.append(system.fetch_message(timeout=0.5))
+    except (Empty, OSError):
+        pass
+    finally:
+        remote.kill()
+        remote.join(timeout=5)
+    assert replies == []
@@ -0,0 +1,45 @@
+import multiprocessing
+import time
+
+import pytest
+
+from redcomet.base.actor import ActorRefAbstract
+from redcomet.base.actor.abstract import ActorAbstract
+from redcomet.base.actor.message import MessageAbstract
+from redcomet.base.cluster.ref import ClusterRefAbstract
+from redcomet.messenger.transport import Transport
+from redcomet.system import ActorSystem
+
+
+class Ping(MessageAbstract):
+    pass
+
+
+class Pong(MessageAbstract):
+    pass
+
+
+class MyActor(ActorAbstract):
+    def receive(self, message: MessageAbstract, sender: ActorRefAbstract, me: ActorRefAbstract,
+                cluster: ClusterRefAbstract):
+        if isinstance(message, Ping):
+            sender.tell(Pong())
+        else:
+            raise NotImplementedError()
+
+
+@pytest.mark.integration
+def test_should_reply_over_unix_transport():
+    with ActorSystem.create(n_worker_nodes=2, transport=Transport.UNIX) as system:
+        actors = [system.spawn(MyActor()) for _ in range(2)]
+        time.sleep(0.1)
+        for actor in actors:
+            actor.tell(Ping())
+        replies = [system.fetch_message(timeout=1) for _ in actors]
+        assert all(isinstance(reply, Pong) for reply in replies)
+
+
+@pytest.mark.integration
+def test_should_run_one_process_per_node_over_unix_transport():
+    with ActorSystem.create(n_worker_nodes=2, transport=Transport.UNIX):
+        assert len(multiprocessing.active_children()) == 3
@@ -22,7 +22,7 @@ class MockQueue(QueueAbstract):
         self._queue.put(obj)
 
     def get(self, block: bool = True, timeout: float = None) -> Any:
-        return self._queue.get()
+        return self._queue.get(block=block, timeout=timeout)
 
     def empty(self) -> bool:
         return self._queue.empty()
@@ -62,13 +62,17 @@ class DummyPacketContent(PacketContentAbstract):
 
 
 class MockActorDiscoveryRef(ActorDiscoveryRefAbstract):
-    def __init__(self, query_response_params=None):
+    def __init__(self, query_response_params=None, invalidated_target: str = None):
         self._query_response_params = query_response_params
+        self._invalidated_target = invalidated_target
         self.queried_address = None
 
     def register_address(self, target: str, node_id: str):
         pass
 
+    def deregister_address(self, target: str):
+        pass
+
     def query_address(self, target: str, requester_node_id: str, requester_target: str):
         self.queried_address = target, requester_node_id, requester_target
 
@@ -80,11 +84,21 @@ class MockActorDiscoveryRef(ActorDiscoveryRefAbstract):
             return True
         return False
 
+    def call_on_address_invalidated(self, message: MessageAbstract, func: Callable[[str], Any]) -> bool:
+        if not isinstance(message, DummyAddressInvalidated):
+            return False
+        func(self._invalidated_target)
+        return True
+
 
 class DummyQueryAddressResponse(MessageAbstract):
     pass
 
 
+class DummyAddressInvalidated(MessageAbstract):
+    pass
+
+
 class DummyMessage(MessageAbstract):
     def __init__(self, value, ref_id: str = None):
         self.value = value
@@ -0,0 +1,50 @@
+import time
+
+from redcomet.base.messaging.address import Address
+from redcomet.messenger.address_cache import AddressCache
+
+
+def test_should_evict_least_recently_used_address_when_full():
+    cache = AddressCache(capacity=2)
+    cache.update_cache(Address("node0", "a"))
+    cache.update_cache(Address("node0", "b"))
+    cache.get_address("a")
+
+    cache.update_cache(Address("node0", "c"))
+
+    assert cache.get_address("b") is None
+    assert cache.get_address("a") == Address("node0", "a")
+    assert cache.get_address("c") == Address("node0", "c")
+    assert cache.evictions == 1 and len(cache) == 2
+
+
+def test_should_expire_address_after_ttl():
+    cache = AddressCache(ttl=0.01)
+    cache.update_cache(Address("node0", "a"))
+
+    assert cache.get_address("a") == Address("node0", "a")
+    time.sleep(0.02)
+    assert cache.get_address("a") is None
+    assert len(cache) == 0
+
+
+def test_should_invalidate_address():
+    cache = AddressCache()
+    cache.update_cache(Address("node0", "a"))
+
+    cache.invalidate("a")
+    cache.invalidate("unknown")
+
+    assert cache.get_address("a") is None and cache.invalidations == 1
+
+
+def test_should_count_hits_and_misses():
+    cache = AddressCache()
+    cache.update_cache(Address("node0", "a"))
+
+    cache.get_address("a")
+    cache.get_address("a")
+    cache.get_address("b")
+
+    assert (cache.hits, cache.misses) == (2, 1)
+    assert cache.hit_rate == 2 / 3
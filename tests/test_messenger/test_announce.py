@@ -0,0 +1,48 @@
+from redcomet.base.messaging.address import Address
+from redcomet.base.messaging.packet import Packet
+from redcomet.messenger.address_cache import AddressCache
+from redcomet.messenger.announce import AddressAnnouncement
+from redcomet.messenger.request import MessageForwardRequest
+from tests.test_messenger.factory import create_messenger_for_test
+from tests.test_messenger.mock import MockQueue, MockActorDiscoveryRef, DummyMessage
+
+
+def test_should_send_announcement_to_other_connected_messengers():
+    my_inbox_queue, your_inbox_queue = MockQueue(), MockQueue()
+    me = create_messenger_for_test("me", inbox_queue=my_inbox_queue)
+    you = create_messenger_for_test("you", inbox_queue=your_inbox_queue)
+    me.make_connection_to(you)
+
+    me.announce_address(Address("me", "actor"))
+
+    assert your_inbox_queue.get() == Packet(AddressAnnouncement(Address("me", "actor")),
+                                            sender=Address("me", "messenger"), receiver=Address("you", "messenger"))
+    assert my_inbox_queue.empty()
+    assert me.address_cache.get_address("actor") == Address("me", "actor")
+
+
+def test_should_forward_to_announced_address_without_querying():
+    cache = AddressCache()
+    discovery = MockActorDiscoveryRef()
+    your_inbox_queue = MockQueue()
+    me = create_messenger_for_test("me", address_cache=cache, discovery_ref=discovery)
+    you = create_messenger_for_test("you", inbox_queue=your_inbox_queue)
+    me.make_connection_to(you)
+
+    me.receive(AddressAnnouncement(Address("you", "yours")), ..., ..., ...)
+    me.receive(MessageForwardRequest(DummyMessage(1), "mine", "yours"), ..., ..., ...)
+    me.receive(MessageForwardRequest(DummyMessage(2), "mine", "yours"), ..., ..., ...)
+
+    assert discovery.queried_address is None
+    assert your_inbox_queue.get().receiver == Address("you", "yours")
+    assert cache.queries_avoided == 1
+
+
+def test_should_not_count_announcement_of_already_cached_address_as_avoided_query():
+    cache = AddressCache()
+    cache.update_cache(Address("you", "yours"))
+
+    cache.update_cache(Address("you", "yours"), announced=True)
+    cache.get_address("yours")
+
+    assert cache.queries_avoided == 0
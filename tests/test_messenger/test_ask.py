@@ -0,0 +1,80 @@
+from concurrent.futures import Future
+
+from pytest import raises
+
+from redcomet.base.messaging.address import Address
+from redcomet.base.messaging.packet import Packet
+from redcomet.messenger.direct_message.manager import DirectMessageManager
+from redcomet.messenger.handler.executor.messenger_command import MessengerCommandExecutor
+from redcomet.messenger.inbox.message import StopReceiveLoop
+from redcomet.messenger.reply.registry import ReplyRegistry, is_reply_target
+from redcomet.messenger.reply.unclaimed import UnclaimedReply
+from tests.test_messenger.factory import create_messenger_for_test
+from tests.test_messenger.mock import DummyMessage, MockQueue
+
+
+def test_should_send_ask_with_correlation_id_as_sender():
+    inbox_queue = MockQueue()
+    messenger = create_messenger_for_test(inbox_queue=inbox_queue)
+
+    messenger.ask(DummyMessage("Hello"), Address("node", "actor"))
+
+    packet = inbox_queue.get()
+    assert is_reply_target(packet.sender.target) and len(messenger.reply_registry) == 1
+
+
+def test_should_resolve_future_with_reply():
+    inbox_queue = MockQueue()
+    messenger = create_messenger_for_test(inbox_queue=inbox_queue)
+    future = messenger.ask(DummyMessage("Hello"), Address("node", "actor"))
+    request = inbox_queue.get()
+
+    inbox_queue.put(Packet(DummyMessage("World"), sender=request.receiver, receiver=request.sender))
+    inbox_queue.put(Packet(StopReceiveLoop(), sender=..., receiver=...))
+    messenger.start_receive_loop()
+
+    assert future.result(timeout=0) == DummyMessage("World") and len(messenger.reply_registry) == 0
+
+
+def test_should_share_one_registry_between_outstanding_asks():
+    registry = ReplyRegistry()
+    (first_id, first), (second_id, second) = registry.register(), registry.register()
+
+    registry.resolve(second_id, DummyMessage("second"))
+    registry.resolve(first_id, DummyMessage("first"))
+
+    assert first_id != second_id
+    assert (first.result(timeout=0), second.result(timeout=0)) == (DummyMessage("first"), DummyMessage("second"))
+
+
+def test_should_time_out_unanswered_ask():
+    registry = ReplyRegistry()
+    correlation_id, future = registry.register(timeout=0.01)
+
+    with raises(TimeoutError):
+        future.result(timeout=1)
+    assert not registry.resolve(correlation_id, DummyMessage("late"))
+
+
+def test_should_hand_over_unclaimed_reply():
+    unclaimed = MockQueue()
+    executor = MessengerCommandExecutor(DirectMessageManager(), ReplyRegistry(), unclaimed_replies=unclaimed)
+
+    executor.filter_packet(Packet(DummyMessage("World"), sender=Address("node", "actor"),
+                                  receiver=Address("node", "__reply.1.0")))
+
+    assert unclaimed.get(timeout=0).correlation_id == "__reply.1.0"
+
+
+def test_should_claim_reply_handed_over_from_another_process():
+    inbox_queue = MockQueue()
+    messenger = create_messenger_for_test(inbox_queue=inbox_queue)
+    future: Future = messenger.ask(DummyMessage("Hello"), Address("node", "actor"))
+    with messenger.create_direct_message_box() as box:
+        correlation_id = inbox_queue.get().sender.target
+
+        messenger.claim_reply(UnclaimedReply(DummyMessage("World"), correlation_id))
+        messenger.claim_reply(UnclaimedReply(DummyMessage("Box", box.ref_id)))
+
+        assert future.result(timeout=0) == DummyMessage("World")
+        assert box.get(timeout=0) == DummyMessage("Box", box.ref_id)
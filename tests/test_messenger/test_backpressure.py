@@ -0,0 +1,126 @@
+import threading
+import time
+
+from redcomet.base.messaging.address import Address
+from redcomet.base.messaging.packet import Packet
+from redcomet.base.messenger.backpressure import Backpressure
+from redcomet.messenger.inbox.process_safe import ProcessSafeInbox
+from redcomet.messenger.outbox import Outbox, batched
+from tests.test_messenger.mock import DummyPacketContent, MockQueue, MockQueueManager
+
+
+def _packet(value: int) -> Packet:
+    return Packet(DummyPacketContent(value), Address("node0", "sender"), Address("node1", "receiver"))
+
+
+def _inbox(capacity: int = None) -> ProcessSafeInbox:
+    return ProcessSafeInbox(MockQueueManager(), MockQueue(), capacity=capacity)
+
+
+def _outbox(inbox: ProcessSafeInbox) -> Outbox:
+    outbox = Outbox("node0")
+    outbox.register_inbox(inbox, "node1")
+    return outbox
+
+
+def _drain(inbox: ProcessSafeInbox, n: int) -> list:
+    return [inbox._get_batch()[0].content.value for _ in range(n)]
+
+
+def test_should_reject_offer_when_out_of_credit():
+    inbox = _inbox(capacity=2)
+
+    accepted = [inbox.offer(_packet(i), block=False) for i in range(3)]
+
+    assert accepted == [True, True, False] and inbox.credits.available == 0
+
+
+def test_should_return_credit_when_packet_is_dequeued():
+    inbox = _inbox(capacity=1)
+    inbox.offer(_packet(0), block=False)
+
+    _drain(inbox, 1)
+
+    assert inbox.offer(_packet(1), block=False) and inbox.credits.available == 0
+
+
+def test_should_not_charge_credit_for_system_packets():
+    inbox = _inbox(capacity=1)
+    outbox = _outbox(inbox)
+
+    for i in range(3):
+        outbox.send(_packet(i))
+
+    assert inbox.credits.available == 1 and _drain(inbox, 3) == [0, 1, 2]
+
+
+def test_should_drop_when_out_of_credit():
+    inbox = _inbox(capacity=2)
+    outbox = _outbox(inbox)
+
+    for i in range(5):
+        outbox.send(_packet(i), Backpressure.DROP)
+
+    assert outbox.dropped == 3 and _drain(inbox, 2) == [0, 1]
+
+
+def test_should_block_until_credit_is_returned():
+    inbox = _inbox(capacity=1)
+    outbox = _outbox(inbox)
+    outbox.send(_packet(0), Backpressure.BLOCK)
+    consumer = threading.Timer(0.05, _drain, args=(inbox, 1))
+    consumer.start()
+
+    outbox.send(_packet(1), Backpressure.BLOCK)
+    consumer.join()
+
+    assert outbox.blocked_sends == 1 and outbox.blocked_time >= 0.04 and _drain(inbox, 1) == [1]
+
+
+def test_should_spill_to_disk_and_deliver_in_order():
+    inbox = _inbox(capacity=2)
+    outbox = _outbox(inbox)
+
+    for i in range(6):
+        outbox.send(_packet(i), Backpressure.SPILL)
+    spilled = outbox.spilled
+
+    assert spilled == 4 and _drain(inbox, 6) == list(range(6))
+
+
+def test_should_deliver_spilled_packets_as_credit_is_returned():
+    inbox = _inbox(capacity=1)
+    outbox = _outbox(inbox)
+    outbox.send(_packet(0), Backpressure.SPILL)
+    outbox.send(_packet(1), Backpressure.SPILL)
+
+    _drain(inbox, 1)
+    time.sleep(0.05)
+    outbox.send(_packet(2), Backpressure.SPILL)
+
+    assert outbox.spilled == 2 and _drain(inbox, 2) == [1, 2]
+
+
+def test_should_charge_one_credit_per_message_of_batch():
+    inbox = _inbox(capacity=4)
+    outbox = _outbox(inbox)
+
+    with batched():
+        for i in range(3):
+            outbox.send(_packet(i), Backpressure.DROP)
+    available = inbox.credits.available
+    inbox._get_batch()
+
+    assert available == 1 and inbox.credits.available == 4
+
+
+def test_should_count_dropped_messages_of_batch():
+    inbox = _inbox(capacity=2)
+    outbox = _outbox(inbox)
+    outbox.send(_packet(0), Backpressure.DROP)
+
+    with batched():
+        for i in range(1, 4):
+            outbox.send(_packet(i), Backpressure.DROP)
+
+    assert outbox.dropped == 3 and inbox.credits.available == 1
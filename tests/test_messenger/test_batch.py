@@ -0,0 +1,77 @@
+from typing import List
+
+from redcomet.base.messaging.address import Address
+from redcomet.base.messaging.content import PacketContentAbstract
+from redcomet.base.messaging.packet import Packet
+from redcomet.base.messenger.backpressure import Backpressure
+from redcomet.messenger.batch import PacketBatch
+from redcomet.messenger.inbox.message import StopReceiveLoop
+from redcomet.messenger.request import MessageForwardBatch, MessageForwardRequest
+from tests.test_messenger.factory import create_messenger_for_test
+from tests.test_messenger.mock import MockQueue, MockActorExecutor, DummyPacketContent, DummyMessage
+
+
+class RecordingActorExecutor(MockActorExecutor):
+    def __init__(self):
+        super().__init__()
+        self.received: List[PacketContentAbstract] = []
+
+    def execute(self, message: PacketContentAbstract, sender: Address, local_actor_id: str):
+        self.received.append(message)
+
+
+def test_should_coalesce_batched_packets_per_node():
+    node1_queue, node2_queue = MockQueue(), MockQueue()
+    sender = create_messenger_for_test("node0")
+    sender.make_connection_to(create_messenger_for_test("node1", inbox_queue=node1_queue))
+    sender.make_connection_to(create_messenger_for_test("node2", inbox_queue=node2_queue))
+
+    with sender.batch():
+        for i in range(3):
+            sender.send_packet(Packet(DummyPacketContent(i), Address.on_local("me"), Address("node1", "you")))
+        sender.send_packet(Packet(DummyPacketContent(9), Address.on_local("me"), Address("node2", "you")))
+        assert node1_queue.empty() and node2_queue.empty()
+
+    batch = node1_queue.get()
+    assert isinstance(batch.content, PacketBatch) and node1_queue.empty()
+    assert [packet.content for packet in batch.content.packets] == [DummyPacketContent(i) for i in range(3)]
+    assert node2_queue.get().content == DummyPacketContent(9)
+
+
+def test_should_handle_each_packet_of_received_batch():
+    executor = RecordingActorExecutor()
+    inbox_queue = MockQueue()
+    receiver = create_messenger_for_test("node1", inbox_queue=inbox_queue, executor=executor)
+    packets = [Packet(DummyPacketContent(i), Address("node0", "me"), Address("node1", "you")) for i in range(3)]
+
+    inbox_queue.put(Packet(PacketBatch(packets), Address("node0", "me"), Address("node1", "__batch")))
+    inbox_queue.put(Packet(StopReceiveLoop(), ..., ...))
+    receiver.start_receive_loop()
+
+    assert executor.received == [DummyPacketContent(i) for i in range(3)]
+
+
+def test_should_send_many_messages_as_one_packet():
+    inbox_queue = MockQueue()
+    sender = create_messenger_for_test("node0", inbox_queue=inbox_queue)
+
+    sender.send_many([(DummyMessage(i), "me", "you", Backpressure.DROP) for i in range(3)])
+
+    requests = inbox_queue.get(timeout=1).content.requests
+    assert [(request.message, request.backpressure) for request in requests] == \
+           [(DummyMessage(i), Backpressure.DROP) for i in range(3)]
+    assert inbox_queue.empty()
+
+
+def test_should_forward_message_batch_as_one_packet_per_node():
+    node1_queue = MockQueue()
+    sender = create_messenger_for_test("node0")
+    sender.make_connection_to(create_messenger_for_test("node1", inbox_queue=node1_queue))
+    sender.address_cache.update_cache(Address("node1", "you"))
+
+    sender.receive(MessageForwardBatch([MessageForwardRequest(DummyMessage(i), "me", "you") for i in range(3)]),
+                   ..., ..., ...)
+
+    batch = node1_queue.get(timeout=1)
+    assert [packet.content for packet in batch.content.packets] == [DummyMessage(i) for i in range(3)]
+    assert node1_queue.empty()
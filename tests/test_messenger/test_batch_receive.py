@@ -0,0 +1,67 @@
+from typing import List
+
+from pytest import raises
+
+from redcomet.base.messaging.address import Address
+from redcomet.base.messaging.handler import PacketHandlerAbstract
+from redcomet.base.messaging.packet import Packet
+from redcomet.messenger.inbox.exception import StopReceiveLoopException
+from redcomet.messenger.inbox.message import StopReceiveLoop
+from redcomet.messenger.inbox.process_safe import ProcessSafeInbox
+from tests.test_messenger.mock import MockQueue, MockQueueManager, DummyPacketContent
+
+
+class MockPacketHandler(PacketHandlerAbstract):
+    def __init__(self):
+        self.handled: List[Packet] = []
+
+    def handle(self, packet: Packet):
+        if isinstance(packet.content, StopReceiveLoop):
+            raise StopReceiveLoopException()
+        self.handled.append(packet)
+
+
+def _packet(value: int) -> Packet:
+    return Packet(DummyPacketContent(value), Address("sender", "me"), Address("receiver", "you"))
+
+
+def test_should_drain_up_to_batch_size_per_get():
+    queue = MockQueue()
+    for i in range(5):
+        queue.put(_packet(i))
+    queue.put(Packet(StopReceiveLoop(), ..., ...))
+    handler = MockPacketHandler()
+    inbox = ProcessSafeInbox(MockQueueManager(), queue, handler, batch_size=4)
+
+    inbox.receive_loop()
+
+    assert handler.handled == [_packet(i) for i in range(5)]
+    assert inbox.batch_size_distribution.counts == {4: 1, 2: 1}
+
+
+def test_should_not_wait_for_full_batch_without_wait_window():
+    queue = MockQueue()
+    queue.put(_packet(0))
+    queue.put(Packet(StopReceiveLoop(), ..., ...))
+    inbox = ProcessSafeInbox(MockQueueManager(), queue, MockPacketHandler(), batch_size=100)
+
+    inbox.receive_loop()
+
+    assert inbox.batch_size_distribution.counts == {2: 1}
+
+
+def test_should_take_one_packet_per_get_by_default():
+    queue = MockQueue()
+    queue.put(_packet(0))
+    queue.put(Packet(StopReceiveLoop(), ..., ...))
+    inbox = ProcessSafeInbox(MockQueueManager(), queue, MockPacketHandler())
+
+    inbox.receive_loop()
+
+    assert inbox.batch_size_distribution.counts == {1: 2}
+    assert inbox.batch_size_distribution.mean == 1.0
+
+
+def test_should_reject_empty_batch_size():
+    with raises(ValueError):
+        ProcessSafeInbox(MockQueueManager(), MockQueue(), batch_size=0)
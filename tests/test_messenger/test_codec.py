@@ -0,0 +1,85 @@
+import pickle
+
+from redcomet.base.messaging.address import Address
+from redcomet.base.messaging.packet import Packet
+from redcomet.messenger.codec import CompactCodec, PickleCodec
+from redcomet.messenger.inbox.message import StopReceiveLoop
+from redcomet.messenger.inbox.process_safe import ProcessSafeInbox
+from redcomet.messenger.request import MessageForwardRequest
+from tests.test_messenger.factory import create_messenger_for_test
+from tests.test_messenger.mock import DummyMessage, MockQueue, MockQueueManager, MockActorExecutor, \
+    DummyPacketContent
+
+_ACTOR_ID = "0123456789abcdef0123456789abcdef"
+
+
+def _roundtrip(codec, packet: Packet) -> Packet:
+    return codec.decode(codec.encode(packet))
+
+
+def test_should_restore_local_and_anywhere_addresses():
+    packet = Packet(DummyMessage(1), Address.on_local("me"), Address.anywhere(_ACTOR_ID))
+    assert _roundtrip(CompactCodec(), packet) == packet
+
+
+def test_should_restore_node_addresses():
+    codec = CompactCodec()
+    codec.intern("node0")
+    packet = Packet(DummyMessage(1), Address("node0", "messenger"), Address("unknown-node", "some actor"))
+    assert _roundtrip(codec, packet) == packet
+
+
+def test_should_restore_long_node_ids_and_targets():
+    packet = Packet(DummyMessage(1), Address("n" * 300, "me"), Address("node0", "t" * 70000))
+    assert _roundtrip(CompactCodec(), packet) == packet
+
+
+def test_should_restore_registered_content_type():
+    codec = CompactCodec()
+    codec.register_type(MessageForwardRequest)
+    packet = Packet(MessageForwardRequest(DummyMessage("hi"), "me", _ACTOR_ID),
+                    Address.on_local("me"), Address.on_local("messenger"))
+    assert _roundtrip(codec, packet) == packet
+
+
+def test_should_fall_back_to_pickle_for_non_address_packet():
+    packet = Packet(StopReceiveLoop(), ..., ...)
+    assert _roundtrip(CompactCodec(), packet) == packet
+
+
+def test_should_encode_smaller_than_pickle():
+    codec = CompactCodec()
+    codec.intern("node0")
+    codec.register_type(MessageForwardRequest)
+    packet = Packet(MessageForwardRequest(DummyMessage(1), _ACTOR_ID, _ACTOR_ID),
+                    Address("node0", _ACTOR_ID), Address("node0", "messenger"))
+    assert len(codec.encode(packet)) < len(pickle.dumps(packet, protocol=5))
+
+
+def test_pickle_codec_should_restore_packet():
+    packet = Packet(DummyMessage(1), Address("node", "me"), Address.anywhere("you"))
+    assert _roundtrip(PickleCodec(), packet) == packet
+
+
+def test_inbox_should_put_encoded_packet_into_queue():
+    queue = MockQueue()
+    codec = CompactCodec()
+    inbox = ProcessSafeInbox(MockQueueManager(), queue, codec=codec)
+    packet = Packet(DummyPacketContent(1), Address("node", "me"), Address("node", "you"))
+
+    inbox.receive(packet)
+
+    assert codec.decode(queue.get()) == packet
+
+
+def test_inbox_should_decode_packet_before_handling():
+    codec = CompactCodec()
+    queue = MockQueue()
+    executor = MockActorExecutor()
+    queue.put(codec.encode(Packet(DummyPacketContent(123), Address("sender", "me"), Address("receiver", "you"))))
+    queue.put(codec.encode(Packet(StopReceiveLoop(), ..., ...)))
+    messenger = create_messenger_for_test("receiver", executor=executor, inbox_queue=queue, codec=codec)
+
+    messenger.start_receive_loop()
+
+    assert executor.received_message == (DummyPacketContent(123), Address("sender", "me"), "you")
@@ -1,6 +1,7 @@
 from pytest import raises
 
 from redcomet.base.messaging.packet import Packet
+from redcomet.messenger.direct_message.manager import DirectMessageManager
 from redcomet.messenger.inbox.message import StopReceiveLoop
 from tests.test_messenger.factory import create_messenger_for_test
 from tests.test_messenger.mock import DummyMessage, MockQueue
@@ -42,3 +43,37 @@ def test_should_raise_timeout_error():
     with messenger.create_direct_message_box() as box:
         with raises(TimeoutError):
             box.get(timeout=0.0001)
+
+
+def test_should_recycle_closed_message_box():
+    manager = DirectMessageManager()
+    with manager.create_message_box():
+        pass
+
+    with manager.create_message_box():
+        assert manager.n_free_boxes == 0 and len(manager) == 1
+    assert manager.n_free_boxes == 1 and len(manager) == 0
+
+
+def test_should_issue_distinct_ref_ids():
+    manager = DirectMessageManager()
+
+    ref_ids = set()
+    for _ in range(100):
+        with manager.create_message_box() as box:
+            ref_ids.add(box.ref_id)
+
+    assert len(ref_ids) == 100
+
+
+def test_should_discard_stale_reply_in_recycled_box():
+    manager = DirectMessageManager()
+    with manager.create_message_box() as box:
+        stale_ref_id = box.ref_id
+        stale_box = manager.get_message_box(stale_ref_id)
+
+    with manager.create_message_box() as box:
+        stale_box.put(DummyMessage("late", stale_ref_id))
+        manager.get_message_box(box.ref_id).put(DummyMessage("fresh", box.ref_id))
+
+        assert box.get(timeout=0.1) == DummyMessage("fresh", box.ref_id)
@@ -3,7 +3,8 @@ from redcomet.base.messaging.packet import Packet
 from redcomet.messenger.address_cache import AddressCache
 from redcomet.messenger.request import MessageForwardRequest
 from tests.test_messenger.factory import create_messenger_for_test
-from tests.test_messenger.mock import MockActorDiscoveryRef, DummyQueryAddressResponse, DummyMessage, MockQueue
+from tests.test_messenger.mock import MockActorDiscoveryRef, DummyQueryAddressResponse, DummyMessage, MockQueue, \
+    DummyAddressInvalidated
 
 
 def test_should_forward_message_to_be_processed_later():
@@ -75,3 +76,24 @@ def test_should_use_cached_address_if_exists():
     me.receive(MessageForwardRequest(DummyMessage(123), "mine", "yours"), ..., ..., ...)
 
     assert your_queue.get() == Packet(DummyMessage(123), sender=Address("me", "mine"), receiver=Address("you", "yours"))
+
+
+def test_should_remove_cached_address_when_invalidated():
+    cache = AddressCache()
+    cache.update_cache(Address("you", "yours"))
+    discovery_mock = MockActorDiscoveryRef(invalidated_target="yours")
+    me = create_messenger_for_test("me", address_cache=cache, discovery_ref=discovery_mock)
+
+    me.receive(DummyAddressInvalidated(), ..., ..., ...)
+
+    assert cache.get_address("yours") is None
+
+
+def test_should_query_address_once_for_burst_of_messages():
+    discovery = MockActorDiscoveryRef()
+    me = create_messenger_for_test("me", discovery_ref=discovery)
+
+    for i in range(3):
+        me.receive(MessageForwardRequest(DummyMessage(i), "mine", "yours"), ..., ..., ...)
+
+    assert me.pending_messages.queries == 1 and len(me.pending_messages) == 3
@@ -0,0 +1,72 @@
+from typing import List, Tuple
+
+from redcomet.actor.group import ActorGroup
+from redcomet.actor.ref import ActorRef
+from redcomet.base.messaging.address import Address
+from redcomet.base.messaging.content import PacketContentAbstract
+from redcomet.base.messaging.packet import Packet
+from redcomet.messenger.inbox.message import StopReceiveLoop
+from redcomet.messenger.multicast import Multicast
+from redcomet.messenger.request import MulticastRequest
+from tests.test_messenger.factory import create_messenger_for_test
+from tests.test_messenger.mock import MockQueue, MockActorExecutor, MockActorDiscoveryRef, DummyMessage
+
+
+class RecordingActorExecutor(MockActorExecutor):
+    def __init__(self):
+        super().__init__()
+        self.received: List[Tuple[PacketContentAbstract, str]] = []
+
+    def execute(self, message: PacketContentAbstract, sender: Address, local_actor_id: str):
+        self.received.append((message, local_actor_id))
+
+
+def test_should_send_one_packet_per_node_for_multicast():
+    node1_queue, node2_queue = MockQueue(), MockQueue()
+    sender = create_messenger_for_test("node0")
+    sender.make_connection_to(create_messenger_for_test("node1", inbox_queue=node1_queue))
+    sender.make_connection_to(create_messenger_for_test("node2", inbox_queue=node2_queue))
+    for node_id, actor_id in [("node1", "a"), ("node1", "b"), ("node1", "c"), ("node2", "d")]:
+        sender.address_cache.update_cache(Address(node_id, actor_id))
+
+    sender.receive(MulticastRequest(DummyMessage(1), "me", ["a", "b", "c", "d"]), ..., ..., ...)
+
+    packet = node1_queue.get(timeout=1)
+    assert packet.content == Multicast(DummyMessage(1), ["a", "b", "c"]) and node1_queue.empty()
+    assert packet.receiver.node_id == "node1" and packet.sender == Address("node0", "me")
+    assert node2_queue.get(timeout=1).receiver == Address("node2", "d") and node2_queue.empty()
+
+
+def test_should_query_address_of_unknown_multicast_receiver():
+    discovery = MockActorDiscoveryRef()
+    sender = create_messenger_for_test("node0", discovery_ref=discovery)
+
+    sender.receive(MulticastRequest(DummyMessage(1), "me", ["a", "b"]), ..., ..., ...)
+
+    assert discovery.queried_address == ("b", "node0", "messenger")
+    assert sender.pending_messages.pop("a")[0].message == DummyMessage(1)
+    assert sender.pending_messages.pop("b")[0].receiver_id == "b"
+
+
+def test_should_fan_out_multicast_to_each_local_receiver():
+    executor = RecordingActorExecutor()
+    inbox_queue = MockQueue()
+    receiver = create_messenger_for_test("node1", inbox_queue=inbox_queue, executor=executor)
+
+    inbox_queue.put(Packet(Multicast(DummyMessage(1), ["a", "b"]), Address("node0", "me"),
+                           Address("node1", "__multicast")))
+    inbox_queue.put(Packet(StopReceiveLoop(), ..., ...))
+    receiver.start_receive_loop()
+
+    assert executor.received == [(DummyMessage(1), "a"), (DummyMessage(1), "b")]
+
+
+def test_should_multicast_to_global_refs_of_group():
+    inbox_queue = MockQueue()
+    messenger = create_messenger_for_test("node0", inbox_queue=inbox_queue)
+    refs = [ActorRef(messenger, "me", Address.anywhere(actor_id)) for actor_id in ["a", "b"]]
+
+    ActorGroup(messenger, "me", refs).tell(DummyMessage(1))
+
+    assert inbox_queue.get(timeout=1).content == MulticastRequest(DummyMessage(1), "me", ["a", "b"])
+    assert inbox_queue.empty()
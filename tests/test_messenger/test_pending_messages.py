@@ -0,0 +1,95 @@
+import time
+
+from redcomet.messenger.pending import PendingMessages, PendingOverflow
+from redcomet.messenger.request import MessageForwardRequest
+from tests.test_messenger.mock import DummyMessage
+
+
+def _request(value: int, receiver_id: str = "yours") -> MessageForwardRequest:
+    return MessageForwardRequest(DummyMessage(value), "mine", receiver_id)
+
+
+def test_should_query_only_for_first_message_to_target():
+    pending = PendingMessages()
+
+    should_query = [pending.add("yours", _request(i)) for i in range(3)]
+
+    assert should_query == [True, False, False]
+    assert (pending.queries, pending.coalesced) == (1, 2)
+
+
+def test_should_pop_pending_messages_in_order():
+    pending = PendingMessages()
+    for i in range(3):
+        pending.add("yours", _request(i))
+
+    messages = pending.pop("yours")
+
+    assert [message.message.value for message in messages] == [0, 1, 2]
+    assert len(pending) == 0 and list(pending.pop("yours")) == []
+
+
+def test_should_drop_newest_message_when_full():
+    pending = PendingMessages(capacity=2)
+    for i in range(3):
+        pending.add("yours", _request(i))
+
+    assert [message.message.value for message in pending.pop("yours")] == [0, 1]
+    assert pending.dropped == 1
+
+
+def test_should_drop_oldest_message_of_same_target_when_full():
+    pending = PendingMessages(capacity=2, overflow=PendingOverflow.DROP_OLDEST)
+    for i in range(3):
+        pending.add("yours", _request(i))
+
+    assert [message.message.value for message in pending.pop("yours")] == [1, 2]
+    assert pending.dropped == 1
+
+
+def test_should_query_again_and_drop_expired_messages_after_timeout():
+    pending = PendingMessages(timeout=0.01)
+    pending.add("yours", _request(0))
+    time.sleep(0.02)
+
+    should_query = pending.add("yours", _request(1))
+
+    assert should_query and pending.expired == 1
+    assert [message.message.value for message in pending.pop("yours")] == [1]
+
+
+def test_should_drop_globally_oldest_message_when_full():
+    pending = PendingMessages(capacity=2, overflow=PendingOverflow.DROP_OLDEST)
+    pending.add("yours", _request(0))
+    pending.add("yours", _request(1))
+
+    pending.add("theirs", _request(2, "theirs"))
+
+    assert [message.message.value for message in pending.pop("yours")] == [1]
+    assert [message.message.value for message in pending.pop("theirs")] == [2]
+    assert pending.dropped == 1 and len(pending) == 0
+
+
+def test_should_drop_oldest_message_still_pending_after_others_were_popped():
+    pending = PendingMessages(capacity=2, overflow=PendingOverflow.DROP_OLDEST)
+    pending.add("yours", _request(0))
+    pending.pop("yours")
+    pending.add("theirs", _request(1, "theirs"))
+    pending.add("yours", _request(2))
+
+    pending.add("yours", _request(3))
+
+    assert [message.message.value for message in pending.pop("theirs")] == []
+    assert [message.message.value for message in pending.pop("yours")] == [2, 3]
+
+
+def test_should_expire_messages_of_other_targets():
+    pending = PendingMessages(timeout=0.01)
+    pending.add("yours", _request(0))
+    pending.add("yours", _request(1))
+    time.sleep(0.02)
+
+    pending.add("theirs", _request(2, "theirs"))
+
+    assert pending.expired == 2 and len(pending) == 1
+    assert pending.add("yours", _request(3))
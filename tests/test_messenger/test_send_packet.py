@@ -43,3 +43,12 @@ def test_should_send_packet_to_its_own_inbox_queue():
 
     messenger.send_packet(Packet(DummyPacketContent(123), Address.on_local("me"), Address.on_local("me-again")))
     assert inbox_queue.get() == Packet(DummyPacketContent(123), Address("node", "me"), Address("node", "me-again"))
+
+
+def test_should_not_rewrite_addresses_of_sent_packet():
+    messenger = create_messenger_for_test("node")
+    receiver = Address.on_local("me-again")
+
+    messenger.send_packet(Packet(DummyPacketContent(123), Address.on_local("me"), receiver))
+
+    assert receiver == Address.on_local("me-again")
@@ -0,0 +1,146 @@
+from multiprocessing.shared_memory import SharedMemory
+
+from pytest import raises
+
+from redcomet.base.actor.message import MessageAbstract
+from redcomet.base.messaging.address import Address
+from redcomet.base.messaging.content import PacketContentAbstract
+from redcomet.base.messaging.packet import Packet
+from redcomet.messenger.buffer import SharedBufferTransfer, pin_buffer
+from redcomet.messenger.buffer.handle import SharedBufferHandle
+from redcomet.messenger.inbox.message import StopReceiveLoop
+from redcomet.messenger.request import MessageForwardRequest
+from tests.test_messenger.factory import create_messenger_for_test
+from tests.test_messenger.mock import MockActorExecutor, MockQueue
+
+PAYLOAD = bytes(range(256)) * 512
+
+
+class BlobMessage(MessageAbstract):
+    buffer_fields = ("data",)
+
+    def __init__(self, data):
+        self.data = data
+
+
+class RecordingActorExecutor(MockActorExecutor):
+    def __init__(self, pin: bool = False):
+        super().__init__()
+        self._pin = pin
+        self.received_data = None
+        self.pin = None
+
+    def execute(self, message: PacketContentAbstract, sender: Address, local_actor_id: str):
+        super().execute(message, sender, local_actor_id)
+        assert isinstance(message, BlobMessage)
+        self.received_data = bytes(message.data)
+        if self._pin:
+            self.pin = pin_buffer(message.data)
+
+
+def _packet(content) -> Packet:
+    return Packet(content, Address("sender", "me"), Address("receiver", "you"))
+
+
+def _is_released(handle: SharedBufferHandle) -> bool:
+    try:
+        SharedMemory(name=handle.name).close()
+    except FileNotFoundError:
+        return True
+    return False
+
+
+def test_should_replace_large_buffer_field_with_handle():
+    message = BlobMessage(PAYLOAD)
+    packet = SharedBufferTransfer(min_size=1024).export(_packet(message))
+
+    assert isinstance(packet.content.data, SharedBufferHandle) and message.data is PAYLOAD
+    SharedBufferTransfer().attach(packet)[0].release()
+
+
+def test_should_keep_small_buffer_inline():
+    packet = _packet(BlobMessage(b"small"))
+    assert SharedBufferTransfer(min_size=1024).export(packet) is packet
+
+
+def test_should_attach_read_only_view_and_release_segment():
+    transfer = SharedBufferTransfer(min_size=1024)
+    packet = transfer.export(_packet(BlobMessage(PAYLOAD)))
+    handle = packet.content.data
+
+    leases = transfer.attach(packet)
+
+    assert bytes(packet.content.data) == PAYLOAD and packet.content.data.readonly
+    for lease in leases:
+        lease.release()
+    assert _is_released(handle)
+
+
+def test_should_export_buffer_inside_forward_request_and_keep_it_until_delivery():
+    transfer = SharedBufferTransfer(min_size=1024)
+    packet = transfer.export(_packet(MessageForwardRequest(BlobMessage(PAYLOAD), "me", "you")))
+    handle = packet.content.message.data
+
+    assert isinstance(handle, SharedBufferHandle) and transfer.attach(packet) == []
+    transfer.attach(_packet(packet.content.message))[0].release()
+
+
+def test_should_pass_segment_on_when_forwarding_attached_view():
+    transfer = SharedBufferTransfer(min_size=1024)
+    packet = transfer.export(_packet(BlobMessage(PAYLOAD)))
+    handle = packet.content.data
+    lease, = transfer.attach(packet)
+
+    forwarded = transfer.export(_packet(packet.content))
+    lease.release()
+
+    assert forwarded.content.data == handle and not _is_released(handle)
+    transfer.attach(forwarded)[0].release()
+    assert _is_released(handle)
+
+
+def test_should_deliver_buffer_and_release_after_receive():
+    queue = MockQueue()
+    executor = RecordingActorExecutor()
+    messenger = create_messenger_for_test("receiver", executor=executor, inbox_queue=queue)
+    messenger.send_packet(Packet(BlobMessage(PAYLOAD), Address.on_local("me"), Address.on_local("you")))
+    handle = queue.get().content.data
+    queue.put(Packet(BlobMessage(handle), Address("receiver", "me"), Address("receiver", "you")))
+    queue.put(Packet(StopReceiveLoop(), ..., ...))
+
+    messenger.start_receive_loop()
+
+    assert executor.received_data == PAYLOAD and _is_released(handle)
+    with raises(ValueError):
+        bytes(executor.received_message[0].data)
+
+
+def test_should_keep_pinned_buffer_after_receive():
+    queue = MockQueue()
+    executor = RecordingActorExecutor(pin=True)
+    messenger = create_messenger_for_test("receiver", executor=executor, inbox_queue=queue)
+    messenger.send_packet(Packet(BlobMessage(PAYLOAD), Address.on_local("me"), Address.on_local("you")))
+    queue.put(Packet(StopReceiveLoop(), ..., ...))
+
+    messenger.start_receive_loop()
+
+    assert bytes(executor.pin.view) == PAYLOAD
+    executor.pin.release()
+
+
+def test_should_copy_segment_when_forwarding_attached_view_twice():
+    transfer = SharedBufferTransfer(min_size=1024)
+    packet = transfer.export(_packet(BlobMessage(PAYLOAD)))
+    lease, = transfer.attach(packet)
+
+    first = transfer.export(_packet(packet.content))
+    second = transfer.export(_packet(packet.content))
+    first_handle, second_handle = first.content.data, second.content.data
+    lease.release()
+    transfer.attach(first)[0].release()
+
+    assert first_handle != second_handle and not _is_released(second_handle)
+    second_lease, = transfer.attach(second)
+    assert bytes(second.content.data) == PAYLOAD
+    second_lease.release()
+    assert _is_released(first_handle) and _is_released(second_handle)
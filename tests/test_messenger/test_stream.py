@@ -0,0 +1,180 @@
+import os
+import socket
+import threading
+from typing import List
+
+from pytest import raises, warns
+
+from redcomet.base.messaging.address import Address
+from redcomet.base.messaging.handler import PacketHandlerAbstract
+from redcomet.base.messaging.packet import Packet
+from redcomet.messenger.codec.default import PickleCodec
+from redcomet.messenger.inbox.exception import StopReceiveLoopException
+from redcomet.messenger.inbox.message import StopReceiveLoop
+from redcomet.messenger.inbox.stream import StreamInbox, RemoteStreamInbox
+from redcomet.messenger.transport import TcpEndpoint, UnixEndpoint
+from redcomet.messenger.transport.connection import cork
+from redcomet.messenger.transport.frame import FrameDecoder, encode_frame
+from tests.test_messenger.mock import DummyPacketContent
+
+
+class MockPacketHandler(PacketHandlerAbstract):
+    def __init__(self):
+        self.handled: List[Packet] = []
+
+    def handle(self, packet: Packet):
+        if isinstance(packet.content, StopReceiveLoop):
+            raise StopReceiveLoopException()
+        self.handled.append(packet)
+
+
+def _packet(value: int) -> Packet:
+    return Packet(DummyPacketContent(value), Address("sender", "me"), Address("receiver", "you"))
+
+
+def _start(inbox: StreamInbox) -> threading.Thread:
+    thread = threading.Thread(target=inbox.receive_loop)
+    thread.start()
+    return thread
+
+
+def test_should_decode_frames_split_across_reads():
+    data = encode_frame(b"hello") + encode_frame(b"") + encode_frame(b"world")
+    decoder = FrameDecoder()
+
+    frames = decoder.feed(data[:7]) + decoder.feed(data[7:12]) + decoder.feed(data[12:])
+
+    assert frames == [b"hello", b"", b"world"] and len(decoder) == 0
+
+
+def test_should_deliver_packets_in_order_over_tcp():
+    handler = MockPacketHandler()
+    inbox = StreamInbox(TcpEndpoint("127.0.0.1", 0), handler)
+    thread = _start(inbox)
+    remote = RemoteStreamInbox(inbox.endpoint)
+
+    for i in range(100):
+        remote.receive(_packet(i))
+    remote.stop_receive_loop()
+    thread.join(timeout=5)
+    remote.close()
+    inbox.close()
+
+    assert handler.handled == [_packet(i) for i in range(100)]
+
+
+def test_should_coalesce_corked_packets_into_one_write():
+    handler = MockPacketHandler()
+    inbox = StreamInbox(TcpEndpoint("127.0.0.1", 0), handler)
+    thread = _start(inbox)
+    remote = RemoteStreamInbox(inbox.endpoint)
+
+    with cork():
+        for i in range(10):
+            remote.receive(_packet(i))
+        assert remote.connection.writes == 0
+    remote.stop_receive_loop()
+    thread.join(timeout=5)
+    remote.close()
+    inbox.close()
+
+    assert remote.connection.frames == 11 and remote.connection.writes == 2
+    assert handler.handled == [_packet(i) for i in range(10)]
+
+
+def test_should_drop_packets_from_peers_with_wrong_authkey():
+    handler = MockPacketHandler()
+    inbox = StreamInbox(TcpEndpoint("127.0.0.1", 0), handler)
+    thread = _start(inbox)
+    endpoint = inbox.endpoint
+    intruder = RemoteStreamInbox(TcpEndpoint(endpoint.host, endpoint.port, authkey=b"wrong"))
+    remote = RemoteStreamInbox(endpoint)
+
+    intruder.receive(_packet(0))
+    remote.receive(_packet(1))
+    remote.stop_receive_loop()
+    thread.join(timeout=5)
+    intruder.close()
+    remote.close()
+    inbox.close()
+
+    assert handler.handled == [_packet(1)]
+
+
+def test_should_drop_frames_sent_without_handshake():
+    handler = MockPacketHandler()
+    inbox = StreamInbox(TcpEndpoint("127.0.0.1", 0), handler)
+    thread = _start(inbox)
+    sock = socket.create_connection((inbox.endpoint.host, inbox.endpoint.port))
+    sock.sendall(encode_frame(PickleCodec().encode(_packet(0))))
+    remote = RemoteStreamInbox(inbox.endpoint)
+
+    remote.receive(_packet(1))
+    remote.stop_receive_loop()
+    thread.join(timeout=5)
+    sock.close()
+    remote.close()
+    inbox.close()
+
+    assert handler.handled == [_packet(1)]
+
+
+def test_should_warn_when_listening_on_non_loopback_host():
+    with warns(RuntimeWarning, match="trusted network"):
+        inbox = StreamInbox(TcpEndpoint("0.0.0.0", 0), MockPacketHandler(), authkey=b"secret")
+    inbox.close()
+
+
+def test_should_require_explicit_authkey_for_non_loopback_host():
+    with raises(ValueError, match="explicit authkey"):
+        StreamInbox(TcpEndpoint("0.0.0.0", 0), MockPacketHandler())
+    with raises(ValueError, match="explicit authkey"):
+        TcpEndpoint("192.0.2.1", 1).connect()
+
+
+def test_should_connect_back_with_own_authkey():
+    handler = MockPacketHandler()
+    inbox = StreamInbox(TcpEndpoint("127.0.0.1", 0), handler, authkey=b"secret")
+    thread = _start(inbox)
+    remote = inbox.remote(TcpEndpoint(inbox.endpoint.host, inbox.endpoint.port))
+
+    remote.receive(_packet(0))
+    remote.stop_receive_loop()
+    thread.join(timeout=5)
+    remote.close()
+    inbox.close()
+
+    assert remote.endpoint.authkey == b"secret" and handler.handled == [_packet(0)]
+
+
+def test_should_bind_to_ephemeral_port():
+    inbox = StreamInbox(TcpEndpoint("127.0.0.1", 0), MockPacketHandler())
+
+    assert inbox.endpoint.host == "127.0.0.1" and inbox.endpoint.port > 0
+    inbox.close()
+
+
+def test_should_deliver_packets_in_order_over_unix_socket():
+    handler = MockPacketHandler()
+    inbox = StreamInbox(UnixEndpoint(), handler)
+    thread = _start(inbox)
+    remote = RemoteStreamInbox(inbox.endpoint)
+
+    for i in range(100):
+        remote.receive(_packet(i))
+    remote.stop_receive_loop()
+    thread.join(timeout=5)
+    remote.close()
+    inbox.close()
+
+    assert handler.handled == [_packet(i) for i in range(100)]
+
+
+def test_should_remove_socket_file_on_close():
+    inbox = StreamInbox(UnixEndpoint(), MockPacketHandler())
+    path = inbox.endpoint.path
+    assert os.path.exists(path)
+
+    inbox.close()
+
+    assert not os.path.exists(path)
@@ -0,0 +1,179 @@
+import asyncio
+import time
+from typing import List
+
+import pytest
+
+from redcomet.actor.asynchronous import AsyncioActorExecutor
+from redcomet.base.actor import ActorRefAbstract
+from redcomet.base.actor.abstract import ActorAbstract
+from redcomet.base.actor.asynchronous import AsyncActorAbstract
+from redcomet.base.actor.message import MessageAbstract
+from redcomet.base.cluster.ref import ClusterRefAbstract
+from redcomet.base.messaging.address import Address
+from redcomet.base.messaging.handler import PacketHandlerAbstract
+from redcomet.base.messaging.packet import Packet
+from redcomet.messenger.inbox.asynchronous import AsyncioInbox
+from redcomet.messenger.inbox.exception import StopReceiveLoopException
+from redcomet.messenger.inbox.message import StopReceiveLoop
+from tests.test_messenger.mock import MockQueue, MockQueueManager
+from tests.test_node.mock import MockNode
+
+
+class Work(MessageAbstract):
+    def __init__(self, value: int, delay: float = 0.0):
+        self.value = value
+        self.delay = delay
+
+
+class Sleeper(AsyncActorAbstract):
+    def __init__(self, log: List[str]):
+        self._log = log
+
+    async def receive(self, message: MessageAbstract, sender: ActorRefAbstract, me: ActorRefAbstract,
+                      cluster: ClusterRefAbstract):
+        self._log.append(f"start {message.value}")
+        await asyncio.sleep(message.delay)
+        self._log.append(f"end {message.value}")
+
+
+class Recorder(ActorAbstract):
+    def __init__(self, log: List[str]):
+        self._log = log
+
+    def receive(self, message: MessageAbstract, sender: ActorRefAbstract, me: ActorRefAbstract,
+                cluster: ClusterRefAbstract):
+        self._log.append(f"sync {message.value}")
+
+
+class Failing(AsyncActorAbstract):
+    async def receive(self, message: MessageAbstract, sender: ActorRefAbstract, me: ActorRefAbstract,
+                      cluster: ClusterRefAbstract):
+        raise ValueError(message.value)
+
+
+class ForwardingMessenger:
+    def __init__(self):
+        self.forwarded: List[Packet] = []
+
+    def forward_packet(self, packet: Packet):
+        self.forwarded.append(packet)
+
+
+class ForwardingNode(MockNode):
+    def __init__(self):
+        self._messenger = ForwardingMessenger()
+
+    @property
+    def messenger(self) -> ForwardingMessenger:
+        return self._messenger
+
+
+class ExecutingPacketHandler(PacketHandlerAbstract):
+    def __init__(self, executor: AsyncioActorExecutor):
+        self._executor = executor
+
+    def handle(self, packet: Packet):
+        if isinstance(packet.content, StopReceiveLoop):
+            raise StopReceiveLoopException()
+        self._executor.execute(packet.content, packet.sender, packet.receiver.target)
+
+
+async def _execute_all(executor: AsyncioActorExecutor, messages: List[tuple]):
+    for message, actor_id in messages:
+        executor.execute(message, Address("node", "sender"), actor_id)
+    while asyncio.all_tasks() - {asyncio.current_task()}:
+        await asyncio.sleep(0.001)
+
+
+def test_should_receive_messages_of_different_actors_concurrently():
+    log = []
+    executor = AsyncioActorExecutor(MockNode())
+    for i in range(20):
+        executor.register(f"sleeper{i}", Sleeper(log))
+
+    start = time.monotonic()
+    asyncio.run(_execute_all(executor, [(Work(i, delay=0.05), f"sleeper{i}") for i in range(20)]))
+
+    assert time.monotonic() - start < 0.5
+    assert sorted(log) == sorted([f"start {i}" for i in range(20)] + [f"end {i}" for i in range(20)])
+
+
+def test_should_receive_messages_of_one_actor_one_at_a_time_in_order():
+    log = []
+    executor = AsyncioActorExecutor(MockNode())
+    executor.register("sleeper", Sleeper(log))
+
+    asyncio.run(_execute_all(executor, [(Work(0, delay=0.02), "sleeper"), (Work(1), "sleeper"),
+                                        (Work(2, delay=0.01), "sleeper")]))
+
+    assert log == ["start 0", "end 0", "start 1", "end 1", "start 2", "end 2"]
+
+
+def test_should_receive_synchronous_actor_inline():
+    log = []
+    executor = AsyncioActorExecutor(MockNode())
+    executor.register("recorder", Recorder(log))
+
+    async def execute():
+        executor.execute(Work(0), Address("node", "sender"), "recorder")
+        return list(log)
+
+    assert asyncio.run(execute()) == ["sync 0"]
+
+
+def test_should_finish_pending_receives_before_receive_loop_stops():
+    log = []
+    executor = AsyncioActorExecutor(MockNode())
+    executor.register("sleeper", Sleeper(log))
+    queue = MockQueue()
+    queue.put(Packet(Work(0, delay=0.02), Address("node", "sender"), Address("node", "sleeper")))
+    queue.put(Packet(StopReceiveLoop(), ..., ...))
+
+    AsyncioInbox(MockQueueManager(), queue, ExecutingPacketHandler(executor)).receive_loop()
+
+    assert log == ["start 0", "end 0"]
+
+
+def test_should_migrate_actor_only_after_its_pending_receives_finish():
+    log = []
+    node = ForwardingNode()
+    executor = AsyncioActorExecutor(node)
+    executor.register("sleeper", Sleeper(log))
+
+    async def migrate():
+        executor.execute(Work(0, delay=0.02), Address("node", "sender"), "sleeper")
+        executor.migrate("sleeper", "node1", lambda actor: log.append("hand off"))
+        executor.execute(Work(1), Address("node", "sender"), "sleeper")
+        while asyncio.all_tasks() - {asyncio.current_task()}:
+            await asyncio.sleep(0.001)
+
+    asyncio.run(migrate())
+
+    assert log == ["start 0", "end 0", "hand off"]
+    assert [packet.receiver for packet in node.messenger.forwarded] == [Address("node1", "sleeper")]
+
+
+def test_should_drop_lock_of_unregistered_actor():
+    log = []
+    executor = AsyncioActorExecutor(MockNode())
+    executor.register("sleeper", Sleeper(log))
+    asyncio.run(_execute_all(executor, [(Work(0), "sleeper")]))
+
+    executor.unregister("sleeper")
+
+    assert executor._locks == {}
+
+
+def test_should_propagate_actor_failure_on_next_execute():
+    log = []
+    executor = AsyncioActorExecutor(MockNode())
+    executor.register("failing", Failing())
+    executor.register("recorder", Recorder(log))
+
+    asyncio.run(_execute_all(executor, [(Work(0), "failing")]))
+
+    with pytest.raises(NotImplementedError) as info:
+        executor.execute(Work(1), Address("node", "sender"), "recorder")
+    assert isinstance(info.value.__cause__, ValueError)
+    assert log == []
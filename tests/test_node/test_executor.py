@@ -0,0 +1,92 @@
+from typing import List
+
+from redcomet.actor.executor import ActorExecutor
+from redcomet.actor.ref import ActorRef
+from redcomet.base.actor import ActorRefAbstract
+from redcomet.base.actor.abstract import ActorAbstract
+from redcomet.base.actor.message import MessageAbstract
+from redcomet.base.cluster.ref import ClusterRefAbstract
+from redcomet.base.messaging.address import Address
+from redcomet.cluster.ref import ClusterRef
+from tests.test_node.mock import MockNode
+
+
+class Hello(MessageAbstract):
+    pass
+
+
+class RefNode(MockNode):
+    def __init__(self):
+        self.issued_actor_refs = 0
+        self.issued_cluster_refs = 0
+
+    def issue_actor_ref(self, local_issuer_id: str, address: Address) -> ActorRefAbstract:
+        self.issued_actor_refs += 1
+        return ActorRef(..., local_issuer_id, address)
+
+    def issue_cluster_ref(self, local_issuer_id: str) -> ClusterRefAbstract:
+        self.issued_cluster_refs += 1
+        return ClusterRef(..., local_issuer_id, "main", "cluster")
+
+
+class RecordingActor(ActorAbstract):
+    def __init__(self):
+        self.received: List[tuple] = []
+
+    def receive(self, message: MessageAbstract, sender: ActorRefAbstract, me: ActorRefAbstract,
+                cluster: ClusterRefAbstract):
+        self.received.append((sender, me, cluster))
+
+
+def test_should_reuse_self_and_cluster_refs_across_deliveries():
+    node = RefNode()
+    actor = RecordingActor()
+    executor = ActorExecutor(node)
+    executor.register("actor", actor)
+
+    executor.execute(Hello(), Address("node0", "a"), "actor")
+    executor.execute(Hello(), Address("node0", "b"), "actor")
+
+    (_, me1, cluster1), (_, me2, cluster2) = actor.received
+    assert me1 is me2 and cluster1 is cluster2
+    assert me1.address == Address.on_local("actor")
+    assert node.issued_cluster_refs == 1
+
+
+def test_should_reuse_sender_ref_for_same_sender_address():
+    node = RefNode()
+    actor = RecordingActor()
+    executor = ActorExecutor(node)
+    executor.register("actor", actor)
+
+    executor.execute(Hello(), Address("node0", "a"), "actor")
+    executor.execute(Hello(), Address("node0", "a"), "actor")
+    executor.execute(Hello(), Address("node1", "a"), "actor")
+
+    senders = [sender for sender, _, _ in actor.received]
+    assert senders[0] is senders[1] and senders[2] is not senders[0]
+    assert senders[2].address == Address("node1", "a")
+
+
+def test_should_bound_sender_ref_cache():
+    node = RefNode()
+    actor = RecordingActor()
+    executor = ActorExecutor(node, sender_ref_cache_size=2)
+    executor.register("actor", actor)
+
+    for target in ["a", "b", "c", "a"]:
+        executor.execute(Hello(), Address("node0", target), "actor")
+
+    assert node.issued_actor_refs == 1 + 4
+
+
+def test_should_build_contexts_of_actors_registered_before_node_is_set():
+    node = RefNode()
+    actor = RecordingActor()
+    executor = ActorExecutor()
+    executor.register("actor", actor)
+    executor.set_node(node)
+
+    executor.execute(Hello(), Address("node0", "a"), "actor")
+
+    assert actor.received[0][1].address == Address.on_local("actor")
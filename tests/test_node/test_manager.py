@@ -0,0 +1,177 @@
+import pickle
+import time
+from typing import Any, Callable, List, Tuple
+
+from redcomet.base.actor import ActorRefAbstract
+from redcomet.base.actor.abstract import ActorAbstract
+from redcomet.base.actor.message import MessageAbstract
+from redcomet.base.cluster.ref import ClusterRefAbstract
+from redcomet.base.discovery.ref import ActorDiscoveryRefAbstract
+from redcomet.base.messaging.address import Address
+from redcomet.base.messaging.packet import Packet
+from redcomet.cluster.message.heartbeat.request import HeartbeatRequest
+from redcomet.cluster.message.heartbeat.response import HeartbeatResponse
+from redcomet.cluster.message.load_report.report import NodeLoadReport
+from redcomet.node.hand_over import HandOverActorRequest
+from redcomet.node.manager.actor import NodeManager
+from redcomet.node.passivate import PassivateIdleActorsRequest
+from redcomet.node.ref import NodeRef
+from tests.test_node.mock import MockNode
+
+
+class MockClusterRef(ClusterRefAbstract):
+    def __init__(self):
+        self.heartbeats: List[HeartbeatRequest] = []
+        self.reports: List[NodeLoadReport] = []
+
+    def spawn(self, actor: ActorAbstract) -> ActorRefAbstract:
+        pass
+
+    def get_active_nodes(self, timeout: float) -> List[NodeRef]:
+        pass
+
+    def report_load(self, report: NodeLoadReport):
+        self.reports.append(report)
+
+    def heartbeat(self, request: HeartbeatRequest):
+        self.heartbeats.append(request)
+
+
+class MockClusterNode(MockNode):
+    def __init__(self, cluster: MockClusterRef):
+        self._cluster = cluster
+
+    def issue_cluster_ref(self, local_issuer_id: str) -> ClusterRefAbstract:
+        return self._cluster
+
+
+class MockMessenger:
+    def __init__(self):
+        self.packets: List[Packet] = []
+
+    def send_packet(self, packet: Packet):
+        self.packets.append(packet)
+
+    def inbox_depth(self) -> int:
+        return 0
+
+    def blocked_send_time(self) -> float:
+        return 0.0
+
+
+class MockPassivatingNode(MockClusterNode):
+    def __init__(self, cluster: MockClusterRef):
+        super().__init__(cluster)
+        self._messenger = MockMessenger()
+        self.sweeps = 0
+
+    def passivate_idle_actors(self):
+        self.sweeps += 1
+
+    @property
+    def messenger(self) -> MockMessenger:
+        return self._messenger
+
+
+class MockDiscoveryRef(ActorDiscoveryRefAbstract):
+    def __init__(self):
+        self.registered: List[Tuple[str, str, bool]] = []
+
+    def register_address(self, target: str, node_id: str, replace: bool = False):
+        self.registered.append((target, node_id, replace))
+
+    def deregister_address(self, target: str):
+        pass
+
+    def query_address(self, target: str, requester_node_id: str, requester_target: str):
+        pass
+
+    def call_on_query_address_response(self, message: MessageAbstract, func: Callable[[str, Address], Any]) -> bool:
+        return False
+
+    def call_on_address_invalidated(self, message: MessageAbstract, func: Callable[[str], Any]) -> bool:
+        return False
+
+
+class Counter(ActorAbstract):
+    def __init__(self, count: int):
+        self.count = count
+
+    def receive(self, message: MessageAbstract, sender: ActorRefAbstract, me: ActorRefAbstract,
+                cluster: ClusterRefAbstract):
+        self.count += 1
+
+
+class MockRegisteringNode(MockPassivatingNode):
+    def __init__(self, cluster: MockClusterRef):
+        super().__init__(cluster)
+        self.actors = {}
+
+    def register_executable_actor(self, actor: ActorAbstract, actor_id: str):
+        self.actors[actor_id] = actor
+
+
+def test_should_send_heartbeats_periodically():
+    cluster = MockClusterRef()
+    manager = NodeManager("manager", MockClusterNode(cluster), heartbeat_interval=0.01)
+
+    manager.start()
+    time.sleep(0.1)
+    manager.stop()
+
+    assert len(cluster.heartbeats) >= 2 and all(heartbeat.node_id == "node" for heartbeat in cluster.heartbeats)
+
+
+def test_should_include_measured_round_trip_time_in_next_heartbeat():
+    cluster = MockClusterRef()
+    manager = NodeManager("manager", MockClusterNode(cluster), heartbeat_interval=0.01)
+    manager.receive(HeartbeatResponse(time.monotonic() - 0.5), ..., ..., ...)
+
+    manager.start()
+    time.sleep(0.05)
+    manager.stop()
+
+    assert manager.rtt >= 0.5 and cluster.heartbeats[0].rtt == manager.rtt
+
+
+def test_should_not_start_threads_without_intervals():
+    cluster = MockClusterRef()
+    manager = NodeManager("manager", MockClusterNode(cluster))
+
+    manager.start()
+    time.sleep(0.02)
+    manager.stop()
+
+    assert cluster.heartbeats == [] and cluster.reports == []
+
+
+def test_should_request_passivation_sweeps_from_itself_periodically():
+    node = MockPassivatingNode(MockClusterRef())
+    manager = NodeManager("manager", node, passivation_sweep_interval=0.01)
+
+    manager.start()
+    time.sleep(0.1)
+    manager.stop()
+
+    packets = node.messenger.packets
+    assert len(packets) >= 2 and all(isinstance(packet.content, PassivateIdleActorsRequest) and
+                                      packet.receiver.target == "manager" for packet in packets)
+
+
+def test_should_passivate_idle_actors_on_request():
+    node = MockPassivatingNode(MockClusterRef())
+    manager = NodeManager("manager", node)
+
+    manager.receive(PassivateIdleActorsRequest(), ..., ..., ...)
+
+    assert node.sweeps == 1
+
+
+def test_should_register_actor_restored_from_handed_over_state():
+    node = MockRegisteringNode(MockClusterRef())
+    discovery = MockDiscoveryRef()
+    manager = NodeManager("manager", node, discovery=discovery)
+
+    manager.receive(HandOverActorRequest("abc", pickle.dumps(Counter(3))), ..., ..., MockClusterRef())
+
+    assert node.actors["abc"].count == 3 and discovery.registered == [("abc", "node", True)]
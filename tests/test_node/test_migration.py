@@ -0,0 +1,157 @@
+import pickle
+import threading
+from typing import Callable, List, Optional, Tuple
+
+from redcomet.actor.executor import ActorExecutor
+from redcomet.base.actor import ActorRefAbstract
+from redcomet.base.actor.abstract import ActorAbstract
+from redcomet.base.actor.message import MessageAbstract
+from redcomet.base.cluster.ref import ClusterRefAbstract
+from redcomet.base.messaging.address import Address
+from redcomet.base.messaging.packet import Packet
+from redcomet.base.messenger.abstract import MessengerAbstract
+from redcomet.cluster.message.heartbeat.request import HeartbeatRequest
+from redcomet.cluster.message.load_report.report import NodeLoadReport
+from redcomet.cluster.message.migrate_actor.request import MigrateActorRequest
+from redcomet.node.manager.actor import NodeManager
+from redcomet.node.ref import NodeRef
+from tests.test_node.mock import MockNode
+
+
+class DummyMessage(MessageAbstract):
+    pass
+
+
+class RecordingActor(ActorAbstract):
+    def __init__(self):
+        self.received: List[MessageAbstract] = []
+
+    def receive(self, message: MessageAbstract, sender: ActorRefAbstract, me: ActorRefAbstract,
+                cluster: ClusterRefAbstract):
+        self.received.append(message)
+
+
+class LockedActor(RecordingActor):
+    def __init__(self):
+        super().__init__()
+        self.lock = threading.Lock()
+
+
+class MockMessenger(MessengerAbstract):
+    def __init__(self):
+        self.packets: List[Packet] = []
+
+    def send(self, message, sender_id, receiver_id, backpressure=None):
+        pass
+
+    def send_packet(self, packet: Packet):
+        self.packets.append(packet)
+
+    def forward_packet(self, packet: Packet):
+        self.packets.append(packet)
+
+    def assign_node_id(self, node_id: str):
+        pass
+
+    def bind_discovery(self, ref):
+        pass
+
+    def make_connection_to(self, other: MessengerAbstract):
+        pass
+
+    def create_direct_message_box(self):
+        pass
+
+    @property
+    def node_id(self) -> str:
+        return "node"
+
+
+class MockClusterRef(ClusterRefAbstract):
+    def spawn(self, actor: ActorAbstract) -> ActorRefAbstract:
+        pass
+
+    def get_active_nodes(self, timeout: float) -> List[NodeRef]:
+        pass
+
+    def report_load(self, report: NodeLoadReport):
+        pass
+
+    def heartbeat(self, request: HeartbeatRequest):
+        pass
+
+
+class MockMessengerNode(MockNode):
+    def __init__(self, executor: ActorExecutor = None):
+        self._messenger = MockMessenger()
+        self._executor = executor
+
+    def issue_node_ref(self, local_issuer_id: str, node_id: str) -> NodeRef:
+        return NodeRef(self._messenger, local_issuer_id, node_id)
+
+    def unregister_executable_actor(self, actor_id: str, forward_to: str = None) -> Optional[ActorAbstract]:
+        return self._executor.unregister(actor_id, forward_to)
+
+    def migrate_executable_actor(self, actor_id: str, node_id: str, hand_off: Callable[[ActorAbstract], None]):
+        self._executor.migrate(actor_id, node_id, hand_off)
+
+    @property
+    def messenger(self) -> MockMessenger:
+        return self._messenger
+
+
+def _create_executor() -> Tuple[ActorExecutor, MockMessengerNode]:
+    executor = ActorExecutor()
+    node = MockMessengerNode(executor)
+    executor.set_node(node)
+    return executor, node
+
+
+def test_should_forward_messages_of_migrated_actor():
+    executor, node = _create_executor()
+    executor.register("abc", RecordingActor())
+
+    executor.unregister("abc", forward_to="node1")
+    executor.execute(DummyMessage(), Address("node2", "sender"), "abc")
+
+    packet = node.messenger.packets[0]
+    assert packet.receiver == Address("node1", "abc") and packet.sender == Address("node2", "sender")
+
+
+def test_should_execute_again_when_actor_migrates_back():
+    executor, node = _create_executor()
+    actor = RecordingActor()
+    executor.register("abc", actor)
+    executor.unregister("abc", forward_to="node1")
+
+    executor.register("abc", actor)
+    executor.execute(DummyMessage(), Address("node2", "sender"), "abc")
+
+    assert len(actor.received) == 1 and node.messenger.packets == []
+
+
+def test_should_hand_actor_over_to_target_node_manager():
+    executor, node = _create_executor()
+    actor = RecordingActor()
+    executor.register("abc", actor)
+    manager = NodeManager("manager", node)
+
+    manager.receive(MigrateActorRequest("abc", "node1"), ..., ..., MockClusterRef())
+
+    request = node.messenger.packets[0].content
+    handed_over = pickle.loads(request.state)
+    assert request.actor_id == "abc" and isinstance(handed_over, RecordingActor) and handed_over is not actor
+    assert node.messenger.packets[0].receiver == Address("node1", "manager")
+
+
+def test_should_keep_actor_that_cannot_be_serialized_for_migration():
+    executor, node = _create_executor()
+    actor = LockedActor()
+    executor.register("abc", actor)
+    manager = NodeManager("manager", node)
+
+    manager.receive(MigrateActorRequest("abc", "node1"), ..., ..., MockClusterRef())
+    executor.execute(DummyMessage(), Address("node2", "sender"), "abc")
+
+    assert len(actor.received) == 1 and all(packet.receiver != Address("node1", "manager")
+                                             for packet in node.messenger.packets)
@@ -1,3 +1,4 @@
+import time
 from typing import Optional
 
 from redcomet.base.actor import ActorRefAbstract
@@ -8,6 +9,7 @@ from redcomet.base.discovery.ref import ActorDiscoveryRefAbstract
 from redcomet.base.messaging.address import Address
 from redcomet.base.messaging.packet import Packet
 from redcomet.base.messenger.abstract import MessengerAbstract
+from redcomet.base.messenger.backpressure import Backpressure
 from redcomet.base.messenger.direct_message.ref import DirectMessageBoxRefAbstract
 from redcomet.base.node.abstract import NodeAbstract
 from redcomet.discovery.ref import ActorDiscoveryRef
@@ -25,7 +27,8 @@ class MockMessenger(MessengerAbstract):
     def bind_discovery(self, ref: ActorDiscoveryRefAbstract):
         self.bound_discovery = ref
 
-    def send(self, message: MessageAbstract, sender_id: str, receiver_id: str):
+    def send(self, message: MessageAbstract, sender_id: str, receiver_id: str,
+             backpressure: Backpressure = Backpressure.BLOCK):
         pass
 
     def send_packet(self, packet: Packet):
@@ -45,6 +48,11 @@ class MockMessenger(MessengerAbstract):
         pass
 
 
+class HangingMessenger(MockMessenger):
+    def start_receive_loop(self):
+        time.sleep(60)
+
+
 class MockManager(NodeManagerAbstract):
     def __init__(self):
         self.bound_discovery = None
@@ -131,3 +139,21 @@ def test_should_register_actor_to_executor():
     node = _create_node(MockMessenger(), executor)
     node.register_executable_actor(actor, "my_actor")
     assert executor.registered_actor is actor and executor.registered_actor_id == "my_actor"
+
+
+def test_should_join_process_on_close():
+    node = _create_node(MockMessenger(), MockExecutor())
+    node.assign_manager(MockManager())
+    assert not node.is_alive()
+    node.start()
+    node.close()
+    assert not node.is_alive()
+
+
+def test_should_terminate_process_not_stopping_within_join_timeout():
+    node = ProcessNode(HangingMessenger(), MockExecutor(), join_timeout=0.1)
+    node.assign_manager(MockManager())
+    node.start()
+    started = time.monotonic()
+    node.close()
+    assert not node.is_alive() and time.monotonic() - started < 5
@@ -0,0 +1,101 @@
+import threading
+import time
+from typing import List
+
+import pytest
+
+from redcomet.actor.executor import ActorExecutor
+from redcomet.actor.passivation import PassivationPolicy
+from redcomet.base.actor import ActorRefAbstract
+from redcomet.base.actor.abstract import ActorAbstract
+from redcomet.base.actor.message import MessageAbstract
+from redcomet.base.cluster.ref import ClusterRefAbstract
+from redcomet.base.messaging.address import Address
+from tests.test_node.mock import MockNode
+
+
+class DummyMessage(MessageAbstract):
+    pass
+
+
+class Session(ActorAbstract):
+    def __init__(self):
+        self.received: List[MessageAbstract] = []
+
+    def receive(self, message: MessageAbstract, sender: ActorRefAbstract, me: ActorRefAbstract,
+                cluster: ClusterRefAbstract):
+        self.received.append(message)
+
+
+class LockedSession(Session):
+    def __init__(self):
+        super().__init__()
+        self.lock = threading.Lock()
+
+
+def _create_executor(passivation: PassivationPolicy) -> ActorExecutor:
+    executor = ActorExecutor(passivation=passivation)
+    executor.set_node(MockNode())
+    return executor
+
+
+def test_should_passivate_least_recently_used_actor_over_limit():
+    executor = _create_executor(PassivationPolicy(max_resident_actors=2))
+    for actor_id in ["a", "b"]:
+        executor.register(actor_id, Session())
+    executor.execute(DummyMessage(), Address("node", "me"), "a")
+
+    executor.register("c", Session())
+
+    assert executor.n_resident_actors == 2 and executor.n_passivated_actors == 1
+    assert executor.passivation_statistics.passivations == 1
+
+
+def test_should_reactivate_passivated_actor_with_its_state():
+    executor = _create_executor(PassivationPolicy(max_resident_actors=1))
+    executor.register("a", Session())
+    executor.execute(DummyMessage(), Address("node", "me"), "a")
+    executor.register("b", Session())
+
+    executor.execute(DummyMessage(), Address("node", "me"), "a")
+
+    assert len(executor.unregister("a").received) == 2
+    assert executor.passivation_statistics.reactivations == 1
+
+
+def test_should_passivate_idle_actors():
+    executor = _create_executor(PassivationPolicy(idle_timeout=0.01))
+    executor.register("a", Session())
+    executor.register("b", Session())
+    time.sleep(0.02)
+    executor.execute(DummyMessage(), Address("node", "me"), "b")
+
+    executor.passivate_idle_actors()
+
+    assert executor.n_resident_actors == 1 and executor.n_passivated_actors == 1
+
+
+def test_should_keep_actor_resident_when_it_cannot_be_serialized():
+    executor = _create_executor(PassivationPolicy(max_resident_actors=1))
+    executor.register("a", LockedSession())
+    executor.register("b", Session())
+    executor.register("c", Session())
+
+    executor.execute(DummyMessage(), Address("node", "me"), "a")
+
+    assert executor.n_resident_actors == 2 and executor.n_passivated_actors == 1
+    assert executor.passivation_statistics.passivations == 1
+
+
+def test_should_never_passivate_system_actors():
+    executor = _create_executor(PassivationPolicy(max_resident_actors=1))
+
+    for actor_id in ["messenger", "manager", "a"]:
+        executor.register(actor_id, Session())
+
+    assert executor.n_resident_actors == 3 and executor.n_passivated_actors == 0
+
+
+def test_should_require_idle_timeout_or_resident_limit():
+    with pytest.raises(ValueError):
+        PassivationPolicy()
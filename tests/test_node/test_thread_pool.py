@@ -0,0 +1,117 @@
+import threading
+import time
+from typing import List
+
+import pytest
+
+from redcomet.actor.thread_pool import ThreadPoolActorExecutor
+from redcomet.base.actor import ActorRefAbstract
+from redcomet.base.actor.abstract import ActorAbstract
+from redcomet.base.actor.message import MessageAbstract
+from redcomet.base.cluster.ref import ClusterRefAbstract
+from redcomet.base.messaging.address import Address
+from tests.test_node.mock import MockNode
+
+
+class Work(MessageAbstract):
+    def __init__(self, value: int, delay: float = 0.0):
+        self.value = value
+        self.delay = delay
+
+
+class Worker(ActorAbstract):
+    def __init__(self):
+        self.values: List[int] = []
+        self.threads = set()
+        self.running = 0
+        self.max_running = 0
+        self._lock = threading.Lock()
+
+    def receive(self, message: MessageAbstract, sender: ActorRefAbstract, me: ActorRefAbstract,
+                cluster: ClusterRefAbstract):
+        with self._lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(message.delay)
+        self.values.append(message.value)
+        self.threads.add(threading.get_ident())
+        with self._lock:
+            self.running -= 1
+
+
+class Failing(ActorAbstract):
+    def receive(self, message: MessageAbstract, sender: ActorRefAbstract, me: ActorRefAbstract,
+                cluster: ClusterRefAbstract):
+        raise ValueError(message.value)
+
+
+def _execute(executor: ThreadPoolActorExecutor, message: MessageAbstract, actor_id: str):
+    executor.execute(message, Address("node", "sender"), actor_id)
+
+
+def test_should_process_messages_of_one_actor_one_at_a_time_in_order():
+    worker = Worker()
+    executor = ThreadPoolActorExecutor(MockNode(), max_workers=4, throughput=3)
+    executor.register("worker", worker)
+
+    for i in range(50):
+        _execute(executor, Work(i, delay=0.0005), "worker")
+    executor.shutdown()
+
+    assert worker.values == list(range(50))
+    assert worker.max_running == 1
+
+
+def test_should_process_different_actors_in_parallel():
+    workers = [Worker() for _ in range(4)]
+    executor = ThreadPoolActorExecutor(MockNode(), max_workers=4)
+    for i, worker in enumerate(workers):
+        executor.register(f"worker{i}", worker)
+
+    start = time.monotonic()
+    for i in range(4):
+        _execute(executor, Work(i, delay=0.1), f"worker{i}")
+    executor.shutdown()
+
+    assert time.monotonic() - start < 0.3
+    assert [worker.values for worker in workers] == [[0], [1], [2], [3]]
+
+
+def test_should_process_inline_actors_on_calling_thread():
+    worker = Worker()
+    executor = ThreadPoolActorExecutor(MockNode(), inline_actor_ids=["messenger"])
+    executor.register("messenger", worker)
+
+    _execute(executor, Work(0), "messenger")
+
+    assert worker.values == [0] and worker.threads == {threading.get_ident()}
+
+
+def test_should_wait_for_scheduled_messages_before_unregistering():
+    worker = Worker()
+    executor = ThreadPoolActorExecutor(MockNode(), max_workers=2, throughput=2)
+    executor.register("worker", worker)
+
+    for i in range(5):
+        _execute(executor, Work(i, delay=0.01), "worker")
+
+    assert executor.unregister("worker") is worker
+    assert worker.values == list(range(5))
+    executor.shutdown()
+
+
+def test_should_propagate_actor_failure_on_next_execute():
+    worker = Worker()
+    executor = ThreadPoolActorExecutor(MockNode(), max_workers=2)
+    executor.register("failing", Failing())
+    executor.register("worker", worker)
+
+    _execute(executor, Work(0), "failing")
+    executor.unregister("failing")
+
+    with pytest.raises(NotImplementedError) as info:
+        _execute(executor, Work(1), "worker")
+    assert isinstance(info.value.__cause__, ValueError)
+    _execute(executor, Work(2), "worker")
+    executor.shutdown()
+    assert worker.values == [2]
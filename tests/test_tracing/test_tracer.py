@@ -0,0 +1,93 @@
+import io
+
+from redcomet.tracing import Tracer, TracingConfig, TraceLevel
+
+
+class ExplodingRepr:
+    def __repr__(self) -> str:
+        raise AssertionError("should not be formatted")
+
+
+class CountingRepr:
+    def __init__(self):
+        self.count = 0
+
+    def __repr__(self) -> str:
+        self.count += 1
+        return "counted"
+
+
+def test_should_not_record_when_disabled():
+    sink = io.StringIO()
+    tracer = Tracer(TracingConfig(sink=sink))
+    channel = tracer.channel("packet")
+
+    channel.debug("SEND %r", ExplodingRepr())
+    tracer.flush()
+
+    assert not channel.debug_enabled and sink.getvalue() == ""
+
+
+def test_should_write_warnings_by_default():
+    sink = io.StringIO()
+    tracer = Tracer(TracingConfig(sink=sink))
+    channel = tracer.channel("actor")
+
+    channel.info("started")
+    channel.warning("actor %r failed", "abc")
+    tracer.flush()
+
+    assert not channel.info_enabled and sink.getvalue().endswith("WARNING [actor] actor 'abc' failed\n")
+
+
+def test_should_write_enabled_records_on_flush():
+    sink = io.StringIO()
+    tracer = Tracer(TracingConfig(level=TraceLevel.DEBUG, sink=sink))
+
+    tracer.channel("packet").debug("SEND %r", "hello")
+    tracer.flush()
+
+    assert "DEBUG [packet] SEND 'hello'" in sink.getvalue()
+
+
+def test_should_format_lazily_on_flush():
+    value = CountingRepr()
+    tracer = Tracer(TracingConfig(level=TraceLevel.DEBUG, sink=io.StringIO()))
+
+    tracer.channel("packet").debug("SEND %r", value)
+    assert value.count == 0
+
+    tracer.flush()
+    assert value.count == 1
+
+
+def test_should_apply_level_per_category():
+    sink = io.StringIO()
+    tracer = Tracer(TracingConfig(level=TraceLevel.WARNING, categories={"discovery": TraceLevel.DEBUG}, sink=sink))
+
+    tracer.channel("packet").info("packet info")
+    tracer.channel("discovery").debug("discovery debug")
+    tracer.flush()
+
+    assert "packet info" not in sink.getvalue() and "discovery debug" in sink.getvalue()
+
+
+def test_should_update_existing_channels_when_configured():
+    tracer = Tracer()
+    channel = tracer.channel("actor")
+
+    tracer.configure(TracingConfig(level=TraceLevel.INFO))
+
+    assert channel.info_enabled and not channel.debug_enabled
+
+
+def test_should_keep_only_latest_records_in_ring_buffer():
+    sink = io.StringIO()
+    tracer = Tracer(TracingConfig(level=TraceLevel.DEBUG, buffer_size=2, sink=sink))
+    channel = tracer.channel("packet")
+
+    for i in range(5):
+        channel.debug("record %d", i)
+    tracer.flush()
+
+    assert sink.getvalue().count("record") == 2 and "record 4" in sink.getvalue()